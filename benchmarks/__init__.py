@@ -0,0 +1 @@
+"""Performance benchmarks for expense tracker."""
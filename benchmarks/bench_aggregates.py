@@ -0,0 +1,73 @@
+"""Compare Python-side aggregation with the ExpenseManager summary methods.
+
+The manager reads SQL aggregates (from the monthly_rollups table since
+schema version 6).
+
+Run from the project root:
+    python -m benchmarks.bench_aggregates [rows]
+"""
+
+import sys
+
+from benchmarks.common import seed_database, temp_db_path, timed
+from src.expense_manager import ExpenseManager
+
+
+def python_totals(em):
+    """Old path: materialize Transactions and sum in Python."""
+    income = sum(t.amount for t in em.get_income())
+    expenses = sum(t.amount for t in em.get_expenses())
+    return income, expenses
+
+
+def python_category_summary(em):
+    """Old path: category summary from Transaction objects."""
+    summary = {}
+    for expense in em.get_expenses():
+        summary[expense.category] = summary.get(expense.category, 0) + expense.amount
+    return dict(sorted(summary.items(), key=lambda x: x[1], reverse=True))
+
+
+def python_monthly_summary(em):
+    """Old path: monthly summary from Transaction objects."""
+    summary = {}
+    for transaction in em.get_all_transactions():
+        month = transaction.date[:7]
+        if month not in summary:
+            summary[month] = {"income": 0, "expense": 0}
+        if transaction.transaction_type == "income":
+            summary[month]["income"] += transaction.amount
+        else:
+            summary[month]["expense"] += transaction.amount
+    return dict(sorted(summary.items()))
+
+
+def sql_totals(em):
+    """New path: totals read from SQLite aggregates."""
+    return em.calculate_total_income(), em.calculate_total_expenses()
+
+
+def main(rows=200_000):
+    """Run the benchmark and print a comparison table."""
+    with temp_db_path() as path:
+        em = ExpenseManager(path, cache_size=0)  # time the queries, not cache hits
+        seed_database(em.db, rows)
+
+        cases = [
+            ("totals", python_totals, sql_totals),
+            ("category summary", python_category_summary, ExpenseManager.get_expenses_by_category_summary),
+            ("monthly summary", python_monthly_summary, ExpenseManager.get_monthly_summary),
+        ]
+
+        print(f"{rows:,} rows")
+        print(f"{'case':<20}{'python (s)':>12}{'manager (s)':>12}{'speedup':>10}")
+        for name, old, new in cases:
+            old_time, _ = timed(old, em)
+            new_time, _ = timed(new, em)
+            print(f"{name:<20}{old_time:>12.4f}{new_time:>12.4f}{old_time / new_time:>9.1f}x")
+
+        em.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
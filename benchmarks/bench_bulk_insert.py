@@ -0,0 +1,47 @@
+"""Compare per-row add_expense inserts with ExpenseManager.add_many.
+
+Run from the project root:
+    python -m benchmarks.bench_bulk_insert [rows]
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from benchmarks.common import synthetic_rows, temp_db_path
+from src.expense_manager import ExpenseManager
+
+PER_ROW_SAMPLE = 2000
+
+
+def per_row(em, rows):
+    """Old path: one add_transaction (and one commit) per row."""
+    for trans_type, amount, category, description, day in rows:
+        em.db.add_transaction(trans_type, amount, category, description, day)
+
+
+def main(rows=200_000):
+    """Run the benchmark and print rows/sec for both paths."""
+    data = list(synthetic_rows(rows))
+
+    with temp_db_path() as path, contextlib.redirect_stdout(io.StringIO()):
+        em = ExpenseManager(path)
+        start = time.perf_counter()
+        per_row(em, data[:PER_ROW_SAMPLE])
+        per_row_rate = PER_ROW_SAMPLE / (time.perf_counter() - start)
+        em.close()
+
+    with temp_db_path() as path, contextlib.redirect_stdout(io.StringIO()):
+        em = ExpenseManager(path)
+        start = time.perf_counter()
+        added, failures = em.add_many(data)
+        bulk_rate = added / (time.perf_counter() - start)
+        em.close()
+
+    print(f"per-row add_transaction: {per_row_rate:>12,.0f} rows/s ({PER_ROW_SAMPLE:,} rows)")
+    print(f"add_many:                {bulk_rate:>12,.0f} rows/s ({added:,} rows, {len(failures)} failures)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,66 @@
+"""Compare sequential and parallel chart generation.
+
+Needs matplotlib. Run from the project root:
+    python -m benchmarks.bench_charts [rows] [ledgers]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from benchmarks.common import seed_database, temp_db_path
+from src.expense_manager import ExpenseManager
+from src.visualizer import HAS_MATPLOTLIB, Visualizer
+
+
+def generate(viz, workers=None, executor=None):
+    """Return (seconds, per-chart timings) for one generate_all_charts call."""
+    with tempfile.TemporaryDirectory() as out, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        timings = viz.generate_all_charts(out, workers=workers, executor=executor)
+        return time.perf_counter() - start, timings
+
+
+def main(rows=20_000, ledgers=5):
+    """Run the benchmark and print wall time per mode and per-chart render times."""
+    if not HAS_MATPLOTLIB:
+        print("matplotlib is not installed; nothing to benchmark")
+        return
+
+    with temp_db_path() as path:
+        with contextlib.redirect_stdout(io.StringIO()):
+            em = ExpenseManager(path, profile="fast")
+            seed_database(em.db, rows)
+            for category in em.EXPENSE_CATEGORIES:
+                em.set_budget(category, 10_000)
+            viz = Visualizer(em, cache_dir=None)  # time rendering, not cache copies
+
+        sequential, timings = generate(viz, workers=1)
+        print(f"{rows:,} rows")
+        for name, seconds in timings.items():
+            print(f"  {name:<22}{seconds:>8.2f}s")
+        print(f"{'sequential':<24}{sequential:>8.2f}s")
+
+        fresh_pool, _ = generate(viz)
+        print(f"{'new process pool':<24}{fresh_pool:>8.2f}s")
+
+        workers = min(4, os.cpu_count() or 1)
+        with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+            generate(viz, executor=pool)  # warm up the workers' imports
+            start = time.perf_counter()
+            for _ in range(ledgers):
+                generate(viz, executor=pool)
+            shared = (time.perf_counter() - start) / ledgers
+        print(f"{'shared pool, per ledger':<24}{shared:>8.2f}s")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            em.close()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,78 @@
+"""Compare the old materializing CSV export with the streaming one.
+
+Run from the project root:
+    python -m benchmarks.bench_export [rows]
+"""
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import seed_database, temp_db_path
+from src.expense_manager import ExpenseManager
+from src.report_generator import ReportGenerator
+
+
+def dict_writer_export(em, filename):
+    """Old path: load every Transaction, then one dict per row into DictWriter."""
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["ID", "Date", "Type", "Category", "Amount", "Description"])
+        writer.writeheader()
+        for t in em.get_all_transactions():
+            writer.writerow({
+                "ID": t.transaction_id,
+                "Date": t.date,
+                "Type": t.transaction_type,
+                "Category": t.category,
+                "Amount": f"{t.amount:.2f}",
+                "Description": t.description,
+            })
+
+
+def measure(export, filename):
+    """Return (seconds, peak traced bytes) for one export."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        export(filename)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        export(filename)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main(rows=1_000_000):
+    """Run the benchmark and print rows/sec and peak memory per export path."""
+    with temp_db_path() as path:
+        with contextlib.redirect_stdout(io.StringIO()):
+            em = ExpenseManager(path, profile="fast", cache_size=0)
+        seed_database(em.db, rows)
+        rg = ReportGenerator(em)
+        out = os.path.dirname(path)
+
+        cases = [
+            ("DictWriter, all rows", lambda f: dict_writer_export(em, f), "old.csv"),
+            ("streaming", rg.export_to_csv, "new.csv"),
+            ("streaming, gzip", rg.export_to_csv, "new.csv.gz"),
+        ]
+        print(f"{rows:,} rows")
+        print(f"{'export':<24}{'rows/s':>12}{'peak MB':>10}{'file MB':>10}")
+        for label, export, name in cases:
+            filename = os.path.join(out, name)
+            seconds, peak = measure(export, filename)
+            size = os.path.getsize(filename)
+            print(f"{label:<24}{rows / seconds:>12,.0f}{peak / 1e6:>10.1f}{size / 1e6:>10.1f}")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            em.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,56 @@
+"""Time CSV imports into an empty database and re-imports of the same file.
+
+Run from the project root:
+    python -m benchmarks.bench_import [rows]
+"""
+
+import contextlib
+import csv
+import io
+import os
+import sys
+import time
+
+from benchmarks.common import synthetic_rows, temp_db_path
+from src.expense_manager import ExpenseManager
+
+
+def write_csv(path, rows):
+    """Write rows in a bank-statement layout: dd/mm/yyyy dates, signed amounts."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Transaction Date", "Details", "Category", "Amount"])
+        for trans_type, amount, category, description, day in rows:
+            year, month, dom = day.split("-")
+            signed = amount if trans_type == "income" else -amount
+            writer.writerow([f"{dom}/{month}/{year}", description, category, f"{signed:,.2f}"])
+
+
+def main(rows=500_000):
+    """Run the benchmark and print rows/sec for the first import and a re-import."""
+    with temp_db_path() as path:
+        csv_path = os.path.join(os.path.dirname(path), "statement.csv")
+        write_csv(csv_path, synthetic_rows(rows))
+        size_mb = os.path.getsize(csv_path) / 1e6
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            em = ExpenseManager(path, profile="fast")
+        print(f"{rows:,} rows, {size_mb:.1f} MB")
+
+        for label in ("first import", "re-import"):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                summary = em.import_csv(csv_path)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<14}{rows / elapsed:>12,.0f} rows/s  "
+                f"({summary['imported']:,} imported, {summary['duplicates']:,} duplicates, "
+                f"{summary['invalid']:,} invalid, {elapsed:.2f} s)"
+            )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            em.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,78 @@
+"""Show query plans and latency of get_transactions_* before and after indexing.
+
+The database is seeded with its secondary indexes dropped, measured, and then
+measured again after the indexes are recreated from their original DDL.
+
+Run from the project root:
+    python -m benchmarks.bench_indexes [rows]
+"""
+
+import sys
+
+from benchmarks.common import seed_database, temp_db_path, timed
+from src.database import Database
+
+CASES = [
+    ("get_all_transactions", ()),
+    ("get_transactions_by_type", ("expense",)),
+    ("get_transactions_by_date_range", ("2020-01-01", "2020-03-31")),
+    ("get_transactions_by_category", ("Food",)),
+]
+
+
+def capture_plans(db):
+    """Record the SQL each get_transactions_* method runs and its query plan."""
+    plans = {}
+    statements = []
+    db.connection.set_trace_callback(statements.append)
+    for name, args in CASES:
+        statements.clear()
+        getattr(db, name)(*args)
+        sql = statements[-1]
+        rows = db.connection.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        plans[name] = "; ".join(row[-1] for row in rows)
+    db.connection.set_trace_callback(None)
+    return plans
+
+
+def measure(db):
+    """Return {method: (seconds, plan)} for every case."""
+    plans = capture_plans(db)
+    return {
+        name: (timed(getattr(db, name), *args)[0], plans[name])
+        for name, args in CASES
+    }
+
+
+def main(rows=200_000):
+    """Run the benchmark and print plans and timings."""
+    with temp_db_path() as path:
+        db = Database(path)
+        db.cursor.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'index' AND tbl_name = 'transactions' AND sql IS NOT NULL
+        """)
+        indexes = db.cursor.fetchall()
+        for name, _ in indexes:
+            db.cursor.execute(f"DROP INDEX {name}")
+        seed_database(db, rows)
+
+        before = measure(db)
+        for _, sql in indexes:
+            db.cursor.execute(sql)
+        db.connection.commit()
+        after = measure(db)
+
+        print(f"{rows:,} rows, indexes: {', '.join(name for name, _ in indexes)}")
+        for name, _ in CASES:
+            old_time, old_plan = before[name]
+            new_time, new_plan = after[name]
+            print(f"\n{name}: {old_time:.4f}s -> {new_time:.4f}s ({old_time / new_time:.1f}x)")
+            print(f"  before: {old_plan}")
+            print(f"  after:  {new_plan}")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,50 @@
+"""Compare memory used by Transaction lists, TransactionRecord lists and TransactionBatch.
+
+Run from the project root:
+    python -m benchmarks.bench_memory [rows]
+"""
+
+import sys
+import tracemalloc
+
+from benchmarks.common import seed_database, temp_db_path
+from src.expense_manager import ExpenseManager
+from src.transaction import Transaction, TransactionBatch, TransactionRecord
+
+
+def measure(build, rows):
+    """Return bytes still allocated after build(rows).
+
+    Strings already held by the fetched rows are shared, not counted.
+    """
+    tracemalloc.start()
+    result = build(rows)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main(rows=500_000):
+    """Run the benchmark and print retained memory per representation."""
+    with temp_db_path() as path:
+        em = ExpenseManager(path)
+        seed_database(em.db, rows)
+        data = em.db.get_all_transactions()
+        em.close()
+
+    cases = [
+        ("list[Transaction]", lambda r: [Transaction.from_tuple(t) for t in r]),
+        ("list[TransactionRecord]", lambda r: [TransactionRecord.from_tuple(t) for t in r]),
+        ("TransactionBatch", TransactionBatch.from_rows),
+    ]
+
+    print(f"{rows:,} rows")
+    print(f"{'representation':<26}{'retained MB':>12}{'bytes/row':>11}")
+    for name, build in cases:
+        retained = measure(build, data)
+        print(f"{name:<26}{retained / 1e6:>12.1f}{retained / rows:>11.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,38 @@
+"""Compare LIMIT/OFFSET and keyset paging deep into the transaction list.
+
+Run from the project root:
+    python -m benchmarks.bench_paging [rows]
+"""
+
+import sys
+
+from benchmarks.common import seed_database, temp_db_path, timed
+from src.database import Database, TransactionQuery
+
+PAGE_SIZE = 200
+
+
+def main(rows=1_000_000):
+    """Run the benchmark and print per-depth timings."""
+    with temp_db_path() as path:
+        db = Database(path, profile="fast")
+        seed_database(db, rows)
+        query = TransactionQuery().of_type("expense")
+
+        print(f"{rows:,} rows, {PAGE_SIZE}-row pages of expenses, newest first")
+        print(f"{'depth':>10}{'OFFSET (s)':>14}{'keyset (s)':>14}")
+        for depth in (0, rows // 100, rows // 10, rows // 2):
+            offset_time, offset_rows = timed(db.find_transactions, query.page(PAGE_SIZE, depth))
+            if depth:
+                _, previous = timed(db.find_transactions, query.page(1, depth - 1), repeat=1)
+                key = (previous[0][1], previous[0][0])
+            else:
+                key = None
+            keyset_time, keyset_rows = timed(db.find_transactions, query.after(key).page(PAGE_SIZE))
+            assert keyset_rows == offset_rows
+            print(f"{depth:>10,}{offset_time:>14.4f}{keyset_time:>14.4f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,58 @@
+"""Compare description search: Python scan, LIKE fallback and FTS5.
+
+Run from the project root:
+    python -m benchmarks.bench_search [rows]
+"""
+
+import random
+import sys
+
+from benchmarks.common import DESCRIPTIONS, synthetic_rows, temp_db_path, timed
+from src.expense_manager import ExpenseManager
+
+MERCHANTS = [
+    "Jollibee", "Mercury Drug", "SM Supermarket", "Shell", "Petron", "Meralco",
+    "Maynilad", "Grab", "Angkas", "National Book Store", "Uniqlo", "Starbucks",
+]
+QUERIES = ["groc", "mercury drug", "receipt 4242", "starbucks coffee"]
+
+
+def varied_rows(count, seed=7):
+    """Synthetic rows with a merchant and receipt number in each description."""
+    rng = random.Random(seed)
+    for trans_type, amount, category, _, day in synthetic_rows(count, seed):
+        description = f"{rng.choice(DESCRIPTIONS)} at {rng.choice(MERCHANTS)} receipt {rng.randrange(10000)}"
+        yield trans_type, amount, category, description, day
+
+
+def python_scan(em, query):
+    """Old path: load every transaction and filter in Python."""
+    return [t for t in em.get_all_transactions() if query.lower() in t.description.lower()]
+
+
+def main(rows=1_000_000):
+    """Run the benchmark and print per-query timings."""
+    with temp_db_path() as path:
+        em = ExpenseManager(path, profile="fast", cache_size=0)  # time the queries, not cache hits
+        em.db.add_transactions_bulk(varied_rows(rows))
+
+        fts_times = {q: timed(em.search_descriptions, q, 50) for q in QUERIES}
+
+        for trigger in ("insert", "delete", "update"):
+            em.db.cursor.execute(f"DROP TRIGGER transactions_fts_{trigger}")
+        em.db.cursor.execute("DROP TABLE transactions_fts")
+        like_times = {q: timed(em.search_descriptions, q, 50) for q in QUERIES}
+        scan_times = {q: timed(python_scan, em, q, repeat=1) for q in QUERIES}
+
+        print(f"{rows:,} rows, first 50 results")
+        print(f"{'query':<20}{'python (s)':>12}{'LIKE (s)':>12}{'FTS5 (s)':>12}{'FTS hits':>10}")
+        for q in QUERIES:
+            print(
+                f"{q:<20}{scan_times[q][0]:>12.4f}{like_times[q][0]:>12.4f}"
+                f"{fts_times[q][0]:>12.4f}{len(fts_times[q][1]):>10}"
+            )
+        em.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,75 @@
+"""Measure startup cost of the CLI and GUI entry points.
+
+Imports each entry point in a fresh interpreter under ``python -X importtime``
+and reports the slowest imports, then times opening an existing database.
+
+Run from the project root:
+    python -m benchmarks.bench_startup
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.common import temp_db_path, timed
+from src.expense_manager import ExpenseManager
+
+ROOT = Path(__file__).resolve().parent.parent
+ENTRY_POINTS = {"run.py": "run", "launch_gui.py": "launch_gui"}
+STARTUP_BUDGET_MS = 200
+HEAVY_MODULES = ("matplotlib", "numpy", "pandas", "reportlab", "tabulate")
+
+
+def import_profile(module):
+    """Import module in a fresh interpreter with -X importtime.
+
+    Returns ``{module name: cumulative import time in microseconds}``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def heavy_imports(profile):
+    """Optional heavy packages that were imported."""
+    return sorted({name.split(".")[0] for name in profile} & set(HEAVY_MODULES))
+
+
+def main():
+    """Run the benchmark and print startup timings."""
+    for script, module in ENTRY_POINTS.items():
+        try:
+            profile = import_profile(module)
+        except RuntimeError as e:
+            print(f"{script}: import failed ({e})")
+            continue
+        total_ms = profile[module] / 1000
+        status = "ok" if total_ms <= STARTUP_BUDGET_MS else "OVER BUDGET"
+        print(f"{script}: {total_ms:.1f} ms ({status}, budget {STARTUP_BUDGET_MS} ms)")
+        print(f"  heavy modules imported: {', '.join(heavy_imports(profile)) or 'none'}")
+        for name, micros in sorted(profile.items(), key=lambda x: x[1], reverse=True)[1:6]:
+            print(f"  {name:<30}{micros / 1000:>8.1f} ms")
+
+    with temp_db_path() as path:
+        first, em = timed(ExpenseManager, path, repeat=1)
+        em.close()
+        reopen, em = timed(ExpenseManager, path)
+        em.close()
+    print(f"database open: new {first * 1000:.1f} ms, existing {reopen * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
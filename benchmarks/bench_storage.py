@@ -0,0 +1,58 @@
+"""Compare the storage backends on loading, searching and summarizing.
+
+Run from the project root:
+    python -m benchmarks.bench_storage [rows]
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from benchmarks.common import synthetic_rows, temp_db_path, timed
+from src.database import TransactionQuery
+from src.storage import open_storage
+
+QUERIES = {
+    "filtered page": TransactionQuery().of_type("expense").in_categories("Food").page(50),
+    "amount range": TransactionQuery().between_amounts(100, 120).sorted_by("amount").page(50),
+    "text search": TransactionQuery(text="groc", order="rank", limit=50),
+}
+
+
+def measure(url, rows):
+    """Return {step: seconds} for one backend."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        storage = open_storage(url, profile="fast")
+    results = {}
+    start = time.perf_counter()
+    storage.add_transactions_bulk(rows)
+    results["bulk load"] = time.perf_counter() - start
+    for name, query in QUERIES.items():
+        results[name], _ = timed(storage.find_transactions, query)
+    results["count"], _ = timed(storage.count_transactions, TransactionQuery().of_type("expense"))
+    results["snapshot"], _ = timed(storage.get_snapshot_rows)
+    with contextlib.redirect_stdout(io.StringIO()):
+        storage.close()
+    return results
+
+
+def main(rows=200_000):
+    """Run the benchmark and print seconds per step and backend."""
+    data = list(synthetic_rows(rows))
+    with temp_db_path() as sqlite_path, temp_db_path("bench.log") as log_path:
+        backends = {
+            "sqlite": f"sqlite:///{sqlite_path}",
+            "memory": "memory://",
+            "log": f"log:///{log_path}",
+        }
+        results = {name: measure(url, data) for name, url in backends.items()}
+
+    print(f"{rows:,} rows")
+    print(f"{'':<14}" + "".join(f"{name:>10}" for name in backends))
+    for step in results["sqlite"]:
+        print(f"{step:<14}" + "".join(f"{results[name][step]:>9.4f}s" for name in backends))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,48 @@
+"""Compare preparing the spending-trend series per transaction and per day.
+
+Run from the project root:
+    python -m benchmarks.bench_trend [rows]
+"""
+
+import contextlib
+import io
+import sys
+from datetime import datetime
+
+from benchmarks.common import seed_database, temp_db_path, timed
+from src.expense_manager import ExpenseManager
+from src.visualizer import Visualizer
+
+
+def per_transaction(em):
+    """Old path: sort every Transaction, strptime each date, one point per row."""
+    dates = []
+    balances = []
+    balance = 0
+    for t in sorted(em.get_all_transactions(), key=lambda t: t.date):
+        dates.append(datetime.strptime(t.date, "%Y-%m-%d"))
+        balance += t.amount if t.transaction_type == "income" else -t.amount
+        balances.append(balance)
+    return dates, balances
+
+
+def main(rows=1_000_000):
+    """Run the benchmark and print seconds and plotted points per path."""
+    with temp_db_path() as path:
+        with contextlib.redirect_stdout(io.StringIO()):
+            em = ExpenseManager(path, profile="fast", cache_size=0)
+            viz = Visualizer(em, cache_dir=None)
+        seed_database(em.db, rows)
+
+        old_time, (old_dates, _) = timed(per_transaction, em, repeat=1)
+        new_time, (new_dates, _) = timed(viz.balance_trend)
+        print(f"{rows:,} rows")
+        print(f"per transaction: {old_time:>8.3f}s {len(old_dates):>10,} points")
+        print(f"daily + minmax:  {new_time:>8.3f}s {len(new_dates):>10,} points")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            em.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
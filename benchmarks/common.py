@@ -0,0 +1,62 @@
+"""Shared helpers for benchmark scripts."""
+
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from src.expense_manager import ExpenseManager
+
+DESCRIPTIONS = [
+    "Groceries", "Restaurant lunch", "Gas", "Movie tickets", "Electric bill",
+    "Water bill", "Pharmacy", "Tuition", "Monthly rent", "Clothes", "Coffee",
+    "Taxi", "Internet", "Books", "Concert",
+]
+
+
+def synthetic_rows(count, seed=42, start=date(2015, 1, 1), days=3650):
+    """Yield (type, amount, category, description, date) tuples in date order.
+
+    Rows are spread evenly over ``days`` starting at ``start``, the way a
+    ledger grows when transactions are recorded as they happen.
+    """
+    rng = random.Random(seed)
+    categories = ExpenseManager.EXPENSE_CATEGORIES
+    for i in range(count):
+        day = (start + timedelta(days=i * days // count)).isoformat()
+        if rng.random() < 0.1:
+            yield ("income", round(rng.uniform(1000, 5000), 2), "Salary/Income", "Salary", day)
+        else:
+            yield (
+                "expense",
+                round(rng.uniform(1, 500), 2),
+                rng.choice(categories),
+                rng.choice(DESCRIPTIONS),
+                day,
+            )
+
+
+def seed_database(db, count, seed=42):
+    """Insert synthetic rows into a Database in one transaction."""
+    db.add_transactions_bulk(synthetic_rows(count, seed))
+
+
+@contextmanager
+def temp_db_path(name="bench.db"):
+    """Yield a path to a scratch database file that is removed afterwards."""
+    with tempfile.TemporaryDirectory() as tmp:
+        yield os.path.join(tmp, name)
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    """Return (best seconds, result) over several runs of func."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
@@ -1,12 +1,30 @@
 #!/usr/bin/env python3
 """
 Quick start guide to run the Expense Tracker application interactively.
+
+Run commands non-interactively with --batch FILE (or - for stdin); each
+command prints one JSON line and all changes are committed together.
 """
 
+import argparse
+import sys
+
 from src.main import ExpenseTrackerCLI
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Expense Tracker")
+    parser.add_argument(
+        "--batch", metavar="FILE", help="run commands from FILE ('-' for stdin) and print JSON lines"
+    )
+    parser.add_argument("--db", default="data/expenses.db", help="database file or storage URL for --batch")
+    args = parser.parse_args()
+
+    if args.batch:
+        from src.batch import run_batch
+
+        sys.exit(run_batch(args.batch, args.db))
+
     print("\n" + "=" * 50)
     print("Welcome to Expense Tracker!")
     print("=" * 50)
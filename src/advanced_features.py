@@ -9,6 +9,7 @@ Advanced features for Expense Tracker GUI
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
+from src.database import TransactionQuery, search_words
 from src.expense_manager import ExpenseManager
 import json
 from pathlib import Path
@@ -83,8 +84,9 @@ class SpendingAnalytics:
 
     def get_category_trends(self):
         """Get spending trends by category over months."""
-        monthly = self.em.get_monthly_summary()
-        category_summary = self.em.get_expenses_by_category_summary()
+        snapshot = self.em.get_snapshot()
+        monthly = snapshot["monthly"]
+        category_summary = snapshot["categories"]
         return {
             "total_categories": len(category_summary),
             "top_category": max(category_summary, key=category_summary.get)
@@ -100,7 +102,7 @@ class SpendingAnalytics:
 
     def get_spending_forecast(self, months=3):
         """Forecast spending for next months."""
-        monthly = self.em.get_monthly_summary()
+        monthly = self.em.get_snapshot()["monthly"]
         if not monthly:
             return None
 
@@ -117,52 +119,138 @@ class SpendingAnalytics:
 
     def get_savings_rate(self):
         """Calculate savings rate (savings / income)."""
-        income = self.em.calculate_total_income()
-        expenses = self.em.calculate_total_expenses()
+        snapshot = self.em.get_snapshot()
+        income = snapshot["income"]
+        expenses = snapshot["expenses"]
         if income == 0:
             return 0
         return round(((income - expenses) / income) * 100, 2)
 
     def get_category_percentage(self, category):
         """Get percentage of total spending in a category."""
-        expenses = self.em.get_expenses()
-        category_total = sum(e.amount for e in expenses if e.category == category)
-        total_expenses = self.em.calculate_total_expenses()
+        snapshot = self.em.get_snapshot()
+        category_total = snapshot["categories"].get(category, 0)
+        total_expenses = snapshot["expenses"]
         if total_expenses == 0:
             return 0
         return round((category_total / total_expenses) * 100, 2)
 
 
 class TransactionSearch:
-    """Search functionality for transactions."""
+    """Search functionality for transactions.
 
-    def __init__(self, expense_manager):
-        """Initialize search."""
-        self.em = expense_manager
+    Every search compiles to a single indexed SQL query. With ``page_size``
+    set, each call returns at most one page; pass ``page`` to get the next.
+    """
 
-    def search_by_description(self, query):
-        """Search transactions by description."""
-        transactions = self.em.get_all_transactions()
-        return [
-            t for t in transactions if query.lower() in t.description.lower()
-        ]
+    LIVE_LIMIT = 100
 
-    def search_by_date_range(self, start_date, end_date):
+    def __init__(self, expense_manager, page_size=None):
+        """Initialize search."""
+        self.em = expense_manager
+        self.page_size = page_size
+        self.last_query = None
+        self.last_total = None
+        self.last_live = None  # (text, results, complete, data version)
+
+    def run(self, query, page=0):
+        """Run a TransactionQuery, applying the page size."""
+        if self.page_size is not None:
+            query = query.page(self.page_size, page * self.page_size)
+        self.last_query = query
+        self.last_total = None
+        return self.em.find_transactions(query)
+
+    def count_last(self):
+        """Count all matches of the last search, across pages."""
+        if self.last_total is not None:
+            return self.last_total
+        if self.last_query is None:
+            return 0
+        return self.em.count_transactions(self.last_query)
+
+    def search_as_you_type(self, text, limit=None):
+        """Description search for text typed a keystroke at a time.
+
+        Returns the best ``limit`` matches (default ``page_size``, else
+        LIVE_LIMIT). When text only narrows the previous call's text (longer
+        words or more words) and every previous match fitted within the
+        limit, the previous matches are filtered in memory instead of querying
+        again; refined results keep the previous order.
+        """
+        limit = limit or self.page_size or self.LIVE_LIMIT
+        query = self.description_query(text)
+        version = self.em.cache.current_version()
+        fts = self.em.db.fts_enabled
+
+        previous = self.last_live
+        if (previous is not None and previous[2] and previous[3] == version
+                and self._narrows(text, previous[0], fts)):
+            results = [t for t in previous[1] if self._text_matches(t.description, text, fts)]
+            complete = True
+        else:
+            results = self.em.find_transactions(query.page(limit + 1))
+            complete = len(results) <= limit
+            results = results[:limit]
+
+        self.last_query = query
+        self.last_total = len(results) if complete else None
+        self.last_live = (text, results, complete, version)
+        return results
+
+    @staticmethod
+    def _narrows(text, previous, fts):
+        """Whether every match of text is also a match of previous."""
+        if fts:
+            old, new = search_words(previous), search_words(text)
+            return bool(old) and len(new) >= len(old) and all(
+                n.startswith(o) for n, o in zip(new, old)
+            )
+        return bool(previous) and previous.lower() in text.lower()
+
+    @staticmethod
+    def _text_matches(description, text, fts):
+        """Match a description the way the database text filter does."""
+        if fts:
+            words = search_words(description)
+            return all(any(w.startswith(q) for w in words) for q in search_words(text))
+        return text.lower() in description.lower()
+
+    def search_by_description(self, query, page=0):
+        """Search transactions by description, best matches first.
+
+        Uses the database full-text index (word-prefix matching) when SQLite
+        has FTS5, and a substring match otherwise.
+        """
+        return self.run(self.description_query(query), page)
+
+    def search_by_date_range(self, start_date, end_date, page=0):
         """Search by date range."""
-        return self.em.get_transactions_by_date(start_date, end_date)
+        return self.run(self.date_range_query(start_date, end_date), page)
 
-    def search_by_amount_range(self, min_amount, max_amount):
+    def search_by_amount_range(self, min_amount, max_amount, page=0):
         """Search by amount range."""
-        transactions = self.em.get_all_transactions()
-        return [
-            t for t in transactions
-            if min_amount <= t.amount <= max_amount
-        ]
+        return self.run(self.amount_range_query(min_amount, max_amount), page)
 
-    def search_by_category_and_date(self, category, start_date, end_date):
+    def search_by_category_and_date(self, category, start_date, end_date, page=0):
         """Complex search: category and date range."""
-        transactions = self.em.get_transactions_by_date(start_date, end_date)
-        return [t for t in transactions if t.category == category]
+        query = TransactionQuery().in_categories(category).between_dates(start_date, end_date)
+        return self.run(query, page)
+
+    @staticmethod
+    def description_query(text):
+        """Query behind search_by_description."""
+        return TransactionQuery().matching(text).sorted_by("rank")
+
+    @staticmethod
+    def date_range_query(start_date, end_date):
+        """Query behind search_by_date_range."""
+        return TransactionQuery().between_dates(start_date, end_date)
+
+    @staticmethod
+    def amount_range_query(min_amount, max_amount):
+        """Query behind search_by_amount_range."""
+        return TransactionQuery().between_amounts(min_amount, max_amount)
 
 
 class BudgetAlert:
@@ -176,7 +264,7 @@ class BudgetAlert:
     def check_alerts(self):
         """Check for budget alerts."""
         alerts = []
-        budget_status = self.em.check_budget_status()
+        budget_status = self.em.get_snapshot()["budgets"]
 
         for category, status in budget_status.items():
             percentage = status["percentage"] / 100
@@ -0,0 +1,132 @@
+"""Background data loading for the expense tracker GUI."""
+
+import queue
+import threading
+
+from src.expense_manager import ExpenseManager
+
+
+class BackgroundLoader:
+    """Run ExpenseManager reads on a worker thread and deliver results to Tk.
+
+    The worker opens its own read-only database connection. Finished
+    requests are queued and picked up by a ``root.after`` poll on the Tk
+    thread, so callbacks may touch widgets. Submitting a request under a key
+    makes earlier requests with that key stale: they are skipped if not yet
+    started and their results are dropped otherwise. With ``interrupt`` a
+    stale request that is already running has its SQL query aborted.
+    """
+
+    POLL_MS = 16
+
+    def __init__(self, root, db_path, on_busy_change=None, manager_factory=None):
+        """Start the worker thread and the result poll."""
+        self.root = root
+        self.on_busy_change = on_busy_change
+        self.manager_factory = manager_factory or (
+            lambda: ExpenseManager(db_path, profile="readonly")
+        )
+        self.pending = 0
+        self._busy = False
+        self._latest = {}
+        self._running = None
+        self._interrupted = False
+        self._em = None
+        self._lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="expense-loader", daemon=True)
+        self._thread.start()
+        self._poll_id = self.root.after(self.POLL_MS, self._poll)
+
+    def submit(self, key, func, callback, error_callback=None, interrupt=False):
+        """Run func(expense_manager) in the background, then callback(result) on the Tk thread."""
+        generation = self._supersede(key, interrupt)
+        self.pending += 1
+        self._update_busy()
+        self._requests.put((key, generation, func, callback, error_callback))
+
+    def cancel(self, key, interrupt=False):
+        """Drop any queued or running request for key."""
+        self._supersede(key, interrupt)
+
+    def _supersede(self, key, interrupt):
+        """Make earlier requests for key stale; return the new generation."""
+        with self._lock:
+            generation = self._latest.get(key, 0) + 1
+            self._latest[key] = generation
+            if interrupt and self._running == key and self._em is not None:
+                self._em.db.interrupt()
+                self._interrupted = True
+        return generation
+
+    def _is_current(self, key, generation):
+        """Whether a request is still the latest for its key."""
+        with self._lock:
+            return self._latest.get(key) == generation
+
+    def _run(self):
+        """Worker loop: execute requests in order until shutdown."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+            key, generation, func, callback, error_callback = request
+            result = error = None
+            if self._is_current(key, generation):
+                try:
+                    if self._em is None:
+                        self._em = self.manager_factory()
+                    with self._lock:
+                        self._running = key
+                    result = func(self._em)
+                except Exception as e:
+                    error = e
+                finally:
+                    self._finish_running()
+            self._results.put((key, generation, result, error, callback, error_callback))
+        if self._em is not None:
+            self._em.close()
+
+    def _finish_running(self):
+        """Clear the running request, discarding cached results of an interrupted one."""
+        with self._lock:
+            self._running = None
+            interrupted, self._interrupted = self._interrupted, False
+        if interrupted:
+            # The aborted query's empty result may have been cached
+            self._em.cache.invalidate()
+
+    def _poll(self):
+        """Deliver finished results on the Tk thread."""
+        while True:
+            try:
+                key, generation, result, error, callback, error_callback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if not self._is_current(key, generation):
+                continue
+            if error is not None:
+                if error_callback:
+                    error_callback(error)
+                else:
+                    print(f"✗ Error loading {key}: {error}")
+            else:
+                callback(result)
+        self._update_busy()
+        self._poll_id = self.root.after(self.POLL_MS, self._poll)
+
+    def _update_busy(self):
+        """Report busy/idle transitions to on_busy_change."""
+        busy = self.pending > 0
+        if busy != self._busy:
+            self._busy = busy
+            if self.on_busy_change:
+                self.on_busy_change(busy)
+
+    def shutdown(self):
+        """Stop polling and let the worker close its connection."""
+        self.root.after_cancel(self._poll_id)
+        self._requests.put(None)
+        self._thread.join(timeout=2)
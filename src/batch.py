@@ -0,0 +1,182 @@
+"""Non-interactive batch mode for the expense tracker CLI."""
+
+import contextlib
+import io
+import json
+import shlex
+import sys
+import time
+
+from src.expense_manager import ExpenseManager
+from src.report_generator import ReportGenerator
+
+
+class BatchRunner:
+    """Run CLI commands from a stream inside one database transaction.
+
+    Commands use the interactive CLI's syntax; arguments may be double-quoted.
+    Each command writes one JSON object to ``output``; what the expense
+    manager prints is captured and only used for error messages. A final
+    object with ``"done": true`` reports the totals.
+    """
+
+    def __init__(self, expense_manager, output=None):
+        """Initialize runner."""
+        self.em = expense_manager
+        self.rg = ReportGenerator(expense_manager)
+        self.output = output or sys.stdout
+        self.commands = {
+            "add-income": self.add_income,
+            "add-expense": self.add_expense,
+            "delete": self.delete,
+            "set-budget": self.set_budget,
+            "list-all": lambda args: self.transactions(self.em.get_all_transactions()),
+            "list-income": lambda args: self.transactions(self.em.get_income()),
+            "list-expenses": lambda args: self.transactions(self.em.get_expenses()),
+            "filter-date": self.filter_date,
+            "summary": self.summary,
+            "category-report": lambda args: {"categories": self.em.get_snapshot()["categories"]},
+            "monthly-report": lambda args: {"monthly": self.em.get_snapshot()["monthly"]},
+            "budget-report": lambda args: {"budgets": self.em.get_snapshot()["budgets"]},
+            "export-csv": self.export_csv,
+            "import-csv": self.import_csv,
+            "rebuild-rollups": lambda args: self.em.rebuild_rollups() and {},
+        }
+
+    def run(self, lines):
+        """Run every command; return the number that failed."""
+        start = time.perf_counter()
+        succeeded = failed = 0
+
+        with self.em.transaction():
+            for number, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.split()[0].lower() == "exit":
+                    break
+                result = {"line": number, **self.run_command(line)}
+                if result["ok"]:
+                    succeeded += 1
+                else:
+                    failed += 1
+                self.emit(result)
+
+        self.emit({
+            "done": True,
+            "succeeded": succeeded,
+            "failed": failed,
+            "seconds": round(time.perf_counter() - start, 4),
+        })
+        return failed
+
+    def run_command(self, line):
+        """Run one command line and return its JSON result."""
+        chatter = io.StringIO()
+        cmd = line.split()[0].lower()
+        try:
+            parts = self.split(line)
+            handler = self.commands.get(cmd)
+            if handler is None:
+                raise ValueError(f"Unknown command: {cmd}")
+            with contextlib.redirect_stdout(chatter):
+                result = handler(parts[1:])
+        except Exception as e:
+            # One bad command must not abort the batch and roll back the rest.
+            return {"command": cmd, "ok": False, "error": str(e)}
+
+        if result is False:
+            errors = [l for l in chatter.getvalue().splitlines() if l.startswith("✗")]
+            message = errors[-1].lstrip("✗ ") if errors else f"{cmd} failed"
+            return {"command": cmd, "ok": False, "error": message}
+        return {"command": cmd, "ok": True, **result}
+
+    @staticmethod
+    def split(line):
+        """Split a command line; double quotes group words, apostrophes are literal."""
+        if '"' not in line:
+            return line.split()
+        lexer = shlex.shlex(line, posix=True)
+        lexer.whitespace_split = True
+        lexer.quotes = '"'
+        return list(lexer)
+
+    def emit(self, result):
+        """Write one JSON line."""
+        self.output.write(json.dumps(result) + "\n")
+
+    @staticmethod
+    def require(args, count, usage):
+        """Raise ValueError with the usage text when arguments are missing."""
+        if len(args) < count:
+            raise ValueError(f"Usage: {usage}")
+
+    def add_income(self, args):
+        """add-income <amount> <description>"""
+        self.require(args, 2, "add-income <amount> <description>")
+        if not self.em.add_income(float(args[0]), " ".join(args[1:])):
+            return False
+        return {"id": self.em.last_added_id}
+
+    def add_expense(self, args):
+        """add-expense <amount> <category> <description>"""
+        self.require(args, 3, "add-expense <amount> <category> <description>")
+        if not self.em.add_expense(float(args[0]), args[1], " ".join(args[2:])):
+            return False
+        return {"id": self.em.last_added_id}
+
+    def delete(self, args):
+        """delete <id>"""
+        self.require(args, 1, "delete <transaction_id>")
+        return self.em.delete_transaction(int(args[0])) and {}
+
+    def set_budget(self, args):
+        """set-budget <category> <amount>"""
+        self.require(args, 2, "set-budget <category> <amount>")
+        return self.em.set_budget(args[0], float(args[1])) and {}
+
+    def filter_date(self, args):
+        """filter-date <start> <end>"""
+        self.require(args, 2, "filter-date <start_date> <end_date>")
+        return self.transactions(self.em.get_transactions_by_date(args[0], args[1]))
+
+    def summary(self, args):
+        """summary"""
+        snapshot = self.em.get_snapshot()
+        return {key: snapshot[key] for key in ("income", "expenses", "balance")}
+
+    def export_csv(self, args):
+        """export-csv <filename>"""
+        self.require(args, 1, "export-csv <filename>")
+        if not self.rg.export_to_csv(args[0]):
+            return False
+        return {"file": args[0], "rows": self.rg.last_export["rows"]}
+
+    def import_csv(self, args):
+        """import-csv <filename>"""
+        self.require(args, 1, "import-csv <filename>")
+        summary = self.em.import_csv(args[0])
+        if summary is None:
+            return False
+        return {key: summary[key] for key in ("read", "imported", "duplicates", "invalid")}
+
+    @staticmethod
+    def transactions(transactions):
+        """Result holding a list of transactions."""
+        return {"transactions": [t.to_dict() for t in transactions]}
+
+
+def run_batch(source, db_path="data/expenses.db"):
+    """Run commands from a file path, or stdin for '-'; return an exit status."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        em = ExpenseManager(db_path)
+    try:
+        if source == "-":
+            failed = BatchRunner(em).run(sys.stdin)
+        else:
+            with open(source, encoding="utf-8") as f:
+                failed = BatchRunner(em).run(f)
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            em.close()
+    return 1 if failed else 0
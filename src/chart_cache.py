@@ -0,0 +1,83 @@
+"""Content-addressed cache of rendered charts."""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+
+class ChartCache:
+    """Store rendered chart files under a hash of everything that shaped them.
+
+    ``key`` hashes the chart name, the input series and the render
+    parameters; ``fetch`` copies a stored file to its destination on a hit
+    and ``store`` saves a freshly rendered one. Files unused for
+    ``max_age_days`` are evicted, then the least recently used ones until
+    the cache fits in ``max_bytes``.
+    """
+
+    def __init__(self, directory, max_bytes=50 * 1024 * 1024, max_age_days=30):
+        """Initialize cache."""
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts):
+        """Hash JSON-serializable chart inputs into a cache key."""
+        payload = json.dumps(parts, separators=(",", ":"), default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def path_for(self, key, suffix=".png"):
+        """Location of the stored file for key."""
+        return self.directory / f"{key}{suffix}"
+
+    def fetch(self, key, destination):
+        """Copy the stored file for key to destination; return whether it was cached."""
+        cached = self.path_for(key, Path(destination).suffix)
+        try:
+            shutil.copyfile(cached, destination)
+            os.utime(cached)
+        except OSError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key, source):
+        """Save a rendered file under key, then evict old entries."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, self.path_for(key, Path(source).suffix))
+        except OSError as e:
+            print(f"✗ Error caching chart: {e}")
+            return
+        self.evict()
+
+    def evict(self):
+        """Remove expired files, then the least recently used beyond max_bytes."""
+        try:
+            entries = [(entry.stat().st_mtime, entry.stat().st_size, entry)
+                       for entry in self.directory.iterdir() if entry.is_file()]
+        except OSError:
+            return
+
+        cutoff = time.time() - self.max_age
+        entries.sort(key=lambda e: e[0], reverse=True)
+        total = 0
+        for mtime, size, entry in entries:
+            total += size
+            if mtime < cutoff or total > self.max_bytes:
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+                total -= size
+
+    def clear(self):
+        """Remove every cached file."""
+        shutil.rmtree(self.directory, ignore_errors=True)
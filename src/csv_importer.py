@@ -0,0 +1,241 @@
+"""Streaming CSV/TSV import for expense tracker."""
+
+import csv
+import io
+import itertools
+import math
+import os
+from datetime import datetime
+
+from src.transaction import MAX_AMOUNT, content_hash, to_cents
+
+
+class CSVImporter:
+    """Import transactions from a CSV or TSV file in fixed-size chunks.
+
+    Reads the file as a stream, so memory use does not grow with file size.
+    Columns are found by header name (see COLUMN_ALIASES); the importer's
+    own export format is recognized. Each chunk is parsed column by column,
+    rows already stored before the import started are skipped by content
+    hash, and the rest are bulk-inserted with one commit per chunk.
+
+    Amount signs decide the type when the file has no type or debit/credit
+    columns: negative amounts are expenses, positive ones income, unless
+    ``default_type`` is given. Unknown expense categories become "Other";
+    ``category_map`` maps file categories (case-insensitively) to app ones.
+
+    ``progress(bytes_read, total_bytes, imported)`` is called after each chunk.
+    """
+
+    COLUMN_ALIASES = {
+        "date": ("date", "transaction date", "posted date", "posting date", "value date"),
+        "type": ("type", "transaction type"),
+        "category": ("category",),
+        "amount": ("amount", "value"),
+        "debit": ("debit", "withdrawal", "withdrawals", "money out"),
+        "credit": ("credit", "deposit", "deposits", "money in"),
+        "description": ("description", "memo", "details", "narrative", "payee", "particulars"),
+    }
+    DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d", "%d-%m-%Y", "%d %b %Y", "%b %d, %Y")
+    TYPE_ALIASES = {
+        "expense": "expense", "debit": "expense", "dr": "expense", "withdrawal": "expense",
+        "income": "income", "credit": "income", "cr": "income", "deposit": "income",
+    }
+    AMOUNT_JUNK = str.maketrans("", "", "₱$€£, \u00a0")
+    MAX_ERRORS = 20
+    DATE_CACHE_SIZE = 4096
+
+    def __init__(self, expense_manager, chunk_size=10000, category_map=None,
+                 date_format=None, delimiter=None, default_type=None, progress=None):
+        """Initialize importer."""
+        self.em = expense_manager
+        self.chunk_size = chunk_size
+        self.category_map = {k.lower(): v for k, v in (category_map or {}).items()}
+        self.date_format = date_format
+        self.delimiter = delimiter
+        self.default_type = default_type
+        self.progress = progress
+        self.categories = {c.lower(): c for c in expense_manager.EXPENSE_CATEGORIES}
+        self.date_cache = {}
+
+    def import_file(self, path):
+        """Import a file; return counts of rows read, imported, duplicate and invalid.
+
+        The result also holds up to MAX_ERRORS ``(line, message)`` pairs.
+        """
+        total_bytes = os.path.getsize(path)
+        delimiter = self.delimiter or self.sniff_delimiter(path)
+        summary = {"read": 0, "imported": 0, "duplicates": 0, "invalid": 0, "errors": []}
+        max_id = self.em.db.get_max_transaction_id()
+
+        with open(path, "rb") as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+            reader = csv.reader(text, delimiter=delimiter)
+            header = next(reader, None)
+            if header is None:
+                return summary
+            columns = self.map_columns(header)
+
+            line = 1
+            while True:
+                chunk = list(itertools.islice(reader, self.chunk_size))
+                if not chunk:
+                    break
+                rows, lines, errors = self.parse_chunk(chunk, columns, first_line=line + 1)
+                line += len(chunk)
+
+                hashes = [content_hash(r[4], r[0], to_cents(r[1]), r[3]) for r in rows]
+                existing = self.em.db.find_content_hashes(set(hashes), max_id)
+                keep = [i for i, h in enumerate(hashes) if h not in existing]
+                new_rows = [rows[i] for i in keep]
+                inserted, failures = self.em.db.add_transactions_bulk(new_rows)
+                errors.extend((lines[keep[i]], message) for i, message in failures)
+
+                summary["read"] += len(chunk)
+                summary["imported"] += inserted
+                summary["duplicates"] += len(rows) - len(new_rows)
+                summary["invalid"] += len(errors)
+                room = self.MAX_ERRORS - len(summary["errors"])
+                summary["errors"].extend(errors[:max(0, room)])
+
+                if self.progress:
+                    self.progress(raw.tell(), total_bytes, summary["imported"])
+
+        return summary
+
+    @staticmethod
+    def sniff_delimiter(path):
+        """Guess the delimiter from the file name or its first lines."""
+        if path.lower().endswith((".tsv", ".tab")):
+            return "\t"
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            sample = f.read(16384)
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=",\t;|").delimiter
+        except csv.Error:
+            return ","
+
+    def map_columns(self, header):
+        """Map field names to column positions from the header row."""
+        names = [h.strip().lower() for h in header]
+        columns = {}
+        for field, aliases in self.COLUMN_ALIASES.items():
+            for alias in aliases:
+                if alias in names:
+                    columns[field] = names.index(alias)
+                    break
+
+        if "date" not in columns:
+            raise ValueError("CSV needs a date column")
+        if "amount" not in columns and not ("debit" in columns or "credit" in columns):
+            raise ValueError("CSV needs an amount column or debit/credit columns")
+        return columns
+
+    def parse_chunk(self, chunk, columns, first_line):
+        """Parse a chunk of raw rows column by column.
+
+        Returns ``(rows, lines, errors)``: database tuples ``(type, amount,
+        category, description, date)``, the file line of each row, and
+        ``(line, message)`` pairs for rejected rows.
+        """
+        width = max(columns.values()) + 1
+        chunk = [r + [""] * (width - len(r)) if len(r) < width else r for r in chunk]
+
+        def column(field):
+            index = columns.get(field)
+            return [r[index].strip() for r in chunk] if index is not None else [""] * len(chunk)
+
+        dates = self.parse_dates(column("date"))
+        descriptions = column("description")
+        categories = column("category")
+        types = [self.TYPE_ALIASES.get(t.lower(), t.lower()) for t in column("type")]
+
+        if "amount" in columns:
+            amounts = [self.parse_amount(a) for a in column("amount")]
+        else:
+            debits = [self.parse_amount(a) for a in column("debit")]
+            credits = [self.parse_amount(a) for a in column("credit")]
+            amounts = [-abs(d) if d else c for d, c in zip(debits, credits)]
+
+        rows = []
+        lines = []
+        errors = []
+        for offset, (day, amount, trans_type, category, description) in enumerate(
+            zip(dates, amounts, types, categories, descriptions)
+        ):
+            line = first_line + offset
+            if day is None:
+                errors.append((line, f"Invalid date: {chunk[offset][columns['date']]!r}"))
+                continue
+            if not amount:
+                errors.append((line, "Missing, invalid or zero amount"))
+                continue
+            if not trans_type:
+                trans_type = self.default_type or ("expense" if amount < 0 else "income")
+            if trans_type not in ("income", "expense"):
+                errors.append((line, f"Invalid type: {trans_type!r}"))
+                continue
+            rows.append((trans_type, abs(amount), self.map_category(trans_type, category),
+                         description, day))
+            lines.append(line)
+        return rows, lines, errors
+
+    def parse_dates(self, values):
+        """Convert date strings to YYYY-MM-DD, or None when unparseable."""
+        if self.date_format is None:
+            self.date_format = self.detect_date_format(values)
+        cache = self.date_cache
+        if len(cache) > self.DATE_CACHE_SIZE:
+            cache.clear()
+
+        parsed = []
+        for value in values:
+            day = cache.get(value, False)
+            if day is False:
+                try:
+                    day = datetime.strptime(value, self.date_format).strftime("%Y-%m-%d")
+                except ValueError:
+                    day = None
+                cache[value] = day
+            parsed.append(day)
+        return parsed
+
+    def detect_date_format(self, values):
+        """Pick the first DATE_FORMATS entry that parses every sample value."""
+        sample = {v for v in values[:1000] if v}
+        for date_format in self.DATE_FORMATS:
+            try:
+                for value in sample:
+                    datetime.strptime(value, date_format)
+                return date_format
+            except ValueError:
+                continue
+        return self.DATE_FORMATS[0]
+
+    @classmethod
+    def parse_amount(cls, value):
+        """Parse an amount such as '-1,234.50', '(12.00)' or '₱99'.
+
+        Returns 0 when the value is empty, invalid, not finite ('nan', 'inf',
+        '1e400') or larger than MAX_AMOUNT, so the row is reported as invalid.
+        """
+        value = value.translate(cls.AMOUNT_JUNK)
+        negative = value.startswith("(") and value.endswith(")")
+        if negative:
+            value = value[1:-1]
+        try:
+            amount = float(value) if value else 0.0
+        except ValueError:
+            return 0.0
+        if not math.isfinite(amount) or abs(amount) > MAX_AMOUNT:
+            return 0.0
+        return -amount if negative else amount
+
+    def map_category(self, trans_type, category):
+        """Map a file category to an app category."""
+        mapped = self.category_map.get(category.lower())
+        if mapped:
+            return mapped
+        if trans_type == "income":
+            return category or "Salary/Income"
+        return self.categories.get(category.lower(), "Other")
@@ -0,0 +1,78 @@
+"""Live expense chart embedded in the GUI dashboard."""
+
+import time
+import tkinter as tk
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+
+class DashboardChart:
+    """Horizontal bar chart of expenses per category, updated in place.
+
+    One bar and one value label per category are created up front.
+    ``update`` changes only the bars whose totals moved and asks Tk to
+    redraw when idle, so refreshing after an add or delete never rebuilds
+    the figure. The x-axis is rescaled only when the largest bar stops
+    fitting or shrinks to under half the axis.
+    """
+
+    HEADROOM = 1.3  # axis length relative to the largest bar, leaving room for labels
+
+    def __init__(self, parent, categories):
+        """Create the figure and embed it in parent."""
+        self.categories = list(categories)
+        self.values = dict.fromkeys(self.categories, 0.0)
+        self.last_update_ms = None
+
+        self.figure = Figure(figsize=(6, 3), dpi=100)
+        self.figure.subplots_adjust(left=0.2, right=0.97, top=0.95, bottom=0.1)
+        self.ax = self.figure.add_subplot()
+        positions = list(range(len(self.categories)))
+        self.bars = self.ax.barh(positions, [0] * len(positions), color="#e74c3c")
+        self.labels = [self.ax.text(0, i, "", va="center", fontsize=8) for i in positions]
+        self.ax.set_yticks(positions, self.categories)
+        self.ax.invert_yaxis()
+        self.ax.set_xlim(0, 1)
+        self.ax.grid(axis="x", alpha=0.3)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.draw_idle()
+
+    def update(self, summary):
+        """Show new {category: amount} totals; return how many bars changed.
+
+        Categories without a bar are counted under "Other" when there is one.
+        """
+        start = time.perf_counter()
+        totals = dict.fromkeys(self.categories, 0.0)
+        for category, amount in summary.items():
+            if category not in totals:
+                category = "Other"
+            if category in totals:
+                totals[category] += amount
+
+        changed = 0
+        for index, category in enumerate(self.categories):
+            value = totals[category]
+            if value == self.values[category]:
+                continue
+            self.values[category] = value
+            self.bars[index].set_width(value)
+            self.labels[index].set_x(value)
+            self.labels[index].set_text(f" ₱{value:,.0f}" if value else "")
+            changed += 1
+
+        if changed:
+            self.rescale()
+            self.canvas.draw_idle()
+        self.last_update_ms = (time.perf_counter() - start) * 1000
+        return changed
+
+    def rescale(self):
+        """Fit the x-axis to the largest bar when it no longer fits well."""
+        largest = max(self.values.values()) or 1
+        limit = self.ax.get_xlim()[1]
+        if largest > limit / self.HEADROOM * 1.05 or largest * 2 < limit:
+            self.ax.set_xlim(0, largest * self.HEADROOM)
@@ -1,63 +1,763 @@
 """Database module for expense tracker."""
 
+import re
 import sqlite3
+import unicodedata
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
+from src.transaction import content_hash, to_cents
 
-class Database:
+
+FTS_INSERT_TRIGGER = """
+    CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions BEGIN
+        INSERT INTO transactions_fts (rowid, description) VALUES (new.id, new.description);
+    END
+"""
+
+ROLLUP_INSERT_TRIGGER = """
+    CREATE TRIGGER monthly_rollups_insert AFTER INSERT ON transactions BEGIN
+        INSERT INTO monthly_rollups (month, type, category, total, count)
+        VALUES (substr(new.date, 1, 7), new.type, IFNULL(new.category, ''), new.amount_cents, 1)
+        ON CONFLICT (month, type, category)
+        DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END
+"""
+
+ROLLUP_SELECT = """
+    SELECT substr(date, 1, 7), type, IFNULL(category, ''), SUM(amount_cents), COUNT(*)
+    FROM transactions
+    WHERE id > ?
+    GROUP BY 1, 2, 3
+"""
+
+# Per-row insert triggers that add_transactions_bulk drops for the duration
+# of a load and replaces with one set-based statement over the new rows
+# (id > ?), which is several times faster than firing once per row.
+BULK_INSERT_TRIGGERS = {
+    "transactions_fts_insert": (
+        FTS_INSERT_TRIGGER,
+        "INSERT INTO transactions_fts (rowid, description) "
+        "SELECT id, description FROM transactions WHERE id > ?",
+    ),
+    "monthly_rollups_insert": (
+        ROLLUP_INSERT_TRIGGER,
+        f"""
+        INSERT INTO monthly_rollups (month, type, category, total, count)
+        {ROLLUP_SELECT}
+        ON CONFLICT (month, type, category)
+        DO UPDATE SET total = total + excluded.total, count = count + excluded.count
+        """,
+    ),
+}
+
+
+def _fts5_available(cursor):
+    """Check whether this SQLite build supports FTS5."""
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        cursor.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _create_fts_index(cursor):
+    """Create the FTS5 description index and the triggers that keep it in sync."""
+    if not _fts5_available(cursor):
+        return
+    for statement in (
+        """
+        CREATE VIRTUAL TABLE transactions_fts USING fts5(
+            description,
+            content='transactions',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        """,
+        FTS_INSERT_TRIGGER,
+        """
+        CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions BEGIN
+            INSERT INTO transactions_fts (transactions_fts, rowid, description)
+            VALUES ('delete', old.id, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER transactions_fts_update AFTER UPDATE OF description ON transactions BEGIN
+            INSERT INTO transactions_fts (transactions_fts, rowid, description)
+            VALUES ('delete', old.id, old.description);
+            INSERT INTO transactions_fts (rowid, description) VALUES (new.id, new.description);
+        END
+        """,
+        "INSERT INTO transactions_fts (transactions_fts) VALUES ('rebuild')",
+    ):
+        cursor.execute(statement)
+
+
+def _add_content_hash(cursor):
+    """Add the content_hash column used to skip duplicate imports, and fill it in."""
+    cursor.execute("ALTER TABLE transactions ADD COLUMN content_hash INTEGER")
+    last_id = 0
+    while True:
+        cursor.execute(
+            "SELECT id, date, type, amount_cents, description FROM transactions "
+            "WHERE id > ? ORDER BY id LIMIT 10000",
+            (last_id,),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        cursor.executemany(
+            "UPDATE transactions SET content_hash = ? WHERE id = ?",
+            [(content_hash(*row[1:]), row[0]) for row in rows],
+        )
+        last_id = rows[-1][0]
+    cursor.execute("CREATE INDEX idx_transactions_content_hash ON transactions(content_hash)")
+
+
+# Each entry upgrades the schema by one version; PRAGMA user_version records
+# how many have been applied. Entries are lists of SQL statements or callables
+# taking a cursor. Only ever append to this list.
+MIGRATIONS = [
+    # 1: base tables
+    [
+        """
+        CREATE TABLE IF NOT EXISTS transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            type TEXT NOT NULL,
+            amount REAL NOT NULL,
+            category TEXT,
+            description TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS budgets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT UNIQUE NOT NULL,
+            amount REAL NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ],
+    # 2: indexes for the type/category/date filters, date ordering and aggregates
+    [
+        "CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date, type, amount)",
+        """
+        CREATE INDEX IF NOT EXISTS idx_transactions_type_date
+        ON transactions (type, date, category, amount)
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions (category, date)",
+    ],
+    # 3: store amounts as integer centavos (tables are rebuilt; ids are kept)
+    [
+        """
+        CREATE TABLE transactions_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            type TEXT NOT NULL,
+            amount_cents INTEGER NOT NULL,
+            category TEXT,
+            description TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        INSERT INTO transactions_new (id, date, type, amount_cents, category, description, created_at)
+        SELECT id, date, type, CAST(ROUND(amount * 100) AS INTEGER), category, description, created_at
+        FROM transactions
+        """,
+        "DELETE FROM sqlite_sequence WHERE name = 'transactions_new'",
+        """
+        INSERT INTO sqlite_sequence (name, seq)
+        SELECT 'transactions_new', seq FROM sqlite_sequence WHERE name = 'transactions'
+        """,
+        "DROP TABLE transactions",
+        "ALTER TABLE transactions_new RENAME TO transactions",
+        "CREATE INDEX idx_transactions_date ON transactions (date, type, amount_cents)",
+        """
+        CREATE INDEX idx_transactions_type_date
+        ON transactions (type, date, category, amount_cents)
+        """,
+        "CREATE INDEX idx_transactions_category_date ON transactions (category, date)",
+        """
+        CREATE TABLE budgets_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT UNIQUE NOT NULL,
+            amount_cents INTEGER NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        INSERT INTO budgets_new (id, category, amount_cents, created_at, updated_at)
+        SELECT id, category, CAST(ROUND(amount * 100) AS INTEGER), created_at, updated_at
+        FROM budgets
+        """,
+        "DROP TABLE budgets",
+        "ALTER TABLE budgets_new RENAME TO budgets",
+    ],
+    # 4: full-text index over descriptions (skipped when FTS5 is unavailable)
+    _create_fts_index,
+    # 5: index for amount-range searches
+    [
+        "CREATE INDEX idx_transactions_amount ON transactions (amount_cents)",
+    ],
+    # 6: per month/type/category totals kept up to date by triggers
+    [
+        """
+        CREATE TABLE monthly_rollups (
+            month TEXT NOT NULL,
+            type TEXT NOT NULL,
+            category TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (month, type, category)
+        ) WITHOUT ROWID
+        """,
+        ROLLUP_INSERT_TRIGGER,
+        """
+        CREATE TRIGGER monthly_rollups_delete AFTER DELETE ON transactions BEGIN
+            UPDATE monthly_rollups
+            SET total = total - old.amount_cents, count = count - 1
+            WHERE month = substr(old.date, 1, 7) AND type = old.type
+              AND category = IFNULL(old.category, '');
+            DELETE FROM monthly_rollups
+            WHERE month = substr(old.date, 1, 7) AND type = old.type
+              AND category = IFNULL(old.category, '') AND count <= 0;
+        END
+        """,
+        """
+        CREATE TRIGGER monthly_rollups_update
+        AFTER UPDATE OF date, type, amount_cents, category ON transactions BEGIN
+            UPDATE monthly_rollups
+            SET total = total - old.amount_cents, count = count - 1
+            WHERE month = substr(old.date, 1, 7) AND type = old.type
+              AND category = IFNULL(old.category, '');
+            DELETE FROM monthly_rollups
+            WHERE month = substr(old.date, 1, 7) AND type = old.type
+              AND category = IFNULL(old.category, '') AND count <= 0;
+            INSERT INTO monthly_rollups (month, type, category, total, count)
+            VALUES (substr(new.date, 1, 7), new.type, IFNULL(new.category, ''), new.amount_cents, 1)
+            ON CONFLICT (month, type, category)
+            DO UPDATE SET total = total + excluded.total, count = count + 1;
+        END
+        """,
+        """
+        INSERT INTO monthly_rollups (month, type, category, total, count)
+        SELECT substr(date, 1, 7), type, IFNULL(category, ''), SUM(amount_cents), COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3
+        """,
+    ],
+    # 7: content fingerprint for duplicate detection on import
+    _add_content_hash,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# PRAGMA settings applied on connect, in order. WAL lets readers run alongside
+# a writer; "readonly" connections are opened with mode=ro and never migrate.
+CONNECTION_PROFILES = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,
+        "temp_store": "DEFAULT",
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "readonly": {
+        "query_only": "ON",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+def search_words(text):
+    """Casefolded words of text without diacritics, as the FTS5 tokenizer splits them."""
+    text = unicodedata.normalize("NFKD", (text or "").casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.findall(r"[^\W_]+", text)
+
+
+@dataclass(frozen=True)
+class TransactionQuery:
+    """Composable description of a transaction search.
+
+    Each method returns a new query, so partial queries can be shared and
+    refined. ``compile`` turns it into one parameterized SELECT.
+    """
+
+    transaction_type: str = None
+    categories: tuple = None
+    start_date: str = None
+    end_date: str = None
+    min_amount: float = None
+    max_amount: float = None
+    text: str = None
+    order: str = "date"  # 'date', 'amount' or 'rank' (text relevance)
+    descending: bool = True
+    limit: int = None
+    offset: int = 0
+    after_key: tuple = None
+
+    ORDERS = ("date", "amount", "rank")
+
+    def of_type(self, transaction_type):
+        """Restrict to 'income' or 'expense'."""
+        return replace(self, transaction_type=transaction_type)
+
+    def in_categories(self, *categories):
+        """Restrict to any of the given categories."""
+        return replace(self, categories=tuple(categories))
+
+    def between_dates(self, start_date=None, end_date=None):
+        """Restrict to an inclusive YYYY-MM-DD date range; either end may be open."""
+        return replace(self, start_date=start_date, end_date=end_date)
+
+    def between_amounts(self, min_amount=None, max_amount=None):
+        """Restrict to an inclusive amount range; either end may be open."""
+        return replace(self, min_amount=min_amount, max_amount=max_amount)
+
+    def matching(self, text):
+        """Restrict to descriptions matching text."""
+        return replace(self, text=text)
+
+    def sorted_by(self, order, descending=True):
+        """Sort by 'date', 'amount' or 'rank'."""
+        if order not in self.ORDERS:
+            raise ValueError(f"Invalid order {order!r}. Valid orders: {', '.join(self.ORDERS)}")
+        return replace(self, order=order, descending=descending)
+
+    def page(self, limit, offset=0):
+        """Return at most limit rows starting at offset."""
+        return replace(self, limit=limit, offset=offset)
+
+    def after(self, key):
+        """Return only rows that sort after key, as returned by key_for.
+
+        Keyset paging: unlike a large OFFSET, the index seeks straight to the
+        key. Not available for text relevance order.
+        """
+        return replace(self, after_key=None if key is None else tuple(key))
+
+    @property
+    def supports_keyset(self):
+        """Whether after() can be used with this ordering."""
+        return self.order != "rank" or self.text is None
+
+    def key_for(self, transaction):
+        """Sort key of a transaction under this ordering, for after()."""
+        if self.order == "amount":
+            return transaction.amount_cents, transaction.transaction_id
+        return transaction.date, transaction.transaction_id
+
+    def matches(self, transaction):
+        """Check a transaction against every filter except the text filter."""
+        if self.transaction_type is not None and transaction.transaction_type != self.transaction_type:
+            return False
+        if self.categories is not None and transaction.category not in self.categories:
+            return False
+        if self.start_date is not None and transaction.date < self.start_date:
+            return False
+        if self.end_date is not None and transaction.date > self.end_date:
+            return False
+        if self.min_amount is not None and transaction.amount < self.min_amount:
+            return False
+        if self.max_amount is not None and transaction.amount > self.max_amount:
+            return False
+        return True
+
+    def compile(self, fts_enabled=True, count=False, cents=False):
+        """Return (sql, params) for this query.
+
+        With ``fts_enabled`` the text filter uses the FTS5 index (word-prefix
+        matching); otherwise it is a case-insensitive substring match.
+        ``count`` compiles a COUNT(*) without ordering or paging; ``cents``
+        selects amounts as integer centavos instead of pesos.
+        """
+        joins = []
+        conditions = []
+        params = []
+
+        if self.transaction_type is not None:
+            conditions.append("t.type = ?")
+            params.append(self.transaction_type)
+        if self.categories is not None:
+            conditions.append(f"t.category IN ({', '.join('?' * len(self.categories))})")
+            params.extend(self.categories)
+        if self.start_date is not None:
+            conditions.append("t.date >= ?")
+            params.append(self.start_date)
+        if self.end_date is not None:
+            conditions.append("t.date <= ?")
+            params.append(self.end_date)
+        if self.min_amount is not None and self.min_amount != float("-inf"):
+            conditions.append("t.amount_cents >= ?")
+            params.append(to_cents(self.min_amount))
+        if self.max_amount is not None and self.max_amount != float("inf"):
+            conditions.append("t.amount_cents <= ?")
+            params.append(to_cents(self.max_amount))
+
+        ranked = False
+        if self.text is not None:
+            words = re.findall(r"\w+", self.text)
+            if not words:
+                conditions.append("0")
+            elif fts_enabled:
+                joins.append("JOIN transactions_fts ON transactions_fts.rowid = t.id")
+                conditions.append("transactions_fts MATCH ?")
+                params.append(" ".join(f'"{word}"*' for word in words))
+                ranked = True
+            else:
+                escaped = self.text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                conditions.append("t.description LIKE ? ESCAPE '\\'")
+                params.append(f"%{escaped}%")
+
+        from_clause = " ".join(["FROM transactions AS t", *joins])
+        if count:
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            return f"SELECT COUNT(*) {from_clause} {where}", params
+
+        if self.after_key is not None:
+            if not self.supports_keyset:
+                raise ValueError("Keyset paging is not available for rank order")
+            column = "t.amount_cents" if self.order == "amount" else "t.date"
+            conditions.append(f"({column}, t.id) {'<' if self.descending else '>'} (?, ?)")
+            params.extend(self.after_key)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        direction = "DESC" if self.descending else "ASC"
+        if self.order == "rank" and ranked:
+            order_by = "transactions_fts.rank, t.date DESC, t.id DESC"
+        elif self.order == "amount":
+            order_by = f"t.amount_cents {direction}, t.id {direction}"
+        else:
+            order_by = f"t.date {direction}, t.id {direction}"
+
+        amount = "t.amount_cents" if cents else "t.amount_cents / 100.0"
+        sql = (
+            f"SELECT t.id, t.date, t.type, {amount}, t.category, t.description "
+            f"{from_clause} {where} ORDER BY {order_by}"
+        )
+        if self.limit is not None or self.offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if self.limit is None else self.limit, self.offset])
+        return sql, params
+
+
+class StorageBackend(ABC):
+    """Interface ExpenseManager uses to store transactions and budgets.
+
+    Transactions are returned as ``(id, date, type, amount, category,
+    description)`` tuples, newest first unless a TransactionQuery says
+    otherwise. Write methods return True/False and print errors instead of
+    raising; inside ``transaction()`` nothing is committed until the block
+    exits. Subclasses must implement every abstract method; backends are
+    opened by URL with ``src.storage.open_storage``.
+    """
+
+    BULK_CHUNK_SIZE = 10000
+    fts_enabled = False
+    last_insert_id = None
+
+    @abstractmethod
+    def transaction(self):
+        """Context manager that commits every write made in the block at once."""
+
+    @abstractmethod
+    def get_data_version(self):
+        """Value that changes when the stored data is changed by someone else."""
+
+    @abstractmethod
+    def add_transaction(self, transaction_type, amount, category, description, date=None):
+        """Add a new transaction and set last_insert_id."""
+
+    @abstractmethod
+    def add_transactions_bulk(self, rows, chunk_size=None):
+        """Insert many transactions; return (inserted, [(row_index, error_message)])."""
+
+    @abstractmethod
+    def delete_transaction(self, transaction_id):
+        """Delete a transaction by ID."""
+
+    @abstractmethod
+    def get_transaction(self, transaction_id):
+        """Retrieve one transaction by id, or None."""
+
+    @abstractmethod
+    def find_transactions(self, query):
+        """Get transactions matching a TransactionQuery."""
+
+    @abstractmethod
+    def count_transactions(self, query):
+        """Count transactions matching a TransactionQuery, ignoring paging."""
+
+    @abstractmethod
+    def iter_query(self, query, batch_size=1000):
+        """Yield rows of a TransactionQuery without loading them all."""
+
+    @abstractmethod
+    def iter_column_batches(self, query=None, batch_size=50000):
+        """Yield (ids, dates, types, amount_cents, categories, descriptions) column batches."""
+
+    @abstractmethod
+    def get_max_transaction_id(self):
+        """Largest transaction id so far, or 0."""
+
+    @abstractmethod
+    def find_content_hashes(self, hashes, max_id=None):
+        """Return the subset of content hashes already stored, optionally up to max_id."""
+
+    @abstractmethod
+    def get_totals_by_type(self):
+        """Get summed amounts grouped by transaction type."""
+
+    @abstractmethod
+    def get_category_totals(self, transaction_type="expense"):
+        """Get (category, total) pairs, largest first."""
+
+    @abstractmethod
+    def get_monthly_totals(self):
+        """Get (month, income, expenses) per month, oldest first."""
+
+    @abstractmethod
+    def get_snapshot_rows(self):
+        """Get ('rollup', month, type, category, cents) and ('budget', None, None, category, cents) rows."""
+
+    @abstractmethod
+    def get_daily_net(self):
+        """Get (date, income minus expenses in centavos) per day, oldest first."""
+
+    @abstractmethod
+    def rebuild_rollups(self):
+        """Recompute the monthly totals from the transactions."""
+
+    @abstractmethod
+    def set_budget(self, category, amount):
+        """Set or update budget for a category."""
+
+    @abstractmethod
+    def get_budgets(self):
+        """Get all (category, amount) budgets."""
+
+    def interrupt(self):
+        """Abort a query running on another thread, if the backend can."""
+
+    def close(self):
+        """Release the backend's resources."""
+
+    def get_all_transactions(self):
+        """Retrieve all transactions."""
+        return self.find_transactions(TransactionQuery())
+
+    def get_transactions_by_type(self, transaction_type):
+        """Get transactions by type (expense or income)."""
+        return self.find_transactions(TransactionQuery(transaction_type=transaction_type))
+
+    def get_transactions_by_date_range(self, start_date, end_date):
+        """Get transactions within a date range."""
+        return self.find_transactions(TransactionQuery(start_date=start_date, end_date=end_date))
+
+    def get_transactions_by_category(self, category):
+        """Get transactions in a category."""
+        return self.find_transactions(TransactionQuery(categories=(category,)))
+
+    def iter_transactions(self, transaction_type=None, category=None, start_date=None,
+                          end_date=None, batch_size=1000):
+        """Yield transaction tuples newest first without loading them all."""
+        query = TransactionQuery(
+            transaction_type=transaction_type,
+            categories=None if category is None else (category,),
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return self.iter_query(query, batch_size)
+
+    def search_descriptions(self, query, limit=None):
+        """Search descriptions, best matches first.
+
+        With a full-text index (``fts_enabled``) every word in ``query`` is
+        matched as a word prefix and results are ranked by relevance. Without
+        it, falls back to a case-insensitive substring match, newest first.
+        """
+        return self.find_transactions(
+            TransactionQuery(text=query, order="rank", limit=limit)
+        )
+
+    def get_total_by_type(self, transaction_type):
+        """Get the summed amount of all transactions of a type."""
+        return self.get_totals_by_type().get(transaction_type, 0.0)
+
+    def get_budget(self, category):
+        """Get budget for a specific category, or None."""
+        return dict(self.get_budgets()).get(category)
+
+    @staticmethod
+    def normalize_row(row, today):
+        """Turn an add_transactions_bulk row into (type, cents, category, description, date, hash)."""
+        if len(row) == 4:
+            trans_type, amount, category, description = row
+            trans_date = today
+        else:
+            trans_type, amount, category, description, trans_date = row
+        trans_date = trans_date or today
+        cents = to_cents(amount)
+        fingerprint = content_hash(trans_date, trans_type, cents, description)
+        return trans_type, cents, category, description, trans_date, fingerprint
+
+    @staticmethod
+    def _chunked(rows, size):
+        """Yield (start_index, list_of_rows) chunks from an iterable."""
+        chunk = []
+        start = 0
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield start, chunk
+                start += len(chunk)
+                chunk = []
+        if chunk:
+            yield start, chunk
+
+
+class Database(StorageBackend):
     """Handle all database operations for expense tracker."""
 
-    def __init__(self, db_path="data/expenses.db"):
+    def __init__(self, db_path="data/expenses.db", profile="durable"):
         """Initialize database connection."""
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(exist_ok=True)
         self.connection = None
         self.cursor = None
+        self.last_insert_id = None
+        self.batching = False
+        if profile not in CONNECTION_PROFILES:
+            raise ValueError(
+                f"Unknown profile {profile!r}. Valid profiles: {', '.join(CONNECTION_PROFILES)}"
+            )
+        self.db_path = Path(db_path)
+        self.profile = profile
+        self.readonly = CONNECTION_PROFILES[profile].get("query_only") == "ON"
+        if not self.readonly:
+            self.db_path.parent.mkdir(exist_ok=True)
         self.connect()
-        self.create_tables()
+        if not self.readonly:
+            self.create_tables()
 
     def connect(self):
         """Establish database connection."""
         try:
-            self.connection = sqlite3.connect(str(self.db_path))
+            if self.readonly:
+                uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+                self.connection = sqlite3.connect(uri, uri=True)
+            else:
+                self.connection = sqlite3.connect(str(self.db_path))
             self.cursor = self.connection.cursor()
+            self.apply_profile()
             print(f"✓ Database connected: {self.db_path}")
         except sqlite3.Error as e:
             print(f"✗ Database connection error: {e}")
             raise
 
+    def apply_profile(self):
+        """Apply the PRAGMA settings of the connection profile."""
+        for pragma, value in CONNECTION_PROFILES[self.profile].items():
+            self.cursor.execute(f"PRAGMA {pragma} = {value}")
+
     def create_tables(self):
-        """Create necessary database tables."""
+        """Create necessary database tables and apply pending migrations."""
+        self.migrate()
+
+    @property
+    def fts_enabled(self):
+        """Whether the FTS5 description index exists."""
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'transactions_fts'"
+        )
+        return self.cursor.fetchone() is not None
+
+    def get_data_version(self):
+        """Get PRAGMA data_version, which changes when other connections commit."""
+        self.cursor.execute("PRAGMA data_version")
+        return self.cursor.fetchone()[0]
+
+    def get_schema_version(self):
+        """Get the schema version stored in PRAGMA user_version."""
+        self.cursor.execute("PRAGMA user_version")
+        return self.cursor.fetchone()[0]
+
+    def migrate(self):
+        """Upgrade the schema in place to SCHEMA_VERSION."""
+        version = self.get_schema_version()
+        for target, statements in enumerate(MIGRATIONS[version:], start=version + 1):
+            try:
+                self.cursor.execute("BEGIN")
+                if callable(statements):
+                    statements(self.cursor)
+                else:
+                    for statement in statements:
+                        self.cursor.execute(statement)
+                self.cursor.execute(f"PRAGMA user_version = {target}")
+                self.connection.commit()
+            except sqlite3.Error as e:
+                self.connection.rollback()
+                print(f"✗ Error applying migration {target}: {e}")
+                raise
+
+    @contextmanager
+    def transaction(self):
+        """Run every write in the block as one database transaction.
+
+        Write methods do not commit inside the block; it is committed when the
+        block exits and rolled back if the block raises.
+        """
+        if self.batching:
+            yield
+            return
+        self.cursor.execute("BEGIN")
+        self.batching = True
         try:
-            # Transactions table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS transactions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    amount REAL NOT NULL,
-                    category TEXT,
-                    description TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            yield
+        except BaseException:
+            self.connection.rollback()
+            raise
+        else:
+            self.connection.commit()
+        finally:
+            self.batching = False
 
-            # Budgets table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS budgets (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    category TEXT UNIQUE NOT NULL,
-                    amount REAL NOT NULL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+    def _begin(self, name):
+        """Start a transaction, or a savepoint inside transaction()."""
+        self.cursor.execute(f"SAVEPOINT {name}" if self.batching else "BEGIN")
 
+    def _commit(self, name=None):
+        """Commit, or release the named savepoint inside transaction()."""
+        if not self.batching:
             self.connection.commit()
-        except sqlite3.Error as e:
-            print(f"✗ Error creating tables: {e}")
-            raise
+        elif name:
+            self.cursor.execute(f"RELEASE {name}")
+
+    def _rollback(self, name=None):
+        """Roll back, or roll back to the named savepoint inside transaction()."""
+        if not self.batching:
+            self.connection.rollback()
+        elif name:
+            self.cursor.execute(f"ROLLBACK TO {name}")
+            self.cursor.execute(f"RELEASE {name}")
 
     def add_transaction(self, transaction_type, amount, category, description, date=None):
         """Add a new transaction."""
@@ -65,23 +765,127 @@ class Database:
             date = datetime.now().strftime("%Y-%m-%d")
 
         try:
+            cents = to_cents(amount)
             self.cursor.execute("""
-                INSERT INTO transactions (date, type, amount, category, description)
-                VALUES (?, ?, ?, ?, ?)
-            """, (date, transaction_type, amount, category, description))
-            self.connection.commit()
+                INSERT INTO transactions (date, type, amount_cents, category, description, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                date, transaction_type, cents, category, description,
+                content_hash(date, transaction_type, cents, description),
+            ))
+            self._commit()
+            self.last_insert_id = self.cursor.lastrowid
             return True
-        except sqlite3.Error as e:
+        except (sqlite3.Error, ValueError, OverflowError) as e:
+            # Binding an out-of-range amount fails after sqlite3 has begun
+            # the implicit transaction, so end it here.
+            self._rollback()
             print(f"✗ Error adding transaction: {e}")
             return False
 
+    def add_transactions_bulk(self, rows, chunk_size=None):
+        """Insert many transactions with a single commit.
+
+        ``rows`` is an iterable of ``(type, amount, category, description)``
+        or ``(type, amount, category, description, date)`` tuples. Rows are
+        inserted with ``executemany`` in chunks of ``chunk_size``; when a chunk
+        fails it is retried row by row so only the offending rows are skipped.
+
+        Returns ``(inserted, failures)`` where failures is a list of
+        ``(row_index, error_message)``.
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        normalize = partial(self.normalize_row, today=datetime.now().strftime("%Y-%m-%d"))
+        inserted = 0
+        failures = []
+        sql = """
+            INSERT INTO transactions (type, amount_cents, category, description, date, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+
+        try:
+            self._begin("bulk_insert")
+            self.cursor.execute("SELECT COALESCE(MAX(id), 0) FROM transactions")
+            last_id = self.cursor.fetchone()[0]
+            self.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            deferred = [name for (name,) in self.cursor.fetchall() if name in BULK_INSERT_TRIGGERS]
+            for name in deferred:
+                self.cursor.execute(f"DROP TRIGGER {name}")
+            for start, chunk in self._chunked(rows, chunk_size):
+                self.cursor.execute("SAVEPOINT bulk_chunk")
+                try:
+                    self.cursor.executemany(sql, map(normalize, chunk))
+                    inserted += len(chunk)
+                except (sqlite3.Error, TypeError, ValueError, OverflowError):
+                    self.cursor.execute("ROLLBACK TO bulk_chunk")
+                    for offset, row in enumerate(chunk):
+                        try:
+                            self.cursor.execute(sql, normalize(row))
+                            inserted += 1
+                        except (sqlite3.Error, TypeError, ValueError, OverflowError) as e:
+                            failures.append((start + offset, str(e)))
+                self.cursor.execute("RELEASE bulk_chunk")
+            for name in deferred:
+                create_trigger, bulk_statement = BULK_INSERT_TRIGGERS[name]
+                self.cursor.execute(bulk_statement, (last_id,))
+                self.cursor.execute(create_trigger)
+            self._commit("bulk_insert")
+        except sqlite3.Error as e:
+            self._rollback("bulk_insert")
+            print(f"✗ Error adding transactions: {e}")
+            return 0, failures
+        except BaseException:
+            # Also restores the dropped triggers, which DROP TRIGGER inside
+            # the transaction would otherwise leave missing.
+            self._rollback("bulk_insert")
+            raise
+        return inserted, failures
+
+    def get_max_transaction_id(self):
+        """Largest transaction id so far, or 0."""
+        self.cursor.execute("SELECT COALESCE(MAX(id), 0) FROM transactions")
+        return self.cursor.fetchone()[0]
+
+    def find_content_hashes(self, hashes, max_id=None):
+        """Return the subset of content hashes already stored, optionally up to max_id."""
+        found = set()
+        hashes = list(hashes)
+        try:
+            for start in range(0, len(hashes), 900):
+                batch = hashes[start:start + 900]
+                sql = (
+                    "SELECT content_hash FROM transactions "
+                    f"WHERE content_hash IN ({', '.join('?' * len(batch))})"
+                )
+                if max_id is not None:
+                    sql += " AND id <= ?"
+                    batch.append(max_id)
+                self.cursor.execute(sql, batch)
+                found.update(h for (h,) in self.cursor.fetchall())
+        except sqlite3.Error as e:
+            print(f"✗ Error checking for duplicates: {e}")
+        return found
+
+    def get_transaction(self, transaction_id):
+        """Retrieve one transaction by id."""
+        try:
+            self.cursor.execute("""
+                SELECT id, date, type, amount_cents / 100.0, category, description
+                FROM transactions
+                WHERE id = ?
+            """, (transaction_id,))
+            return self.cursor.fetchone()
+        except sqlite3.Error as e:
+            print(f"✗ Error retrieving transaction: {e}")
+            return None
+
     def get_all_transactions(self):
         """Retrieve all transactions."""
         try:
             self.cursor.execute("""
-                SELECT id, date, type, amount, category, description
+                SELECT id, date, type, amount_cents / 100.0, category, description
                 FROM transactions
-                ORDER BY date DESC
+                ORDER BY date DESC, id DESC
             """)
             return self.cursor.fetchall()
         except sqlite3.Error as e:
@@ -92,10 +896,10 @@ class Database:
         """Get transactions by type (expense or income)."""
         try:
             self.cursor.execute("""
-                SELECT id, date, type, amount, category, description
+                SELECT id, date, type, amount_cents / 100.0, category, description
                 FROM transactions
                 WHERE type = ?
-                ORDER BY date DESC
+                ORDER BY date DESC, id DESC
             """, (transaction_type,))
             return self.cursor.fetchall()
         except sqlite3.Error as e:
@@ -106,10 +910,10 @@ class Database:
         """Get transactions within a date range."""
         try:
             self.cursor.execute("""
-                SELECT id, date, type, amount, category, description
+                SELECT id, date, type, amount_cents / 100.0, category, description
                 FROM transactions
                 WHERE date BETWEEN ? AND ?
-                ORDER BY date DESC
+                ORDER BY date DESC, id DESC
             """, (start_date, end_date))
             return self.cursor.fetchall()
         except sqlite3.Error as e:
@@ -120,21 +924,188 @@ class Database:
         """Get expenses by category."""
         try:
             self.cursor.execute("""
-                SELECT id, date, type, amount, category, description
+                SELECT id, date, type, amount_cents / 100.0, category, description
                 FROM transactions
                 WHERE category = ?
-                ORDER BY date DESC
+                ORDER BY date DESC, id DESC
             """, (category,))
             return self.cursor.fetchall()
         except sqlite3.Error as e:
             print(f"✗ Error retrieving transactions: {e}")
             return []
 
+    def find_transactions(self, query):
+        """Get transactions matching a TransactionQuery."""
+        try:
+            self.cursor.execute(*query.compile(self.fts_enabled))
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"✗ Error retrieving transactions: {e}")
+            return []
+
+    def count_transactions(self, query):
+        """Count transactions matching a TransactionQuery, ignoring paging."""
+        try:
+            self.cursor.execute(*query.compile(self.fts_enabled, count=True))
+            return self.cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"✗ Error counting transactions: {e}")
+            return 0
+
+    def iter_query(self, query, batch_size=1000):
+        """Yield rows of a TransactionQuery without loading them all.
+
+        Rows are read with ``fetchmany(batch_size)`` from a dedicated cursor,
+        so the shared ``self.cursor`` stays usable while iterating.
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(*query.compile(self.fts_enabled))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except sqlite3.Error as e:
+            print(f"✗ Error retrieving transactions: {e}")
+        finally:
+            cursor.close()
+
+    def iter_column_batches(self, query=None, batch_size=50000):
+        """Yield a TransactionQuery's results as batches of columns.
+
+        Each batch is a tuple ``(ids, dates, types, amount_cents, categories,
+        descriptions)`` of equal-length tuples, read with ``fetchmany`` from a
+        dedicated cursor so no per-row objects are built.
+        """
+        query = query or TransactionQuery()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(*query.compile(self.fts_enabled, cents=True))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield tuple(zip(*rows))
+        except sqlite3.Error as e:
+            print(f"✗ Error retrieving transactions: {e}")
+        finally:
+            cursor.close()
+
+    def get_total_by_type(self, transaction_type):
+        """Get the summed amount of all transactions of a type."""
+        try:
+            self.cursor.execute("""
+                SELECT COALESCE(SUM(total), 0) / 100.0
+                FROM monthly_rollups
+                WHERE type = ?
+            """, (transaction_type,))
+            return self.cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"✗ Error calculating total: {e}")
+            return 0
+
+    def get_totals_by_type(self):
+        """Get summed amounts grouped by transaction type."""
+        try:
+            self.cursor.execute("""
+                SELECT type, SUM(total) / 100.0
+                FROM monthly_rollups
+                GROUP BY type
+            """)
+            return dict(self.cursor.fetchall())
+        except sqlite3.Error as e:
+            print(f"✗ Error calculating totals: {e}")
+            return {}
+
+    def get_category_totals(self, transaction_type="expense"):
+        """Get summed amounts per category, largest first."""
+        try:
+            self.cursor.execute("""
+                SELECT NULLIF(category, ''), SUM(total) / 100.0 AS category_total
+                FROM monthly_rollups
+                WHERE type = ?
+                GROUP BY category
+                ORDER BY category_total DESC
+            """, (transaction_type,))
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"✗ Error calculating category totals: {e}")
+            return []
+
+    def get_monthly_totals(self):
+        """Get income and expense totals per month (YYYY-MM), oldest first."""
+        try:
+            self.cursor.execute("""
+                SELECT month,
+                       COALESCE(SUM(CASE WHEN type = 'income' THEN total END), 0) / 100.0,
+                       COALESCE(SUM(CASE WHEN type != 'income' THEN total END), 0) / 100.0
+                FROM monthly_rollups
+                GROUP BY month
+                ORDER BY month
+            """)
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"✗ Error calculating monthly totals: {e}")
+            return []
+
+    def get_snapshot_rows(self):
+        """Get all rollup and budget rows in one round-trip.
+
+        Rows are ``('rollup', month, type, category, total_cents)`` or
+        ``('budget', None, None, category, amount_cents)``.
+        """
+        try:
+            self.cursor.execute("""
+                SELECT 'rollup', month, type, NULLIF(category, ''), total
+                FROM monthly_rollups
+                UNION ALL
+                SELECT 'budget', NULL, NULL, category, amount_cents
+                FROM budgets
+            """)
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"✗ Error retrieving snapshot: {e}")
+            return []
+
+    def get_daily_net(self):
+        """Get (date, income minus expenses in centavos) per day, oldest first.
+
+        Reads only the covering (date, type, amount_cents) index.
+        """
+        try:
+            self.cursor.execute("""
+                SELECT date, SUM(CASE WHEN type = 'income' THEN amount_cents ELSE -amount_cents END)
+                FROM transactions
+                GROUP BY date
+                ORDER BY date
+            """)
+            return self.cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"✗ Error retrieving daily totals: {e}")
+            return []
+
+    def rebuild_rollups(self):
+        """Recompute monthly_rollups from the transactions table."""
+        try:
+            self._begin("rebuild_rollups")
+            self.cursor.execute("DELETE FROM monthly_rollups")
+            self.cursor.execute(f"""
+                INSERT INTO monthly_rollups (month, type, category, total, count)
+                {ROLLUP_SELECT}
+            """, (0,))
+            self._commit("rebuild_rollups")
+            return True
+        except sqlite3.Error as e:
+            self._rollback("rebuild_rollups")
+            print(f"✗ Error rebuilding rollups: {e}")
+            return False
+
     def delete_transaction(self, transaction_id):
         """Delete a transaction by ID."""
         try:
             self.cursor.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
-            self.connection.commit()
+            self._commit()
             return True
         except sqlite3.Error as e:
             print(f"✗ Error deleting transaction: {e}")
@@ -145,19 +1116,20 @@ class Database:
         try:
             updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.cursor.execute("""
-                INSERT OR REPLACE INTO budgets (category, amount, updated_at)
+                INSERT OR REPLACE INTO budgets (category, amount_cents, updated_at)
                 VALUES (?, ?, ?)
-            """, (category, amount, updated_at))
-            self.connection.commit()
+            """, (category, to_cents(amount), updated_at))
+            self._commit()
             return True
-        except sqlite3.Error as e:
+        except (sqlite3.Error, ValueError, OverflowError) as e:
+            self._rollback()
             print(f"✗ Error setting budget: {e}")
             return False
 
     def get_budgets(self):
         """Get all budgets."""
         try:
-            self.cursor.execute("SELECT category, amount FROM budgets")
+            self.cursor.execute("SELECT category, amount_cents / 100.0 FROM budgets")
             return self.cursor.fetchall()
         except sqlite3.Error as e:
             print(f"✗ Error retrieving budgets: {e}")
@@ -166,17 +1138,23 @@ class Database:
     def get_budget(self, category):
         """Get budget for a specific category."""
         try:
-            self.cursor.execute("SELECT amount FROM budgets WHERE category = ?", (category,))
+            self.cursor.execute("SELECT amount_cents / 100.0 FROM budgets WHERE category = ?", (category,))
             result = self.cursor.fetchone()
             return result[0] if result else None
         except sqlite3.Error as e:
             print(f"✗ Error retrieving budget: {e}")
             return None
 
+    def interrupt(self):
+        """Abort the statement running on this connection from another thread."""
+        if self.connection:
+            self.connection.interrupt()
+
     def close(self):
         """Close database connection."""
         if self.connection:
             self.connection.close()
+            self.connection = None
             print("✓ Database connection closed")
 
     def __del__(self):
@@ -1,8 +1,38 @@
 """Core expense manager for tracking and analysis."""
 
-from datetime import datetime
-from src.database import Database
-from src.transaction import Transaction
+import functools
+import importlib.util
+from contextlib import contextmanager
+from datetime import date, datetime
+from src.database import TransactionQuery
+from src.query_cache import QueryCache
+from src.storage import open_storage
+from src.transaction import (
+    MAX_AMOUNT, Transaction, TransactionBatch, from_cents, is_valid_amount, to_cents,
+)
+
+# pandas is only imported by ExpenseManager.to_dataframe
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+
+def cached(method):
+    """Serve repeated calls with the same arguments from the query cache."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        return self.cache.get_or_compute(key, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+
+def invalidates_cache(method):
+    """Drop cached query results after a write."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.cache.invalidate()
+    return wrapper
 
 
 class ExpenseManager:
@@ -20,14 +50,31 @@ class ExpenseManager:
         "Other",
     ]
 
-    def __init__(self, db_path="data/expenses.db"):
-        """Initialize expense manager."""
-        self.db = Database(db_path)
+    def __init__(self, db_path="data/expenses.db", profile="durable", cache_size=128):
+        """Initialize expense manager.
 
+        ``db_path`` is a database file or a storage URL such as
+        ``memory://`` (see src.storage). Summary and search results are
+        cached (``cache_size`` entries, 0 to disable) until the next write;
+        cached results must not be mutated.
+        """
+        self.db = open_storage(db_path, profile)
+        self.cache = QueryCache(cache_size, version_source=self.db.get_data_version)
+
+    @contextmanager
+    def transaction(self):
+        """Commit every write made in the block at once; see StorageBackend.transaction."""
+        try:
+            with self.db.transaction():
+                yield
+        finally:
+            self.cache.invalidate()
+
+    @invalidates_cache
     def add_income(self, amount, description):
         """Add income transaction."""
-        if amount <= 0:
-            print("✗ Amount must be greater than 0")
+        if not is_valid_amount(amount):
+            print(f"✗ Amount must be greater than 0 and at most {MAX_AMOUNT:,}")
             return False
 
         success = self.db.add_transaction("income", amount, "Salary/Income", description)
@@ -35,10 +82,11 @@ class ExpenseManager:
             print(f"✓ Income added: ${amount:.2f} - {description}")
         return success
 
+    @invalidates_cache
     def add_expense(self, amount, category, description):
         """Add expense transaction."""
-        if amount <= 0:
-            print("✗ Amount must be greater than 0")
+        if not is_valid_amount(amount):
+            print(f"✗ Amount must be greater than 0 and at most {MAX_AMOUNT:,}")
             return False
 
         if category not in self.EXPENSE_CATEGORIES:
@@ -50,11 +98,154 @@ class ExpenseManager:
             print(f"✓ Expense added: ${amount:.2f} ({category}) - {description}")
         return success
 
+    @invalidates_cache
+    def add_many(self, transactions, chunk_size=None):
+        """Add many transactions in one database transaction.
+
+        Each item is a ``Transaction`` or a ``(type, amount, category,
+        description[, date])`` tuple. Rows are validated before anything is
+        written; invalid rows are reported and skipped, the rest are inserted.
+
+        Returns ``(added, failures)`` where failures is a list of
+        ``(index, error_message)`` sorted by index. If the database rolls the
+        whole load back, every row is reported as a failure.
+        """
+        rows = []
+        positions = []
+        failures = []
+        for index, item in enumerate(transactions):
+            try:
+                rows.append(self._validate_row(item))
+                positions.append(index)
+            except (TypeError, ValueError) as e:
+                failures.append((index, str(e)))
+
+        added, db_failures = self.db.add_transactions_bulk(rows, chunk_size)
+        rolled_back = not added and len(db_failures) < len(rows)
+        if rolled_back:
+            reported = {i for i, _ in db_failures}
+            db_failures.extend(
+                (i, "Not added: the bulk insert was rolled back")
+                for i in range(len(rows)) if i not in reported
+            )
+        failures.extend((positions[i], message) for i, message in db_failures)
+        failures.sort()
+
+        if rolled_back:
+            print(f"✗ Could not add {len(rows)} transactions")
+        else:
+            print(f"✓ Added {added} transactions")
+        if failures:
+            print(f"✗ Skipped {len(failures)} invalid rows")
+        return added, failures
+
+    @invalidates_cache
+    def import_csv(self, path, progress=None, **options):
+        """Import transactions from a CSV or TSV file; see CSVImporter.
+
+        Returns the import summary, or None when the file cannot be read.
+        """
+        from src.csv_importer import CSVImporter
+
+        try:
+            summary = CSVImporter(self, progress=progress, **options).import_file(path)
+        except (OSError, ValueError) as e:
+            print(f"✗ Error importing {path}: {e}")
+            return None
+
+        print(
+            f"✓ Imported {summary['imported']} of {summary['read']} rows "
+            f"({summary['duplicates']} duplicates, {summary['invalid']} invalid)"
+        )
+        for line, message in summary["errors"]:
+            print(f"✗ Line {line}: {message}")
+        return summary
+
+    def _validate_row(self, item):
+        """Check a bulk row and return it as a database tuple."""
+        if isinstance(item, Transaction):
+            item = (item.transaction_type, item.amount, item.category, item.description, item.date)
+        if len(item) not in (4, 5):
+            raise ValueError("Expected (type, amount, category, description[, date])")
+
+        trans_type, amount, category, description = item[:4]
+        trans_date = item[4] if len(item) == 5 else None
+
+        if trans_type not in ("income", "expense"):
+            raise ValueError(f"Invalid type: {trans_type!r}")
+        amount = float(amount)
+        if not is_valid_amount(amount):
+            raise ValueError(f"Amount must be greater than 0 and at most {MAX_AMOUNT:,}")
+        if trans_type == "expense" and category not in self.EXPENSE_CATEGORIES:
+            raise ValueError(f"Invalid category: {category!r}")
+        if trans_type == "income" and not category:
+            category = "Salary/Income"
+        if trans_date is not None:
+            date.fromisoformat(trans_date)
+
+        return trans_type, amount, category, description, trans_date
+
+    def get_transaction(self, transaction_id):
+        """Get one transaction by id, or None."""
+        row = self.db.get_transaction(transaction_id)
+        return Transaction.from_tuple(row) if row else None
+
+    @property
+    def last_added_id(self):
+        """Id of the transaction most recently added with add_income/add_expense."""
+        return self.db.last_insert_id
+
     def get_all_transactions(self):
         """Get all transactions."""
         transactions = self.db.get_all_transactions()
         return [Transaction.from_tuple(t) for t in transactions]
 
+    def iter_transactions(self, transaction_type=None, category=None, start_date=None,
+                          end_date=None, batch_size=1000):
+        """Yield matching transactions one at a time, newest first."""
+        for row in self.db.iter_transactions(
+            transaction_type, category, start_date, end_date, batch_size
+        ):
+            yield Transaction.from_tuple(row)
+
+    def get_transactions_batch(self, transaction_type=None):
+        """Get transactions as a compact, columnar TransactionBatch."""
+        return TransactionBatch.from_rows(self.db.iter_transactions(transaction_type))
+
+    def to_dataframe(self, transaction_type=None, category=None, start_date=None,
+                     end_date=None, batch_size=50000):
+        """Get matching transactions as a pandas DataFrame, newest first.
+
+        Columns are id, date (datetime64), type and category (categorical),
+        amount (pesos), amount_cents and description. The frame is built
+        from column batches read straight off the cursor; no Transaction
+        objects are created. Returns None when pandas is not installed.
+        """
+        if not HAS_PANDAS:
+            print("✗ pandas not installed. Install with: pip install pandas")
+            return None
+        import pandas as pd
+
+        query = TransactionQuery(
+            transaction_type=transaction_type,
+            categories=None if category is None else (category,),
+            start_date=start_date,
+            end_date=end_date,
+        )
+        names = ("id", "date", "type", "amount_cents", "category", "description")
+        frames = [
+            pd.DataFrame(dict(zip(names, columns)))
+            for columns in self.db.iter_column_batches(query, batch_size)
+        ]
+        frame = (pd.concat(frames, ignore_index=True) if frames
+                 else pd.DataFrame({name: [] for name in names}))
+
+        frame = frame.astype({"id": "int64", "amount_cents": "int64",
+                              "type": "category", "category": "category"})
+        frame["date"] = pd.to_datetime(frame["date"], format="%Y-%m-%d")
+        frame.insert(3, "amount", frame["amount_cents"] / 100)
+        return frame
+
     def get_expenses(self):
         """Get all expenses."""
         transactions = self.db.get_transactions_by_type("expense")
@@ -75,6 +266,23 @@ class ExpenseManager:
         transactions = self.db.get_transactions_by_category(category)
         return [Transaction.from_tuple(t) for t in transactions]
 
+    @cached
+    def find_transactions(self, query):
+        """Get transactions matching a TransactionQuery."""
+        return [Transaction.from_tuple(t) for t in self.db.find_transactions(query)]
+
+    @cached
+    def count_transactions(self, query):
+        """Count transactions matching a TransactionQuery, ignoring paging."""
+        return self.db.count_transactions(query)
+
+    @cached
+    def search_descriptions(self, query, limit=None):
+        """Search transactions by description, best matches first."""
+        transactions = self.db.search_descriptions(query, limit)
+        return [Transaction.from_tuple(t) for t in transactions]
+
+    @invalidates_cache
     def delete_transaction(self, transaction_id):
         """Delete a transaction."""
         success = self.db.delete_transaction(transaction_id)
@@ -82,52 +290,52 @@ class ExpenseManager:
             print(f"✓ Transaction {transaction_id} deleted")
         return success
 
+    @cached
     def calculate_total_income(self, transactions=None):
         """Calculate total income."""
         if transactions is None:
-            transactions = self.get_income()
+            return self.db.get_total_by_type("income")
         return sum(t.amount for t in transactions)
 
+    @cached
     def calculate_total_expenses(self, transactions=None):
         """Calculate total expenses."""
         if transactions is None:
-            transactions = self.get_expenses()
+            return self.db.get_total_by_type("expense")
         return sum(t.amount for t in transactions)
 
+    @cached
     def calculate_balance(self):
         """Calculate current balance (income - expenses)."""
-        income = self.calculate_total_income()
-        expenses = self.calculate_total_expenses()
-        return income - expenses
+        totals = self.db.get_totals_by_type()
+        return from_cents(to_cents(totals.get("income", 0)) - to_cents(totals.get("expense", 0)))
 
+    @cached
     def get_expenses_by_category_summary(self):
         """Get summary of expenses by category."""
-        expenses = self.get_expenses()
-        summary = {}
-        for expense in expenses:
-            summary[expense.category] = summary.get(expense.category, 0) + expense.amount
-        return dict(sorted(summary.items(), key=lambda x: x[1], reverse=True))
+        return dict(self.db.get_category_totals("expense"))
 
+    @cached
     def get_monthly_summary(self):
         """Get summary grouped by month."""
-        transactions = self.get_all_transactions()
-        summary = {}
-        for transaction in transactions:
-            month = transaction.date[:7]  # YYYY-MM
-            if month not in summary:
-                summary[month] = {"income": 0, "expense": 0}
-
-            if transaction.transaction_type == "income":
-                summary[month]["income"] += transaction.amount
-            else:
-                summary[month]["expense"] += transaction.amount
+        return {
+            month: {"income": income, "expense": expense}
+            for month, income, expense in self.db.get_monthly_totals()
+        }
 
-        return dict(sorted(summary.items()))
+    @invalidates_cache
+    def rebuild_rollups(self):
+        """Recompute the monthly summary table from all transactions."""
+        success = self.db.rebuild_rollups()
+        if success:
+            print("✓ Monthly rollups rebuilt")
+        return success
 
+    @invalidates_cache
     def set_budget(self, category, amount):
         """Set budget for a category."""
-        if amount <= 0:
-            print("✗ Budget amount must be greater than 0")
+        if not is_valid_amount(amount):
+            print(f"✗ Budget amount must be greater than 0 and at most {MAX_AMOUNT:,}")
             return False
 
         success = self.db.set_budget(category, amount)
@@ -135,19 +343,24 @@ class ExpenseManager:
             print(f"✓ Budget set for {category}: ${amount:.2f}")
         return success
 
+    @cached
     def get_budget(self, category):
         """Get budget for a category."""
         return self.db.get_budget(category)
 
+    @cached
     def check_budget_status(self):
         """Check spending against budgets."""
-        budgets = self.db.get_budgets()
-        expenses_by_category = self.get_expenses_by_category_summary()
+        return self._budget_status(self.db.get_budgets(), self.get_expenses_by_category_summary())
+
+    @staticmethod
+    def _budget_status(budgets, expenses_by_category):
+        """Compare (category, budget) pairs with spending per category."""
         status = {}
 
         for category, budget_amount in budgets:
             spent = expenses_by_category.get(category, 0)
-            remaining = budget_amount - spent
+            remaining = from_cents(to_cents(budget_amount) - to_cents(spent))
             percentage = (spent / budget_amount * 100) if budget_amount > 0 else 0
 
             status[category] = {
@@ -159,6 +372,47 @@ class ExpenseManager:
 
         return status
 
+    @cached
+    def get_snapshot(self):
+        """Get every dashboard figure from one query.
+
+        Returns a dict with ``income``, ``expenses``, ``balance``,
+        ``categories`` (as get_expenses_by_category_summary), ``monthly``
+        (as get_monthly_summary) and ``budgets`` (as check_budget_status).
+        """
+        totals = {}
+        categories = {}
+        monthly = {}
+        budgets = []
+
+        for kind, month, trans_type, category, cents in self.db.get_snapshot_rows():
+            if kind == "budget":
+                budgets.append((category, from_cents(cents)))
+                continue
+            totals[trans_type] = totals.get(trans_type, 0) + cents
+            if trans_type == "expense":
+                categories[category] = categories.get(category, 0) + cents
+            month_totals = monthly.setdefault(month, {"income": 0, "expense": 0})
+            month_totals["income" if trans_type == "income" else "expense"] += cents
+
+        income = totals.get("income", 0)
+        expenses = totals.get("expense", 0)
+        categories = {
+            category: from_cents(cents)
+            for category, cents in sorted(categories.items(), key=lambda x: x[1], reverse=True)
+        }
+        return {
+            "income": from_cents(income),
+            "expenses": from_cents(expenses),
+            "balance": from_cents(income - expenses),
+            "categories": categories,
+            "monthly": {
+                month: {key: from_cents(value) for key, value in month_totals.items()}
+                for month, month_totals in sorted(monthly.items())
+            },
+            "budgets": self._budget_status(budgets, categories),
+        }
+
     def close(self):
         """Close database connection."""
         self.db.close()
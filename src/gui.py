@@ -8,17 +8,23 @@ from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
 from src.expense_manager import ExpenseManager
 from src.report_generator import ReportGenerator
-from src.visualizer import Visualizer
+from src.visualizer import HAS_MATPLOTLIB, Visualizer
 from src.advanced_features import (
     SpendingAnalytics,
     TransactionSearch,
     BudgetAlert,
 )
+from src.background import BackgroundLoader
+from src.database import TransactionQuery
+from src.virtual_list import VirtualTransactionList
 
 
 class ExpenseTrackerGUI:
     """Main GUI application for Expense Tracker."""
 
+    SEARCH_PAGE_SIZE = 500
+    SEARCH_DEBOUNCE_MS = 250
+
     def __init__(self, root):
         """Initialize the GUI application."""
         self.root = root
@@ -30,9 +36,12 @@ class ExpenseTrackerGUI:
         self.em = ExpenseManager()
         self.rg = ReportGenerator(self.em)
         self.visualizer = Visualizer(self.em)
-        self.analytics = SpendingAnalytics(self.em)
-        self.search = TransactionSearch(self.em)
-        self.budget_alert = BudgetAlert(self.em)
+
+        # Reads for lists, budgets, analytics and search run off the Tk thread
+        self.loader = BackgroundLoader(
+            self.root, self.em.db.db_path, on_busy_change=self.set_loading
+        )
+        self.importer = None
 
         # Configure styles
         self.setup_styles()
@@ -64,6 +73,8 @@ class ExpenseTrackerGUI:
         title = ttk.Label(header, text="💰 Expense Tracker Dashboard", style="Title.TLabel")
         title.pack(side=tk.LEFT)
 
+        self.loading_bar = ttk.Progressbar(header, mode="indeterminate", length=120)
+
         # Main container with notebook (tabs)
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -101,6 +112,15 @@ class ExpenseTrackerGUI:
             footer, text="Built with Python | Powered by Pandas & SQLite", foreground="#666"
         ).pack(side=tk.LEFT)
 
+    def set_loading(self, busy):
+        """Show or hide the loading indicator."""
+        if busy:
+            self.loading_bar.pack(side=tk.RIGHT)
+            self.loading_bar.start(15)
+        else:
+            self.loading_bar.stop()
+            self.loading_bar.pack_forget()
+
     def create_dashboard_tab(self):
         """Create dashboard tab with summary and charts."""
         # Summary section
@@ -109,8 +129,31 @@ class ExpenseTrackerGUI:
         )
         summary_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        # Create summary display
-        self.update_summary()
+        # Value labels are created once and updated in place by update_summary
+        self.summary_labels = {}
+        summary_items = [
+            ("income", "Total Income", "#2ecc71"),
+            ("expenses", "Total Expenses", "#e74c3c"),
+            ("balance", "Balance", "#3498db"),
+        ]
+        for key, label, color in summary_items:
+            item_frame = ttk.Frame(summary_frame)
+            item_frame.pack(fill=tk.X, pady=5)
+
+            ttk.Label(item_frame, text=label, font=("Arial", 11)).pack(side=tk.LEFT)
+            value_label = ttk.Label(
+                item_frame, font=("Arial", 13, "bold"), foreground=color
+            )
+            value_label.pack(side=tk.RIGHT)
+            self.summary_labels[key] = value_label
+
+            # Add edit button for income
+            if key == "income":
+                edit_btn = ttk.Button(
+                    item_frame, text="✏️ Edit", width=8,
+                    command=self.edit_income
+                )
+                edit_btn.pack(side=tk.RIGHT, padx=5)
 
         # Chart section
         chart_frame = ttk.LabelFrame(
@@ -121,6 +164,10 @@ class ExpenseTrackerGUI:
         self.chart_canvas_frame = ttk.Frame(chart_frame)
         self.chart_canvas_frame.pack(fill=tk.BOTH, expand=True)
 
+        # matplotlib is slow to import, so the chart is built after the window shows
+        self.dashboard_chart = None
+        self.root.after_idle(self.create_dashboard_chart)
+
         # Refresh button
         refresh_frame = ttk.Frame(self.dashboard_tab)
         refresh_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -128,50 +175,30 @@ class ExpenseTrackerGUI:
             refresh_frame, text="🔄 Refresh Dashboard", command=self.refresh_dashboard
         ).pack(side=tk.LEFT)
 
-    def update_summary(self):
-        """Update financial summary display."""
-        # Clear existing widgets
-        for widget in self.dashboard_tab.winfo_children():
-            if isinstance(widget, ttk.LabelFrame) and "Summary" in widget.cget("text"):
-                for child in widget.winfo_children():
-                    child.destroy()
-                break
-
-        # Get summary data
-        income = self.em.calculate_total_income()
-        expenses = self.em.calculate_total_expenses()
-        balance = self.em.calculate_balance()
-
-        # Create summary frame
-        summary_frame = ttk.LabelFrame(
-            self.dashboard_tab, text="Financial Summary", padding=10
-        )
-        summary_frame.pack(fill=tk.X, padx=10, pady=10)
+        self.update_summary()
 
-        # Summary items
-        summary_data = [
-            ("Total Income", f"₱{income:,.2f}", "#2ecc71"),
-            ("Total Expenses", f"₱{expenses:,.2f}", "#e74c3c"),
-            ("Balance", f"₱{balance:,.2f}", "#3498db"),
-        ]
+    def create_dashboard_chart(self):
+        """Embed the live expense chart in the dashboard."""
+        if not HAS_MATPLOTLIB:
+            ttk.Label(
+                self.chart_canvas_frame,
+                text="Install matplotlib to see the expense chart",
+                foreground="#666",
+            ).pack(pady=20)
+            return
+        from src.dashboard_chart import DashboardChart
 
-        for label, value, color in summary_data:
-            item_frame = ttk.Frame(summary_frame)
-            item_frame.pack(fill=tk.X, pady=5)
+        self.dashboard_chart = DashboardChart(self.chart_canvas_frame, self.em.EXPENSE_CATEGORIES)
+        self.dashboard_chart.update(self.em.get_snapshot()["categories"])
 
-            ttk.Label(item_frame, text=label, font=("Arial", 11)).pack(side=tk.LEFT)
-            value_label = ttk.Label(
-                item_frame, text=value, font=("Arial", 13, "bold"), foreground=color
-            )
-            value_label.pack(side=tk.RIGHT)
-            
-            # Add edit button for income
-            if "Income" in label and "Total" in label:
-                edit_btn = ttk.Button(
-                    item_frame, text="✏️ Edit", width=8,
-                    command=self.edit_income
-                )
-                edit_btn.pack(side=tk.RIGHT, padx=5)
+    def update_summary(self):
+        """Update financial summary display and the dashboard chart."""
+        snapshot = self.em.get_snapshot()
+        for key, value_label in self.summary_labels.items():
+            value_label.config(text=f"₱{snapshot[key]:,.2f}")
+
+        if self.dashboard_chart is not None:
+            self.dashboard_chart.update(snapshot["categories"])
 
     def create_add_expense_tab(self):
         """Create tab for adding expenses and income."""
@@ -291,9 +318,11 @@ class ExpenseTrackerGUI:
                 return
 
             if trans_type == "expense":
-                self.em.add_expense(amount, category, description)
+                added = self.em.add_expense(amount, category, description)
             else:
-                self.em.add_income(amount, description)
+                added = self.em.add_income(amount, description)
+            if added:
+                self.transactions_list.add(self.em.get_transaction(self.em.last_added_id))
 
             messagebox.showinfo("Success", "✓ Transaction added successfully!")
             self.clear_form()
@@ -345,25 +374,9 @@ class ExpenseTrackerGUI:
         )
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Create treeview
-        columns = ("ID", "Date", "Type", "Category", "Amount", "Description")
-        self.transactions_tree = ttk.Treeview(
-            list_frame, columns=columns, height=15, show="headings"
-        )
-
-        # Define column headings
-        for col in columns:
-            self.transactions_tree.heading(col, text=col)
-            self.transactions_tree.column(col, width=100)
-
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(
-            list_frame, orient=tk.VERTICAL, command=self.transactions_tree.yview
-        )
-        self.transactions_tree.configure(yscroll=scrollbar.set)
-
-        self.transactions_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Rows are fetched a page at a time as the list scrolls
+        self.transactions_list = VirtualTransactionList(list_frame, self.loader, "transactions")
+        self.transactions_list.pack(fill=tk.BOTH, expand=True)
 
         # Delete button
         button_frame = ttk.Frame(self.transactions_tab)
@@ -378,48 +391,22 @@ class ExpenseTrackerGUI:
         self.update_transactions_list()
 
     def update_transactions_list(self):
-        """Update the transactions list."""
-        # Clear existing items
-        for item in self.transactions_tree.get_children():
-            self.transactions_tree.delete(item)
-
-        # Get transactions based on filter
-        filter_type = self.filter_var.get()
-        if filter_type == "all":
-            transactions = self.em.get_all_transactions()
-        elif filter_type == "income":
-            transactions = self.em.get_income()
-        else:
-            transactions = self.em.get_expenses()
-
-        # Add transactions to tree
-        for t in transactions:
-            self.transactions_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    t.transaction_id,
-                    t.date,
-                    t.transaction_type.upper(),
-                    t.category,
-                    f"₱{t.amount:.2f}",
-                    t.description[:30],
-                ),
-            )
+        """Reload the transactions list from the top."""
+        query = TransactionQuery()
+        if self.filter_var.get() != "all":
+            query = query.of_type(self.filter_var.get())
+        self.transactions_list.load(query)
 
     def delete_transaction(self):
         """Delete selected transaction."""
-        selected = self.transactions_tree.selection()
-        if not selected:
+        transaction_id = self.transactions_list.selected_id()
+        if transaction_id is None:
             messagebox.showwarning("Warning", "Please select a transaction to delete")
             return
 
-        item = self.transactions_tree.item(selected[0])
-        transaction_id = item["values"][0]
-
         if messagebox.askyesno("Confirm", "Delete this transaction?"):
-            self.em.delete_transaction(transaction_id)
-            self.update_transactions_list()
+            if self.em.delete_transaction(transaction_id):
+                self.transactions_list.remove(transaction_id)
             self.refresh_dashboard()
             messagebox.showinfo("Success", "✓ Transaction deleted")
 
@@ -437,6 +424,9 @@ class ExpenseTrackerGUI:
         ttk.Button(
             button_frame, text="📄 Export PDF", command=self.export_pdf
         ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame, text="📥 Import CSV", command=self.import_csv
+        ).pack(side=tk.LEFT, padx=5)
 
         # Report display area
         self.report_frame = ttk.Frame(self.reports_tab)
@@ -462,19 +452,32 @@ class ExpenseTrackerGUI:
     def generate_charts(self):
         """Generate and display charts."""
         try:
-            self.visualizer.generate_all_charts()
-            messagebox.showinfo("Success", "✓ Charts saved to reports/ folder")
+            timings = self.visualizer.generate_all_charts()
+            if not timings:
+                messagebox.showerror("Error", "No charts generated")
+                return
+            rendered = sum(1 for seconds in timings.values() if seconds)
+            messagebox.showinfo(
+                "Success",
+                f"✓ Charts saved to reports/ folder "
+                f"({rendered} rendered, {len(timings) - rendered} unchanged)",
+            )
         except Exception as e:
             messagebox.showerror("Error", f"Error generating charts: {e}")
 
     def export_csv(self):
         """Export to CSV."""
         filename = filedialog.asksaveasfilename(
-            defaultextension=".csv", filetypes=[("CSV files", "*.csv")]
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("Gzipped CSV files", "*.csv.gz")],
         )
         if filename:
-            self.rg.export_to_csv(filename)
-            messagebox.showinfo("Success", f"✓ Exported to {filename}")
+            if self.rg.export_to_csv(filename):
+                messagebox.showinfo(
+                    "Success", f"✓ Exported {self.rg.last_export['rows']:,} rows to {filename}"
+                )
+            else:
+                messagebox.showerror("Error", "Failed to export CSV")
 
     def export_pdf(self):
         """Export to PDF."""
@@ -487,6 +490,68 @@ class ExpenseTrackerGUI:
             else:
                 messagebox.showerror("Error", "Failed to export PDF")
 
+    def import_csv(self):
+        """Import a CSV/TSV file in the background with a progress dialog."""
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("TSV files", "*.tsv"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+
+        # Imports write, so they get their own worker with a read-write connection
+        if self.importer is None:
+            db_path = self.em.db.db_path
+            self.importer = BackgroundLoader(
+                self.root, db_path, manager_factory=lambda: ExpenseManager(db_path)
+            )
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Importing")
+        dialog.geometry("360x110")
+        dialog.resizable(False, False)
+        status = ttk.Label(dialog, text=f"Importing {filename}...")
+        status.pack(pady=10)
+        bar = ttk.Progressbar(dialog, mode="determinate", length=320, maximum=100)
+        bar.pack(pady=5)
+
+        progress = {"fraction": 0.0, "imported": 0}
+
+        def report(done, total, imported):
+            # Runs on the worker thread; the dialog reads it from poll()
+            progress.update(fraction=done / total if total else 1.0, imported=imported)
+
+        def poll():
+            if not dialog.winfo_exists():
+                return
+            bar["value"] = progress["fraction"] * 100
+            status.config(text=f"Imported {progress['imported']:,} rows")
+            dialog.after(100, poll)
+
+        def finished(summary):
+            dialog.destroy()
+            if summary is None:
+                messagebox.showerror("Error", f"Could not import {filename}")
+                return
+            message = (
+                f"✓ Imported {summary['imported']:,} of {summary['read']:,} rows\n"
+                f"{summary['duplicates']:,} duplicates, {summary['invalid']:,} invalid"
+            )
+            if summary["errors"]:
+                line, error = summary["errors"][0]
+                message += f"\n\nFirst problem (line {line}): {error}"
+            messagebox.showinfo("Import Complete", message)
+            self.update_transactions_list()
+            self.refresh_dashboard()
+
+        def failed(error):
+            dialog.destroy()
+            messagebox.showerror("Error", f"Import failed: {error}")
+
+        poll()
+        self.importer.submit(
+            "import", lambda em: em.import_csv(filename, progress=report), finished, failed
+        )
+
     def create_budget_tab(self):
         """Create budget management tab."""
         # Set budget frame
@@ -558,10 +623,15 @@ class ExpenseTrackerGUI:
 
     def update_budget_status(self):
         """Update budget status display."""
+        self.loader.submit(
+            "budget_status", lambda em: em.get_snapshot()["budgets"], self.show_budget_status
+        )
+
+    def show_budget_status(self, budget_status):
+        """Fill the budget status list."""
         for item in self.budget_tree.get_children():
             self.budget_tree.delete(item)
 
-        budget_status = self.em.check_budget_status()
         if not budget_status:
             return
 
@@ -581,18 +651,47 @@ class ExpenseTrackerGUI:
     def refresh_dashboard(self):
         """Refresh the dashboard."""
         self.update_summary()
-        self.update_transactions_list()
         self.update_budget_status()
 
     def create_analytics_tab(self):
         """Create analytics and insights tab."""
         # Analytics summary
-        summary_frame = ttk.LabelFrame(self.analytics_tab, text="Spending Analytics", padding=10)
-        summary_frame.pack(fill=tk.X, padx=10, pady=10)
+        self.analytics_summary_frame = ttk.LabelFrame(
+            self.analytics_tab, text="Spending Analytics", padding=10
+        )
+        self.analytics_summary_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        # Get analytics data
-        trends = self.analytics.get_category_trends()
-        savings_rate = self.analytics.get_savings_rate()
+        # Spending forecast
+        self.forecast_frame = ttk.LabelFrame(
+            self.analytics_tab, text="Spending Forecast (Next 3 Months)", padding=10
+        )
+        self.forecast_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Budget alerts
+        self.alert_frame = ttk.LabelFrame(self.analytics_tab, text="Budget Alerts", padding=10)
+        self.alert_frame.pack(fill=tk.X, padx=10, pady=10)
+
+        ttk.Label(self.analytics_summary_frame, text="Loading...", foreground="#666").pack()
+
+        def load(em):
+            analytics = SpendingAnalytics(em)
+            return {
+                "trends": analytics.get_category_trends(),
+                "savings_rate": analytics.get_savings_rate(),
+                "forecast": analytics.get_spending_forecast(),
+                "alert_summary": BudgetAlert(em).get_alert_summary(),
+            }
+
+        self.loader.submit("analytics", load, self.show_analytics)
+
+    def show_analytics(self, data):
+        """Fill the analytics tab."""
+        for frame in (self.analytics_summary_frame, self.forecast_frame, self.alert_frame):
+            for child in frame.winfo_children():
+                child.destroy()
+
+        trends = data["trends"]
+        savings_rate = data["savings_rate"]
 
         analytics_data = [
             ("Savings Rate", f"{savings_rate}%"),
@@ -602,21 +701,17 @@ class ExpenseTrackerGUI:
         ]
 
         for label, value in analytics_data:
-            item_frame = ttk.Frame(summary_frame)
+            item_frame = ttk.Frame(self.analytics_summary_frame)
             item_frame.pack(fill=tk.X, pady=5)
             ttk.Label(item_frame, text=label, font=("Arial", 11)).pack(side=tk.LEFT)
             ttk.Label(
                 item_frame, text=value, font=("Arial", 12, "bold"), foreground="#3498db"
             ).pack(side=tk.RIGHT)
 
-        # Spending forecast
-        forecast_frame = ttk.LabelFrame(self.analytics_tab, text="Spending Forecast (Next 3 Months)", padding=10)
-        forecast_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        forecast = self.analytics.get_spending_forecast()
+        forecast = data["forecast"]
         if forecast:
             forecast_tree = ttk.Treeview(
-                forecast_frame, columns=("Month", "Forecasted Expense"), height=8, show="headings"
+                self.forecast_frame, columns=("Month", "Forecasted Expense"), height=8, show="headings"
             )
             forecast_tree.heading("Month", text="Month")
             forecast_tree.heading("Forecasted Expense", text="Forecasted Expense")
@@ -632,19 +727,15 @@ class ExpenseTrackerGUI:
 
             forecast_tree.pack(fill=tk.BOTH, expand=True)
 
-        # Budget alerts
-        alert_frame = ttk.LabelFrame(self.analytics_tab, text="Budget Alerts", padding=10)
-        alert_frame.pack(fill=tk.X, padx=10, pady=10)
-
-        alert_summary = self.budget_alert.get_alert_summary()
+        alert_summary = data["alert_summary"]
         alert_text = f"Total Alerts: {alert_summary['total_alerts']} | "
         alert_text += f"Warnings: {alert_summary['warnings']} | "
         alert_text += f"Critical: {alert_summary['critical']}"
         
-        ttk.Label(alert_frame, text=alert_text, font=("Arial", 10)).pack(fill=tk.X)
+        ttk.Label(self.alert_frame, text=alert_text, font=("Arial", 10)).pack(fill=tk.X)
 
         if alert_summary["alerts"]:
-            alerts_display = ttk.Frame(alert_frame)
+            alerts_display = ttk.Frame(self.alert_frame)
             alerts_display.pack(fill=tk.BOTH, expand=True, pady=10)
 
             for alert in alert_summary["alerts"]:
@@ -657,6 +748,9 @@ class ExpenseTrackerGUI:
 
     def create_search_tab(self):
         """Create search and filter tab."""
+        self.search_after_id = None
+        self.worker_search = None  # TransactionSearch owned by the loader thread
+
         # Search options
         search_frame = ttk.LabelFrame(self.search_tab, text="Search Transactions", padding=10)
         search_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -706,26 +800,26 @@ class ExpenseTrackerGUI:
 
         search_frame.columnconfigure(1, weight=1)
 
+        # Search as you type, once typing pauses
+        self.search_desc_entry.bind(
+            "<KeyRelease>", lambda e: self.schedule_search(self.live_description_search)
+        )
+        for entry in (self.search_min_entry, self.search_max_entry):
+            entry.bind("<KeyRelease>", lambda e: self.schedule_search(self.live_amount_search))
+        for entry in (self.search_from_entry, self.search_to_entry):
+            entry.bind("<KeyRelease>", lambda e: self.schedule_search(self.live_date_search))
+
         # Results
         results_frame = ttk.LabelFrame(self.search_tab, text="Search Results", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        columns = ("ID", "Date", "Type", "Category", "Amount", "Description")
-        self.search_tree = ttk.Treeview(
-            results_frame, columns=columns, height=15, show="headings"
-        )
-
-        for col in columns:
-            self.search_tree.heading(col, text=col)
-            self.search_tree.column(col, width=100)
+        self.search_count_label = ttk.Label(results_frame, text="", foreground="#666")
+        self.search_count_label.pack(fill=tk.X)
 
-        scrollbar = ttk.Scrollbar(
-            results_frame, orient=tk.VERTICAL, command=self.search_tree.yview
+        self.search_list = VirtualTransactionList(
+            results_frame, self.loader, "search", page_size=self.SEARCH_PAGE_SIZE
         )
-        self.search_tree.configure(yscroll=scrollbar.set)
-
-        self.search_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.search_list.pack(fill=tk.BOTH, expand=True)
 
     def search_by_description(self):
         """Search transactions by description."""
@@ -734,16 +828,14 @@ class ExpenseTrackerGUI:
             messagebox.showwarning("Warning", "Please enter a search term")
             return
 
-        results = self.search.search_by_description(query)
-        self.display_search_results(results)
+        self.run_search(TransactionSearch.description_query(query))
 
     def search_by_amount(self):
         """Search transactions by amount range."""
         try:
             min_amt = float(self.search_min_entry.get()) if self.search_min_entry.get() else 0
             max_amt = float(self.search_max_entry.get()) if self.search_max_entry.get() else float('inf')
-            results = self.search.search_by_amount_range(min_amt, max_amt)
-            self.display_search_results(results)
+            self.run_search(TransactionSearch.amount_range_query(min_amt, max_amt))
         except ValueError:
             messagebox.showerror("Error", "Please enter valid amounts")
 
@@ -756,33 +848,77 @@ class ExpenseTrackerGUI:
             messagebox.showwarning("Warning", "Please enter both dates")
             return
 
-        results = self.search.search_by_date_range(from_date, to_date)
-        self.display_search_results(results)
+        self.run_search(TransactionSearch.date_range_query(from_date, to_date))
+
+    def schedule_search(self, search):
+        """Restart the debounce timer and abort the search in progress."""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_list.cancel(interrupt=True)
+        self.search_after_id = self.root.after(self.SEARCH_DEBOUNCE_MS, search)
+
+    def live_description_search(self):
+        """Search descriptions for the text typed so far."""
+        self.search_after_id = None
+        text = self.search_desc_entry.get().strip()
+        if not text:
+            self.search_list.clear()
+            self.search_count_label.config(text="")
+            return
 
-    def display_search_results(self, results):
-        """Display search results in the tree."""
-        for item in self.search_tree.get_children():
-            self.search_tree.delete(item)
+        page_size = self.SEARCH_PAGE_SIZE
 
-        if not results:
-            messagebox.showinfo("Results", "No transactions found")
-            return
+        def load(em):
+            if self.worker_search is None:
+                self.worker_search = TransactionSearch(em, page_size=page_size)
+            results = self.worker_search.search_as_you_type(text)
+            return results, self.worker_search.count_last()
 
-        for t in results:
-            self.search_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    t.transaction_id,
-                    t.date,
-                    t.transaction_type.upper(),
-                    t.category,
-                    f"₱{t.amount:.2f}",
-                    t.description[:30],
-                ),
-            )
+        query = TransactionSearch.description_query(text)
+        self.search_count_label.config(text="Searching...")
+        self.loader.submit(
+            "search", load, lambda data: self.show_live_results(query, *data), interrupt=True
+        )
+
+    def show_live_results(self, query, results, total):
+        """Show the first page of a live search."""
+        self.search_list.load(query, rows=results)
+        self.show_search_count(total)
+
+    def live_amount_search(self):
+        """Search by amount range once the typed amounts are valid."""
+        self.search_after_id = None
+        try:
+            min_amt = float(self.search_min_entry.get()) if self.search_min_entry.get() else 0
+            max_amt = float(self.search_max_entry.get()) if self.search_max_entry.get() else float('inf')
+        except ValueError:
+            return
+        self.run_search(TransactionSearch.amount_range_query(min_amt, max_amt))
 
-        messagebox.showinfo("Results", f"Found {len(results)} transaction(s)")
+    def live_date_search(self):
+        """Search by date range once both typed dates are complete."""
+        self.search_after_id = None
+        from_date = self.search_from_entry.get()
+        to_date = self.search_to_entry.get()
+        try:
+            datetime.strptime(from_date, "%Y-%m-%d")
+            datetime.strptime(to_date, "%Y-%m-%d")
+        except ValueError:
+            return
+        self.run_search(TransactionSearch.date_range_query(from_date, to_date))
+
+    def run_search(self, query):
+        """Show a search in the results list and count its matches in the background."""
+        self.search_list.load(query)
+        self.search_count_label.config(text="Searching...")
+        self.loader.submit("search_count", lambda em: em.count_transactions(query), self.show_search_count)
+
+    def show_search_count(self, total):
+        """Show the number of matches of the current search."""
+        if not total:
+            self.search_count_label.config(text="No transactions found")
+            return
+        self.search_count_label.config(text=f"Found {total} transaction(s)")
 
     def edit_income(self):
         """Open dialog to add quick income."""
@@ -814,7 +950,8 @@ class ExpenseTrackerGUI:
                 if amount <= 0:
                     messagebox.showerror("Error", "Amount must be greater than 0")
                     return
-                self.em.add_income(amount, description)
+                if self.em.add_income(amount, description):
+                    self.transactions_list.add(self.em.get_transaction(self.em.last_added_id))
                 messagebox.showinfo("Success", f"✓ Added ₱{amount:,.2f} income")
                 self.refresh_dashboard()
                 dialog.destroy()
@@ -826,6 +963,9 @@ class ExpenseTrackerGUI:
 
     def on_closing(self):
         """Handle window closing."""
+        self.loader.shutdown()
+        if self.importer is not None:
+            self.importer.shutdown()
         self.em.close()
         self.root.destroy()
 
@@ -3,7 +3,7 @@
 import sys
 from colorama import Fore, Back, Style, init
 from src.expense_manager import ExpenseManager
-from src.report_generator import ReportGenerator
+from src.report_generator import ReportGenerator, tabulate
 from src.visualizer import Visualizer
 
 # Initialize colorama for colored terminal output
@@ -63,12 +63,15 @@ Type 'help' for available commands.
 
 {Fore.YELLOW}Visualization & Export:{Style.RESET_ALL}
   visualize                    Generate and show charts
-  export-csv <filename>        Export to CSV
+  export-csv <filename>        Export to CSV (.gz compresses)
   export-pdf <filename>        Export to PDF
+  export-columnar <filename>   Export to Parquet/Feather/npz
+  import-csv <filename>        Import transactions from CSV/TSV
 
 {Fore.YELLOW}Utility:{Style.RESET_ALL}
   help                         Show this help message
   categories                   Show available categories
+  rebuild-rollups              Recompute cached monthly totals
   clear                        Clear screen
   exit                         Exit application
 
@@ -182,6 +185,18 @@ Type 'help' for available commands.
                 filename = parts[1]
                 self.rg.export_to_pdf(filename)
 
+            elif cmd == "export-columnar":
+                if len(parts) < 2:
+                    print(f"{Fore.RED}✗ Usage: export-columnar <filename>{Style.RESET_ALL}")
+                    return
+                self.rg.export_columnar(parts[1])
+
+            elif cmd == "import-csv":
+                if len(parts) < 2:
+                    print(f"{Fore.RED}✗ Usage: import-csv <filename>{Style.RESET_ALL}")
+                    return
+                self.em.import_csv(parts[1])
+
             # Utility
             elif cmd == "help":
                 self.display_help()
@@ -189,6 +204,9 @@ Type 'help' for available commands.
             elif cmd == "categories":
                 self.display_categories()
 
+            elif cmd == "rebuild-rollups":
+                self.em.rebuild_rollups()
+
             elif cmd == "clear":
                 import os
 
@@ -212,8 +230,6 @@ Type 'help' for available commands.
             print(f"{Fore.YELLOW}No transactions found.{Style.RESET_ALL}\n")
             return
 
-        from tabulate import tabulate
-
         headers = ["ID", "Date", "Type", "Category", "Amount", "Description"]
         rows = [
             [
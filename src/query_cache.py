@@ -0,0 +1,77 @@
+"""Query result cache for expense tracker."""
+
+from collections import OrderedDict
+
+
+class QueryCache:
+    """Bounded LRU cache of query results, invalidated by a data version.
+
+    ``invalidate`` bumps the version and drops every entry; callers do this
+    on each write. ``version_source`` is an optional callable that reports an
+    external version (e.g. SQLite's ``PRAGMA data_version``) so that writes
+    made through other connections also invalidate the cache.
+    """
+
+    def __init__(self, max_entries=128, version_source=None):
+        """Initialize cache."""
+        self.max_entries = max_entries
+        self.version_source = version_source
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._external_version = None
+
+    def get_or_compute(self, key, compute):
+        """Return the cached result for key, computing and storing it on a miss."""
+        if self.max_entries <= 0:
+            return compute()
+        try:
+            hash(key)
+        except TypeError:
+            return compute()
+
+        self._check_external_version()
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        result = compute()
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        """Drop all entries and bump the data version."""
+        self.version += 1
+        self._entries.clear()
+
+    def current_version(self):
+        """Get the data version, first checking the external source."""
+        self._check_external_version()
+        return self.version
+
+    def _check_external_version(self):
+        """Invalidate when the external data version has moved."""
+        if self.version_source is None:
+            return
+        external = self.version_source()
+        if external != self._external_version:
+            if self._external_version is not None:
+                self.invalidate()
+            self._external_version = external
+
+    def stats(self):
+        """Get hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "version": self.version,
+        }
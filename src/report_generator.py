@@ -1,37 +1,81 @@
 """Report generation module."""
 
 import csv
+import gzip
+import importlib.util
+import io
+import itertools
+import time
 from datetime import datetime
 
-try:
-    from tabulate import tabulate
-except ImportError:
-    # Fallback if tabulate not installed (for GUI-only usage)
-    def tabulate(data, headers=None, tablefmt=None):
-        """Simple table formatter fallback."""
-        if not data:
-            return ""
-        lines = []
-        if headers:
-            lines.append(" | ".join(headers))
-            lines.append("-" * (sum(len(h) for h in headers) + len(headers) * 2))
-        for row in data:
-            lines.append(" | ".join(str(c) for c in row))
-        return "\n".join(lines)
+# tabulate is imported on first use; GUI-only installs may not have it
+HAS_TABULATE = importlib.util.find_spec("tabulate") is not None
+HAS_ZSTD = importlib.util.find_spec("zstandard") is not None
+# pyarrow and numpy are only imported by export_columnar
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+COLUMNAR_SUFFIXES = {".parquet": "parquet", ".feather": "feather", ".arrow": "feather", ".npz": "npz"}
+COLUMN_NAMES = ("id", "date", "type", "amount_cents", "category", "description")
+
+
+def tabulate(data, headers=None, tablefmt=None):
+    """Format rows as a table, with a plain fallback when tabulate is missing."""
+    if HAS_TABULATE:
+        from tabulate import tabulate as format_table
+        return format_table(data, headers=headers or (), tablefmt=tablefmt or "simple")
+
+    if not data:
+        return ""
+    lines = []
+    if headers:
+        lines.append(" | ".join(headers))
+        lines.append("-" * (sum(len(h) for h in headers) + len(headers) * 2))
+    for row in data:
+        lines.append(" | ".join(str(c) for c in row))
+    return "\n".join(lines)
+
+
+def open_export(filename, compression=None):
+    """Open filename for buffered UTF-8 text output, optionally compressed."""
+    if compression is None:
+        compression = next(
+            (c for suffix, c in EXPORT_SUFFIXES.items() if filename.lower().endswith(suffix)), None
+        )
+    if compression is None:
+        return open(filename, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE)
+
+    if compression == "gzip":
+        stream = gzip.GzipFile(filename, "wb", compresslevel=6)
+    elif compression == "zstd":
+        if not HAS_ZSTD:
+            raise ValueError("zstd compression needs the zstandard package")
+        import zstandard
+        stream = zstandard.ZstdCompressor().stream_writer(open(filename, "wb"))
+    else:
+        raise ValueError(f"Unknown compression {compression!r}. Use 'gzip' or 'zstd'")
+    buffered = io.BufferedWriter(stream, EXPORT_BUFFER_SIZE)
+    return io.TextIOWrapper(buffered, encoding="utf-8", newline="")
 
 
 class ReportGenerator:
     """Generate various reports from expense data."""
 
+    EXPORT_BATCH_SIZE = 5000
+
     def __init__(self, expense_manager):
         """Initialize report generator."""
         self.em = expense_manager
+        self.last_export = None
 
     def generate_summary_report(self):
         """Generate summary report."""
-        income = self.em.calculate_total_income()
-        expenses = self.em.calculate_total_expenses()
-        balance = self.em.calculate_balance()
+        snapshot = self.em.get_snapshot()
+        income = snapshot["income"]
+        expenses = snapshot["expenses"]
+        balance = snapshot["balance"]
 
         report = f"""
 ╔════════════════════════════════════════╗
@@ -48,11 +92,6 @@ Balance:           ${balance:>12.2f}
 
     def generate_detailed_report(self):
         """Generate detailed transaction report."""
-        transactions = self.em.get_all_transactions()
-
-        if not transactions:
-            return "No transactions found.\n"
-
         headers = ["Date", "Type", "Category", "Amount", "Description"]
         rows = [
             [
@@ -62,15 +101,18 @@ Balance:           ${balance:>12.2f}
                 f"${t.amount:.2f}",
                 t.description,
             ]
-            for t in transactions
+            for t in self.em.iter_transactions()
         ]
 
+        if not rows:
+            return "No transactions found.\n"
+
         report = "\n" + tabulate(rows, headers=headers, tablefmt="grid") + "\n"
         return report
 
     def generate_category_report(self):
         """Generate expense breakdown by category."""
-        summary = self.em.get_expenses_by_category_summary()
+        summary = self.em.get_snapshot()["categories"]
 
         if not summary:
             return "No expenses found.\n"
@@ -91,7 +133,7 @@ Balance:           ${balance:>12.2f}
 
     def generate_monthly_report(self):
         """Generate monthly summary report."""
-        monthly = self.em.get_monthly_summary()
+        monthly = self.em.get_snapshot()["monthly"]
 
         if not monthly:
             return "No transactions found.\n"
@@ -112,7 +154,7 @@ Balance:           ${balance:>12.2f}
 
     def generate_budget_report(self):
         """Generate budget status report."""
-        budget_status = self.em.check_budget_status()
+        budget_status = self.em.get_snapshot()["budgets"]
 
         if not budget_status:
             return "No budgets set.\n"
@@ -132,38 +174,163 @@ Balance:           ${balance:>12.2f}
         report = "\n" + tabulate(rows, headers=headers, tablefmt="grid") + "\n"
         return report
 
-    def export_to_csv(self, filename):
-        """Export all transactions to CSV."""
-        transactions = self.em.get_all_transactions()
-
-        if not transactions:
+    def export_to_csv(self, filename, transaction_type=None, category=None,
+                      start_date=None, end_date=None, compression=None):
+        """Export transactions to CSV, newest first.
+
+        Rows are streamed from the database in batches straight into the
+        writer, so memory use does not grow with the number of rows.
+        ``compression`` is 'gzip' or 'zstd' (needs the zstandard package);
+        by default it follows a .gz or .zst suffix. Sets ``last_export``
+        to the row count, seconds taken and rows per second.
+        """
+        start = time.perf_counter()
+        rows = self.em.db.iter_transactions(
+            transaction_type, category, start_date, end_date, batch_size=self.EXPORT_BATCH_SIZE
+        )
+        first = next(rows, None)
+
+        if first is None:
             print("✗ No transactions to export")
             return False
 
+        counter = itertools.count(1)
         try:
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = ["ID", "Date", "Type", "Category", "Amount", "Description"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for t in transactions:
-                    writer.writerow(
-                        {
-                            "ID": t.transaction_id,
-                            "Date": t.date,
-                            "Type": t.transaction_type,
-                            "Category": t.category,
-                            "Amount": f"{t.amount:.2f}",
-                            "Description": t.description,
-                        }
+            with open_export(filename, compression) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["ID", "Date", "Type", "Category", "Amount", "Description"])
+                # zip advances counter once per row written
+                writer.writerows(
+                    (t_id, t_date, t_type, t_category, f"{amount:.2f}", description)
+                    for (t_id, t_date, t_type, amount, t_category, description), _ in zip(
+                        itertools.chain([first], rows), counter
                     )
-
-            print(f"✓ Exported to {filename}")
-            return True
-        except IOError as e:
+                )
+        except (IOError, ValueError) as e:
             print(f"✗ Error exporting to CSV: {e}")
             return False
 
+        seconds = time.perf_counter() - start
+        count = next(counter) - 1
+        self.last_export = {
+            "rows": count,
+            "seconds": round(seconds, 4),
+            "rows_per_second": round(count / seconds) if seconds else None,
+        }
+        print(f"✓ Exported {count:,} rows to {filename} ({count / seconds:,.0f} rows/s)")
+        return True
+
+    def export_columnar(self, path, format=None, transaction_type=None, category=None,
+                        start_date=None, end_date=None, batch_size=50000):
+        """Export transactions as typed columns for analysis tools.
+
+        ``format`` is 'parquet' or 'feather' (need pyarrow) or 'npz' (needs
+        numpy); by default it follows the file suffix, else parquet when
+        pyarrow is installed and npz otherwise. Columns are id, date, type,
+        amount_cents, category and description. Rows are read in batches of
+        ``batch_size``; Parquet and Feather write one row group or record
+        batch per read, npz keeps only the compact typed arrays in memory.
+        """
+        if format is None:
+            format = next(
+                (f for suffix, f in COLUMNAR_SUFFIXES.items() if path.lower().endswith(suffix)),
+                "parquet" if HAS_PYARROW else "npz",
+            )
+        if format not in ("parquet", "feather", "npz"):
+            print(f"✗ Unknown format {format!r}. Use 'parquet', 'feather' or 'npz'")
+            return False
+        if format == "npz" and not HAS_NUMPY:
+            print("✗ numpy not installed. Install with: pip install numpy")
+            return False
+        if format != "npz" and not HAS_PYARROW:
+            print("✗ pyarrow not installed. Install with: pip install pyarrow")
+            return False
+
+        from src.database import TransactionQuery
+
+        query = TransactionQuery(
+            transaction_type=transaction_type,
+            categories=None if category is None else (category,),
+            start_date=start_date,
+            end_date=end_date,
+        )
+        batches = self.em.db.iter_column_batches(query, batch_size)
+        start = time.perf_counter()
+        try:
+            if format == "npz":
+                count = self._write_npz(path, batches)
+            else:
+                count = self._write_arrow(path, format, batches)
+        except (IOError, ValueError) as e:
+            print(f"✗ Error exporting to {format}: {e}")
+            return False
+
+        seconds = time.perf_counter() - start
+        self.last_export = {
+            "rows": count,
+            "seconds": round(seconds, 4),
+            "rows_per_second": round(count / seconds) if seconds else None,
+        }
+        print(f"✓ Exported {count:,} rows to {path} ({count / seconds:,.0f} rows/s)")
+        return True
+
+    @staticmethod
+    def _write_arrow(path, format, batches):
+        """Write column batches to a Parquet or Feather (Arrow IPC) file; return the row count."""
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        schema = pa.schema([
+            ("id", pa.int64()),
+            ("date", pa.date32()),
+            ("type", pa.string()),
+            ("amount_cents", pa.int64()),
+            ("category", pa.string()),
+            ("description", pa.string()),
+        ])
+        if format == "parquet":
+            writer = pyarrow.parquet.ParquetWriter(path, schema)
+        else:
+            writer = pyarrow.ipc.new_file(path, schema)
+
+        count = 0
+        with writer:
+            for ids, dates, types, cents, categories, descriptions in batches:
+                arrays = [
+                    pa.array(ids, pa.int64()),
+                    pa.array(dates, pa.string()).cast(pa.date32()),
+                    pa.array(types, pa.string()),
+                    pa.array(cents, pa.int64()),
+                    pa.array(categories, pa.string()),
+                    pa.array(descriptions, pa.string()),
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                count += len(ids)
+        return count
+
+    @staticmethod
+    def _write_npz(path, batches):
+        """Write column batches to a NumPy .npz archive; return the row count."""
+        import numpy as np
+
+        columns = {name: [] for name in COLUMN_NAMES}
+        for ids, dates, types, cents, categories, descriptions in batches:
+            columns["id"].append(np.array(ids, dtype=np.int64))
+            columns["date"].append(np.array(dates, dtype="datetime64[D]"))
+            columns["type"].append(np.array(types, dtype=str))
+            columns["amount_cents"].append(np.array(cents, dtype=np.int64))
+            columns["category"].append(np.array(categories, dtype=str))
+            columns["description"].append(np.array(descriptions, dtype=str))
+
+        empty = {"id": np.int64, "date": "datetime64[D]", "amount_cents": np.int64}
+        arrays = {
+            name: np.concatenate(parts) if parts else np.array([], dtype=empty.get(name, str))
+            for name, parts in columns.items()
+        }
+        np.savez(path, **arrays)
+        return len(arrays["id"])
+
     def export_to_pdf(self, filename):
         """Export report to PDF."""
         try:
@@ -185,9 +352,10 @@ Balance:           ${balance:>12.2f}
             story.append(Spacer(1, 0.3 * inch))
 
             # Summary
-            income = self.em.calculate_total_income()
-            expenses = self.em.calculate_total_expenses()
-            balance = self.em.calculate_balance()
+            snapshot = self.em.get_snapshot()
+            income = snapshot["income"]
+            expenses = snapshot["expenses"]
+            balance = snapshot["balance"]
 
             summary_data = [
                 ["Metric", "Amount"],
@@ -218,7 +386,7 @@ Balance:           ${balance:>12.2f}
             story.append(Paragraph("Expense Breakdown by Category", styles["Heading2"]))
             story.append(Spacer(1, 0.1 * inch))
 
-            summary = self.em.get_expenses_by_category_summary()
+            summary = snapshot["categories"]
             if summary:
                 cat_data = [["Category", "Amount"]]
                 total = sum(summary.values())
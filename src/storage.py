@@ -0,0 +1,556 @@
+"""Storage backends for ExpenseManager, selected by URL.
+
+``open_storage`` maps a URL to a StorageBackend:
+
+    data/expenses.db            SQLite database file (plain path)
+    sqlite:///data/expenses.db  the same; sqlite:////abs/path.db for absolute paths
+    memory://                   columnar in-memory store, for tests and benchmarks
+    log:///data/expenses.log    in-memory store persisted as an append-only log
+
+A ``?profile=`` query selects the connection profile (see Database).
+"""
+
+import json
+import os
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from src.database import CONNECTION_PROFILES, Database, StorageBackend, TransactionQuery, search_words
+from src.transaction import content_hash, to_cents
+
+STORAGE_SCHEMES = ("sqlite", "memory", "log")
+
+
+def open_storage(url, profile="durable"):
+    """Open the StorageBackend for url (a path or a URL, see the module docstring)."""
+    url = str(url)
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        return Database(url, profile)
+
+    location, _, query = rest.partition("?")
+    profile = parse_qs(query).get("profile", [profile])[-1]
+    path = location[1:] if location.startswith("/") else location
+    if scheme == "sqlite":
+        return Database(path, profile)
+    if scheme == "memory":
+        return MemoryStorage()
+    if scheme == "log":
+        return LogStorage(path, profile)
+    raise ValueError(f"Unknown storage scheme {scheme!r}. Valid schemes: {', '.join(STORAGE_SCHEMES)}")
+
+
+class MemoryStorage(StorageBackend):
+    """Columnar in-memory storage.
+
+    Each transaction field is kept in its own list (ids, amounts and content
+    hashes in typed arrays), in insertion order; deletes only clear the
+    row's ``live`` flag. Queries scan the columns in a cached sort order, so
+    results come back in the same order as from SQLite. Monthly rollups are
+    updated on every write, like the SQLite triggers.
+
+    The text filter matches word prefixes like the FTS5 index; relevance
+    order falls back to newest first. ``transaction()`` keeps an undo log
+    and replays it backwards when the block raises.
+    """
+
+    fts_enabled = True
+    db_path = None
+
+    def __init__(self):
+        """Initialize empty storage."""
+        self.ids = array("q")
+        self.dates = []
+        self.types = []
+        self.cents = array("q")
+        self.categories = []
+        self.descriptions = []
+        self.hashes = array("q")
+        self.live = bytearray()
+        self.positions = {}  # transaction id -> column index
+        self.rollups = {}  # (month, type, category or '') -> [total_cents, count]
+        self.budgets = {}  # category -> cents, in the order they were last set
+        self.next_id = 1
+        self.version = 0
+        self.last_insert_id = None
+        self.batching = False
+        self._undo = []
+        self._orders = {}  # order -> live column indexes sorted ascending
+        self._words = {}  # column index -> search_words(description)
+
+    @contextmanager
+    def transaction(self):
+        """Run every write in the block as one transaction.
+
+        Writes are committed when the block exits and undone if it raises.
+        """
+        if self.batching:
+            yield
+            return
+        self.batching = True
+        try:
+            yield
+            if self._undo:
+                self._commit()
+        except BaseException:
+            self._rollback()
+            raise
+        finally:
+            self.batching = False
+            self._undo = []
+
+    def _commit(self):
+        """Make the writes since the last commit durable."""
+        self.version += 1
+
+    def _rollback(self):
+        """Undo the writes since the last commit, newest first."""
+        for undo in reversed(self._undo):
+            undo()
+        self._orders.clear()
+
+    def _record(self, entry):
+        """Note a committed change; LogStorage writes these to its log."""
+
+    def get_data_version(self):
+        """Number of commits so far."""
+        return self.version
+
+    def _insert(self, transaction_id, date, transaction_type, cents, category, description):
+        """Append one row to the columns and the rollups."""
+        fingerprint = content_hash(date, transaction_type, cents, description)
+        self.cents.append(cents)  # first: raises OverflowError before anything else changes
+        self.ids.append(transaction_id)
+        self.dates.append(date)
+        self.types.append(transaction_type)
+        self.categories.append(category)
+        self.descriptions.append(description)
+        self.hashes.append(fingerprint)
+        self.live.append(1)
+        self.positions[transaction_id] = len(self.ids) - 1
+        self._roll(len(self.ids) - 1, 1)
+        self.next_id = max(self.next_id, transaction_id + 1)
+        self._orders.clear()
+
+    def _pop(self, next_id):
+        """Undo the last _insert."""
+        position = len(self.ids) - 1
+        self._roll(position, -1)
+        del self.positions[self.ids[position]]
+        self._words.pop(position, None)
+        for column in (self.ids, self.dates, self.types, self.cents,
+                       self.categories, self.descriptions, self.hashes, self.live):
+            del column[position]
+        self.next_id = next_id
+
+    def _set_live(self, position, alive):
+        """Delete or restore the row at position."""
+        self.live[position] = alive
+        if alive:
+            self.positions[self.ids[position]] = position
+        else:
+            del self.positions[self.ids[position]]
+        self._roll(position, 1 if alive else -1)
+        self._orders.clear()
+
+    def _roll(self, position, sign):
+        """Add (sign=1) or remove (sign=-1) a row's amount in the rollups."""
+        key = (self.dates[position][:7], self.types[position], self.categories[position] or "")
+        entry = self.rollups.setdefault(key, [0, 0])
+        entry[0] += sign * self.cents[position]
+        entry[1] += sign
+        if entry[1] <= 0:
+            del self.rollups[key]
+
+    def _add(self, transaction_id, date, transaction_type, cents, category, description):
+        """Insert a row, logging and recording how to undo it."""
+        next_id = self.next_id
+        self._insert(transaction_id, date, transaction_type, cents, category, description)
+        self._undo.append(lambda: self._pop(next_id))
+        self._record(["add", transaction_id, date, transaction_type, cents, category, description])
+
+    def add_transaction(self, transaction_type, amount, category, description, date=None):
+        """Add a new transaction."""
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+        try:
+            with self.transaction():
+                transaction_id = self.next_id
+                self._add(transaction_id, date, transaction_type, to_cents(amount), category, description)
+            self.last_insert_id = transaction_id
+            return True
+        except (OSError, TypeError, ValueError, OverflowError) as e:
+            print(f"✗ Error adding transaction: {e}")
+            return False
+
+    def add_transactions_bulk(self, rows, chunk_size=None):
+        """Insert many transactions with a single commit; see Database.add_transactions_bulk."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        inserted = 0
+        failures = []
+        try:
+            with self.transaction():
+                for index, row in enumerate(rows):
+                    try:
+                        trans_type, cents, category, description, trans_date, _ = self.normalize_row(row, today)
+                        self._add(self.next_id, trans_date, trans_type, cents, category, description)
+                        inserted += 1
+                    except (TypeError, ValueError, OverflowError) as e:
+                        failures.append((index, str(e)))
+        except OSError as e:
+            print(f"✗ Error adding transactions: {e}")
+            return 0, failures
+        return inserted, failures
+
+    def delete_transaction(self, transaction_id):
+        """Delete a transaction by ID."""
+        try:
+            with self.transaction():
+                position = self.positions.get(transaction_id)
+                if position is not None:
+                    self._set_live(position, 0)
+                    self._undo.append(lambda: self._set_live(position, 1))
+                    self._record(["delete", transaction_id])
+            return True
+        except OSError as e:
+            print(f"✗ Error deleting transaction: {e}")
+            return False
+
+    def set_budget(self, category, amount):
+        """Set or update budget for a category."""
+        try:
+            with self.transaction():
+                previous = dict(self.budgets)
+                cents = to_cents(amount)
+                if not -2**63 <= cents < 2**63:
+                    raise OverflowError("amount too large to store as 64-bit centavos")
+                self.budgets.pop(category, None)
+                self.budgets[category] = cents
+                self._undo.append(lambda: setattr(self, "budgets", previous))
+                self._record(["budget", category, cents])
+            return True
+        except (OSError, TypeError, ValueError, OverflowError) as e:
+            print(f"✗ Error setting budget: {e}")
+            return False
+
+    def rebuild_rollups(self):
+        """Recompute the rollups from the columns."""
+        previous = self.rollups
+        self.rollups = {}
+        for position, alive in enumerate(self.live):
+            if alive:
+                self._roll(position, 1)
+        if self.batching:
+            self._undo.append(lambda: setattr(self, "rollups", previous))
+        return True
+
+    def get_max_transaction_id(self):
+        """Largest live transaction id, or 0."""
+        return next((i for i, alive in zip(reversed(self.ids), reversed(self.live)) if alive), 0)
+
+    def find_content_hashes(self, hashes, max_id=None):
+        """Return the subset of content hashes already stored, optionally up to max_id."""
+        wanted = set(hashes)
+        end = len(self.ids) if max_id is None else bisect_right(self.ids, max_id)
+        return {
+            h for h, alive in zip(self.hashes[:end], self.live[:end])
+            if alive and h in wanted
+        }
+
+    def _row(self, position, cents=False):
+        """Transaction tuple for the row at position."""
+        amount = self.cents[position]
+        return (
+            self.ids[position], self.dates[position], self.types[position],
+            amount if cents else amount / 100, self.categories[position],
+            self.descriptions[position],
+        )
+
+    def _sorted(self, order):
+        """Live column indexes sorted ascending by 'date' or 'amount', then id."""
+        if order not in self._orders:
+            live = [i for i, alive in enumerate(self.live) if alive]
+            column = self.cents if order == "amount" else self.dates
+            # Columns are in id order, so a stable sort by the column alone
+            # leaves ties ordered by id.
+            self._orders[order] = sorted(live, key=column.__getitem__)
+        return self._orders[order]
+
+    def _text_matches(self, position, words):
+        """Whether every query word prefixes a word of the description."""
+        if position not in self._words:
+            self._words[position] = search_words(self.descriptions[position])
+        described = self._words[position]
+        return all(any(w.startswith(q) for w in described) for q in words)
+
+    def _select(self, query, count=False):
+        """Column indexes matching query, in query order; unpaged when count is set.
+
+        Filters are chained lazily, so a page stops scanning once it is full.
+        """
+        conditions = []
+        if query.transaction_type is not None:
+            conditions.append(lambda i: self.types[i] == query.transaction_type)
+        if query.categories is not None:
+            conditions.append(lambda i: self.categories[i] in query.categories)
+        if query.start_date is not None:
+            conditions.append(lambda i: self.dates[i] >= query.start_date)
+        if query.end_date is not None:
+            conditions.append(lambda i: self.dates[i] <= query.end_date)
+        if query.min_amount is not None and query.min_amount != float("-inf"):
+            low = to_cents(query.min_amount)
+            conditions.append(lambda i: self.cents[i] >= low)
+        if query.max_amount is not None and query.max_amount != float("inf"):
+            high = to_cents(query.max_amount)
+            conditions.append(lambda i: self.cents[i] <= high)
+        ranked = False
+        if query.text is not None:
+            words = search_words(query.text)
+            if not words:
+                return []
+            conditions.append(lambda i: self._text_matches(i, words))
+            ranked = True
+
+        order = "amount" if query.order == "amount" else "date"
+        descending = query.descending or (query.order == "rank" and ranked)
+        positions = self._sorted(order)
+        positions = reversed(positions) if descending else iter(positions)
+        if not count and query.after_key is not None:
+            if not query.supports_keyset:
+                raise ValueError("Keyset paging is not available for rank order")
+            column = self.cents if order == "amount" else self.dates
+            key = tuple(query.after_key)
+            if descending:
+                conditions.append(lambda i: (column[i], self.ids[i]) < key)
+            else:
+                conditions.append(lambda i: (column[i], self.ids[i]) > key)
+
+        for condition in conditions:
+            positions = filter(condition, positions)
+        if count:
+            return list(positions)
+        end = None if query.limit is None else query.offset + query.limit
+        return list(islice(positions, query.offset, end))
+
+    def get_transaction(self, transaction_id):
+        """Retrieve one transaction by id."""
+        position = self.positions.get(transaction_id)
+        return None if position is None else self._row(position)
+
+    def find_transactions(self, query):
+        """Get transactions matching a TransactionQuery."""
+        return [self._row(i) for i in self._select(query)]
+
+    def count_transactions(self, query):
+        """Count transactions matching a TransactionQuery, ignoring paging."""
+        return len(self._select(query, count=True))
+
+    def iter_query(self, query, batch_size=1000):
+        """Yield rows of a TransactionQuery, building each tuple as it is read."""
+        for position in self._select(query):
+            yield self._row(position)
+
+    def iter_column_batches(self, query=None, batch_size=50000):
+        """Yield a TransactionQuery's results as batches of columns, amounts in centavos."""
+        positions = self._select(query or TransactionQuery())
+        for start in range(0, len(positions), batch_size):
+            batch = positions[start:start + batch_size]
+            yield tuple(
+                tuple(map(column.__getitem__, batch))
+                for column in (self.ids, self.dates, self.types, self.cents,
+                               self.categories, self.descriptions)
+            )
+
+    def get_totals_by_type(self):
+        """Get summed amounts grouped by transaction type."""
+        totals = {}
+        for (_, transaction_type, _), (total, _) in self.rollups.items():
+            totals[transaction_type] = totals.get(transaction_type, 0) + total
+        return {t: total / 100 for t, total in totals.items()}
+
+    def get_category_totals(self, transaction_type="expense"):
+        """Get summed amounts per category, largest first."""
+        totals = {}
+        for (_, t, category), (total, _) in sorted(self.rollups.items()):
+            if t == transaction_type:
+                totals[category] = totals.get(category, 0) + total
+        return [
+            (category or None, total / 100)
+            for category, total in sorted(totals.items(), key=lambda item: -item[1])
+        ]
+
+    def get_monthly_totals(self):
+        """Get income and expense totals per month (YYYY-MM), oldest first."""
+        months = {}
+        for (month, t, _), (total, _) in self.rollups.items():
+            income, expenses = months.get(month, (0, 0))
+            if t == "income":
+                income += total
+            else:
+                expenses += total
+            months[month] = (income, expenses)
+        return [(month, income / 100, expenses / 100)
+                for month, (income, expenses) in sorted(months.items())]
+
+    def get_snapshot_rows(self):
+        """Get all rollup and budget rows; see Database.get_snapshot_rows."""
+        rows = [("rollup", month, t, category or None, total)
+                for (month, t, category), (total, _) in sorted(self.rollups.items())]
+        rows.extend(("budget", None, None, category, cents) for category, cents in self.budgets.items())
+        return rows
+
+    def get_daily_net(self):
+        """Get (date, income minus expenses in centavos) per day, oldest first."""
+        days = {}
+        for date, t, cents, alive in zip(self.dates, self.types, self.cents, self.live):
+            if alive:
+                days[date] = days.get(date, 0) + (cents if t == "income" else -cents)
+        return sorted(days.items())
+
+    def get_budgets(self):
+        """Get all budgets."""
+        return [(category, cents / 100) for category, cents in self.budgets.items()]
+
+    def get_budget(self, category):
+        """Get budget for a specific category."""
+        cents = self.budgets.get(category)
+        return None if cents is None else cents / 100
+
+
+class LogStorage(MemoryStorage):
+    """MemoryStorage persisted as an append-only log.
+
+    Each commit appends one JSON line holding the list of changes it made
+    (``["add", id, date, type, cents, category, description]``,
+    ``["delete", id]`` or ``["budget", category, cents]``); opening the log
+    replays it. A torn last line (no trailing newline) from a crash
+    mid-write is ignored and cut off, so a commit is either fully applied or
+    not at all; any other unreadable line stops the log from opening. The "durable" profile
+    fsyncs every commit; ``compact`` rewrites the log without deleted rows.
+    """
+
+    def __init__(self, path, profile="durable"):
+        """Open (creating if needed) and replay the log at path."""
+        super().__init__()
+        if profile not in CONNECTION_PROFILES:
+            raise ValueError(
+                f"Unknown profile {profile!r}. Valid profiles: {', '.join(CONNECTION_PROFILES)}"
+            )
+        self.db_path = Path(path)
+        self.profile = profile
+        self.readonly = profile == "readonly"
+        self._pending = []
+        self._log = None
+        end = self.replay()
+        if not self.readonly:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.db_path, "a", encoding="utf-8")
+            # Cut off a torn last line so the next commit starts on a line of its own.
+            self._log.truncate(end)
+        print(f"✓ Log opened: {self.db_path} ({len(self.positions)} transactions)")
+
+    def replay(self):
+        """Apply every complete commit in the log; return the byte offset after the last one."""
+        end = 0
+        try:
+            with open(self.db_path, "rb") as log:
+                for number, line in enumerate(log, start=1):
+                    if not line.endswith(b"\n"):
+                        # Only the last line can lack its newline: a torn write.
+                        print(f"✗ Ignoring incomplete log entry at line {number}")
+                        break
+                    try:
+                        changes = json.loads(line)
+                    except ValueError:
+                        print(f"✗ Corrupt log entry at line {number} of {self.db_path}")
+                        raise ValueError(
+                            f"{self.db_path} is corrupt at line {number}; refusing to open it"
+                        ) from None
+                    for change in changes:
+                        self._apply(change)
+                    end += len(line)
+        except FileNotFoundError:
+            pass
+        self._undo = []
+        return end
+
+    def _apply(self, change):
+        """Apply one logged change without logging it again."""
+        op, *args = change
+        if op == "add":
+            self._insert(*args)
+        elif op == "delete":
+            position = self.positions.get(args[0])
+            if position is not None:
+                self._set_live(position, 0)
+        elif op == "budget":
+            category, cents = args
+            self.budgets.pop(category, None)
+            self.budgets[category] = cents
+        elif op == "next_id":
+            self.next_id = max(self.next_id, args[0])
+
+    def _record(self, entry):
+        """Queue a change for the next commit."""
+        self._pending.append(entry)
+
+    def _commit(self):
+        """Append the pending changes to the log as one line."""
+        if self._pending:
+            if self._log is None:
+                raise OSError(f"{self.db_path} is open read-only")
+            self._log.write(json.dumps(self._pending, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._log.flush()
+            if self.profile == "durable":
+                os.fsync(self._log.fileno())
+            self._pending = []
+        super()._commit()
+
+    def _rollback(self):
+        """Drop the pending changes and undo them in memory."""
+        self._pending = []
+        super()._rollback()
+
+    def compact(self):
+        """Rewrite the log with only the live rows and current budgets."""
+        if self._log is None:
+            return False
+        changes = [["next_id", self.next_id]]
+        changes.extend(
+            ["add", *self._row(i, cents=True)] for i, alive in enumerate(self.live) if alive
+        )
+        changes.extend(["budget", category, cents] for category, cents in self.budgets.items())
+        temp = self.db_path.with_name(self.db_path.name + ".tmp")
+        try:
+            with open(temp, "w", encoding="utf-8") as out:
+                out.write(json.dumps(changes, ensure_ascii=False, separators=(",", ":")) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+        except OSError as e:
+            print(f"✗ Error compacting log: {e}")
+            return False
+        self._log.close()
+        try:
+            os.replace(temp, self.db_path)
+        except OSError as e:
+            print(f"✗ Error compacting log: {e}")
+            return False
+        finally:
+            self._log = open(self.db_path, "a", encoding="utf-8")
+        return True
+
+    def close(self):
+        """Close the log file."""
+        if self._log:
+            self._log.close()
+            self._log = None
+            print("✓ Log closed")
+
+    def __del__(self):
+        """Destructor to ensure the log is closed."""
+        self.close()
@@ -1,7 +1,43 @@
 """Transaction model for expense tracker."""
 
+import hashlib
+import importlib.util
+import math
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
+from typing import NamedTuple
+
+# numpy is only imported by TransactionBatch.to_numpy
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+TRANSACTION_TYPES = ("expense", "income")
+
+# Largest amount accepted for a transaction or budget, in pesos; far inside
+# the 64-bit range SQLite stores centavos in.
+MAX_AMOUNT = 1_000_000_000_000
+
+
+def is_valid_amount(amount):
+    """Whether amount is a finite number above 0 and at most MAX_AMOUNT."""
+    return math.isfinite(amount) and 0 < amount <= MAX_AMOUNT
+
+
+def to_cents(amount):
+    """Convert an amount in pesos to integer centavos."""
+    return int(round(amount * 100))
+
+
+def from_cents(cents):
+    """Convert integer centavos to an amount in pesos."""
+    return cents / 100
+
+
+def content_hash(date, transaction_type, amount_cents, description):
+    """64-bit fingerprint of a transaction's content, used to spot re-imported rows."""
+    key = "\x1f".join((date, transaction_type, str(amount_cents), (description or "").strip().casefold()))
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big", signed=True)
 
 
 @dataclass
@@ -24,6 +60,16 @@ class Transaction:
         """String representation of transaction."""
         return f"{self.date} | {self.type:8} | {self.category:12} | ${self.amount:8.2f} | {self.description}"
 
+    @property
+    def amount_cents(self):
+        """Amount as integer centavos."""
+        return to_cents(self.amount)
+
+    @property
+    def amount_decimal(self):
+        """Amount as an exact two-place Decimal."""
+        return Decimal(self.amount_cents).scaleb(-2)
+
     def to_dict(self):
         """Convert transaction to dictionary."""
         return {
@@ -47,3 +93,131 @@ class Transaction:
             date=date,
             transaction_id=transaction_id,
         )
+
+
+class TransactionRecord(NamedTuple):
+    """Immutable transaction for large result sets.
+
+    Has the same fields as ``Transaction`` but is a tuple, so instances carry
+    no per-instance ``__dict__``.
+    """
+
+    transaction_type: str
+    amount: float
+    category: str
+    description: str
+    date: str = None
+    transaction_id: int = None
+
+    @property
+    def amount_cents(self):
+        """Amount as integer centavos."""
+        return to_cents(self.amount)
+
+    @property
+    def amount_decimal(self):
+        """Amount as an exact two-place Decimal."""
+        return Decimal(self.amount_cents).scaleb(-2)
+
+    def to_dict(self):
+        """Convert transaction to dictionary."""
+        return Transaction.to_dict(self)
+
+    @classmethod
+    def from_tuple(cls, data):
+        """Create record from database tuple."""
+        transaction_id, date, trans_type, amount, category, description = data
+        return cls(trans_type, amount, category, description, date, transaction_id)
+
+
+class TransactionBatch:
+    """Columnar collection of transactions backed by typed arrays.
+
+    Ids, date ordinals, type codes, centavo amounts and category codes are
+    stored in ``array`` columns; categories and descriptions are interned so
+    repeated strings are stored once. Rows are only turned into
+    ``TransactionRecord`` objects when indexed or iterated.
+    """
+
+    def __init__(self):
+        """Initialize empty columns."""
+        self.ids = array("q")
+        self.dates = array("l")
+        self.types = array("b")
+        self.amounts = array("q")
+        self.category_codes = array("H")
+        self.categories = []
+        self.descriptions = []
+        self._category_codes = {}
+        self._ordinals = {}
+        self._strings = {}
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a batch from database tuples (id, date, type, amount, category, description)."""
+        batch = cls()
+        for row in rows:
+            batch.append(*row)
+        return batch
+
+    def append(self, transaction_id, date_str, trans_type, amount, category, description):
+        """Append one transaction."""
+        ordinal = self._ordinals.get(date_str)
+        if ordinal is None:
+            ordinal = self._ordinals[date_str] = date.fromisoformat(date_str).toordinal()
+
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self.categories)
+            self.categories.append(category)
+
+        self.ids.append(transaction_id)
+        self.dates.append(ordinal)
+        self.types.append(TRANSACTION_TYPES.index(trans_type))
+        self.amounts.append(to_cents(amount))
+        self.category_codes.append(code)
+        self.descriptions.append(self._strings.setdefault(description, description))
+
+    def __len__(self):
+        """Number of transactions."""
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        """Materialize one row as a TransactionRecord."""
+        return TransactionRecord(
+            TRANSACTION_TYPES[self.types[index]],
+            from_cents(self.amounts[index]),
+            self.categories[self.category_codes[index]],
+            self.descriptions[index],
+            date.fromordinal(self.dates[index]).isoformat(),
+            self.ids[index],
+        )
+
+    def __iter__(self):
+        """Iterate rows as TransactionRecord objects."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def total(self, transaction_type=None):
+        """Sum of amounts, optionally for one transaction type."""
+        if transaction_type is None:
+            return from_cents(sum(self.amounts))
+        code = TRANSACTION_TYPES.index(transaction_type)
+        return from_cents(sum(a for a, t in zip(self.amounts, self.types) if t == code))
+
+    def to_numpy(self):
+        """Return the columns as NumPy arrays without copying the numeric data."""
+        if not HAS_NUMPY:
+            print("✗ numpy not installed. Install with: pip install numpy")
+            return None
+        import numpy as np
+
+        return {
+            "id": np.frombuffer(self.ids, dtype=np.int64),
+            "date": (np.frombuffer(self.dates, dtype=np.dtype(f"i{self.dates.itemsize}"))
+                     - date(1970, 1, 1).toordinal()).astype("datetime64[D]"),
+            "type": np.frombuffer(self.types, dtype=np.int8),
+            "amount_cents": np.frombuffer(self.amounts, dtype=np.int64),
+            "category_code": np.frombuffer(self.category_codes, dtype=np.uint16),
+            "categories": np.array(self.categories, dtype=object),
+        }
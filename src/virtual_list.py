@@ -0,0 +1,263 @@
+"""Paginated transaction list for the expense tracker GUI."""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class PageWindow:
+    """The slice of a query's results currently held by a list view.
+
+    Pages are fetched on demand before or after the loaded rows, using keyset
+    paging when the ordering allows it and LIMIT/OFFSET otherwise. At most
+    ``max_rows`` rows are kept; loading past that drops rows from the far end.
+    """
+
+    def __init__(self, query, page_size=200, max_rows=1000):
+        """Start an empty window over query."""
+        self.query = query.page(None).after(None)
+        self.page_size = page_size
+        self.max_rows = max_rows
+        self.keyset = self.query.supports_keyset
+        self.rows = []
+        self.offset = 0
+        self.at_start = True
+        self.at_end = False
+
+    def __len__(self):
+        """Number of loaded rows."""
+        return len(self.rows)
+
+    def next_query(self):
+        """Query for the page after the loaded rows, or None at the end."""
+        if self.at_end:
+            return None
+        if not self.keyset:
+            return self.query.page(self.page_size, self.offset + len(self.rows))
+        if not self.rows:
+            return self.query.page(self.page_size)
+        return self.query.after(self.query.key_for(self.rows[-1])).page(self.page_size)
+
+    def previous_query(self):
+        """Query for the page before the loaded rows, or None at the start.
+
+        In keyset mode the rows come back in reverse order; prepend() expects that.
+        """
+        if self.at_start:
+            return None
+        if not self.keyset:
+            size = min(self.page_size, self.offset)
+            return self.query.page(size, self.offset - size)
+        reverse = self.query.sorted_by(self.query.order, not self.query.descending)
+        return reverse.after(self.query.key_for(self.rows[0])).page(self.page_size)
+
+    def extend(self, rows):
+        """Add a page from next_query; return how many rows were dropped from the top."""
+        self.rows.extend(rows)
+        self.at_end = len(rows) < self.page_size
+        dropped = max(0, len(self.rows) - self.max_rows)
+        if dropped:
+            del self.rows[:dropped]
+            self.offset += dropped
+            self.at_start = False
+        return dropped
+
+    def prepend(self, rows):
+        """Add a page from previous_query; return how many rows were dropped from the bottom."""
+        rows = list(rows)
+        if self.keyset:
+            rows.reverse()
+            self.at_start = len(rows) < self.page_size
+        else:
+            self.at_start = self.offset - len(rows) <= 0
+        self.rows[:0] = rows
+        self.offset = max(0, self.offset - len(rows))
+        dropped = max(0, len(self.rows) - self.max_rows)
+        if dropped:
+            del self.rows[-dropped:]
+            self.at_end = False
+        return dropped
+
+    def insert(self, transaction):
+        """Place a new transaction among the loaded rows.
+
+        Returns its index, or None when it does not match the query or sorts
+        outside the loaded range. Only keyset-ordered windows without a text
+        filter accept inserts.
+        """
+        if not self.keyset or self.query.text is not None or not self.query.matches(transaction):
+            return None
+
+        key = self.query.key_for(transaction)
+        index = 0
+        for index, row in enumerate(self.rows):
+            row_key = self.query.key_for(row)
+            if (key > row_key) if self.query.descending else (key < row_key):
+                break
+        else:
+            index = len(self.rows)
+
+        if (index == 0 and not self.at_start) or (index == len(self.rows) and not self.at_end):
+            return None
+        self.rows.insert(index, transaction)
+        return index
+
+    def remove(self, transaction_id):
+        """Drop a loaded transaction; return its former index or None."""
+        for index, row in enumerate(self.rows):
+            if row.transaction_id == transaction_id:
+                del self.rows[index]
+                return index
+        return None
+
+
+class VirtualTransactionList(ttk.Frame):
+    """Treeview of transactions that loads pages as the user scrolls.
+
+    Only a window of rows around the viewport is inserted into the Treeview,
+    so large result sets stay responsive. Pages are fetched through a
+    BackgroundLoader under ``name``.
+    """
+
+    COLUMNS = ("ID", "Date", "Type", "Category", "Amount", "Description")
+    EDGE = 0.1  # fraction of the loaded rows from either end that triggers a fetch
+
+    def __init__(self, parent, loader, name, page_size=200, max_rows=1000, height=15):
+        """Create the Treeview and its scrollbar."""
+        super().__init__(parent)
+        self.loader = loader
+        self.name = name
+        self.page_size = page_size
+        self.max_rows = max_rows
+        self.window = None
+        self.fetching = False
+
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS, height=height, show="headings")
+        for col in self.COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=100)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_scroll)
+
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def load(self, query, rows=None):
+        """Show the results of a TransactionQuery, starting from the top.
+
+        ``rows`` may hold an already fetched first page of the query.
+        """
+        self.window = PageWindow(query, self.page_size, self.max_rows)
+        self.fetching = False
+        self.tree.delete(*self.tree.get_children())
+        if rows is None:
+            self.fetch(forward=True)
+        else:
+            self.show_page(self.window, rows, forward=True)
+
+    def clear(self):
+        """Remove every row and stop loading."""
+        self.cancel()
+        self.window = None
+        self.tree.delete(*self.tree.get_children())
+
+    def cancel(self, interrupt=False):
+        """Abandon any page or other request pending under this list's name."""
+        self.loader.cancel(self.name, interrupt)
+        self.fetching = False
+
+    def fetch(self, forward):
+        """Request the next or previous page in the background."""
+        window = self.window
+        query = window.next_query() if forward else window.previous_query()
+        if query is None or self.fetching:
+            return
+        self.fetching = True
+        self.loader.submit(
+            self.name,
+            lambda em: em.find_transactions(query),
+            lambda rows: self.show_page(window, rows, forward),
+            lambda error: self.fetch_failed(window, error),
+        )
+
+    def fetch_failed(self, window, error):
+        """Allow another fetch after an error."""
+        if window is self.window:
+            self.fetching = False
+        print(f"✗ Error loading transactions: {error}")
+
+    def show_page(self, window, rows, forward):
+        """Insert a fetched page, keeping the visible rows in place."""
+        if window is not self.window:
+            return
+        self.fetching = False
+        top = self.first_visible()
+        items = self.tree.get_children()
+
+        if forward:
+            dropped = window.extend(rows)
+            if dropped:
+                self.tree.delete(*items[:dropped])
+            for t in rows:
+                self.insert_row(tk.END, t)
+            top -= dropped
+        else:
+            dropped = window.prepend(rows)
+            if dropped:
+                self.tree.delete(*items[-dropped:])
+            for index, t in enumerate(window.rows[:len(rows)]):
+                self.insert_row(index, t)
+            top += len(rows)
+
+        if len(window):
+            self.tree.yview_moveto(max(0, top) / len(window))
+
+    def first_visible(self):
+        """Index of the first row in view."""
+        return int(round(self.tree.yview()[0] * len(self.tree.get_children())))
+
+    def on_scroll(self, first, last):
+        """Update the scrollbar and fetch more rows near either edge."""
+        self.scrollbar.set(first, last)
+        if self.window is None or self.fetching:
+            return
+        if float(last) > 1 - self.EDGE:
+            self.fetch(forward=True)
+        elif float(first) < self.EDGE:
+            self.fetch(forward=False)
+
+    def insert_row(self, index, t):
+        """Insert one transaction as a Treeview item keyed by its id."""
+        self.tree.insert(
+            "",
+            index,
+            iid=str(t.transaction_id),
+            values=(
+                t.transaction_id,
+                t.date,
+                t.transaction_type.upper(),
+                t.category,
+                f"₱{t.amount:.2f}",
+                t.description[:30],
+            ),
+        )
+
+    def add(self, transaction):
+        """Show a newly added transaction if it falls in the loaded rows."""
+        if self.window is None or transaction is None:
+            return
+        index = self.window.insert(transaction)
+        if index is not None:
+            self.insert_row(index, transaction)
+
+    def remove(self, transaction_id):
+        """Remove a deleted transaction from the list."""
+        if self.window is not None:
+            self.window.remove(transaction_id)
+        if self.tree.exists(str(transaction_id)):
+            self.tree.delete(str(transaction_id))
+
+    def selected_id(self):
+        """Id of the selected transaction, or None."""
+        selected = self.tree.selection()
+        return int(selected[0]) if selected else None
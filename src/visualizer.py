@@ -1,176 +1,331 @@
 """Data visualization module."""
 
-try:
+import importlib.util
+import itertools
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.chart_cache import ChartCache
+from src.transaction import HAS_NUMPY, from_cents
+
+# matplotlib is only imported when a chart is drawn; pyplot alone takes longer
+# to import than the rest of the application
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+CHART_DPI = 300
+# Part of every chart cache key; bump it when the drawing code changes
+CHART_STYLE_VERSION = 2
+TREND_MAX_POINTS = 1000
+TREND_MARKER_LIMIT = 100  # draw point markers only on short series
+
+
+def _pyplot():
+    """Import matplotlib.pyplot on first use."""
     import matplotlib.pyplot as plt
+    return plt
+
+
+def downsample_minmax(values, max_points):
+    """Indices of the points to keep so a line through them looks the same.
+
+    Splits the series into ``max_points // 2`` equal buckets and keeps each
+    bucket's lowest and highest point, plus the first and last points, so
+    every peak and trough survives. Returns all indices when the series
+    already fits.
+    """
+    n = len(values)
+    if n <= max_points or max_points < 4:
+        return list(range(n))
+    buckets = (max_points - 2) // 2
+
+    if HAS_NUMPY:
+        import numpy as np
+
+        y = np.asarray(values)
+        bucket = np.arange(n) * buckets // n
+        order = np.lexsort((y, bucket))
+        starts = np.searchsorted(bucket[order], np.arange(buckets))
+        ends = np.append(starts[1:], n) - 1
+        keep = np.concatenate(([0, n - 1], order[starts], order[ends]))
+        return np.unique(keep).tolist()
+
+    keep = {0, n - 1}
+    for b in range(buckets):
+        lo, hi = b * n // buckets, (b + 1) * n // buckets
+        keep.add(min(range(lo, hi), key=values.__getitem__))
+        keep.add(max(range(lo, hi), key=values.__getitem__))
+    return sorted(keep)
+
+
+def draw_expense_by_category(fig, categories):
+    """Draw a pie chart of {category: amount} onto fig."""
+    from matplotlib import colormaps
+
+    ax = fig.subplots()
+    colors = colormaps["Set3"](range(len(categories)))
+    ax.pie(list(categories.values()), labels=list(categories), autopct="%1.1f%%",
+           colors=colors, startangle=90)
+    ax.set_title("Expense Distribution by Category", fontsize=16, fontweight="bold")
+
+
+def draw_income_vs_expenses(fig, monthly):
+    """Draw grouped monthly income and expense bars onto fig."""
+    ax = fig.subplots()
+    months = list(monthly)
+    x = range(len(months))
+    width = 0.35
+    ax.bar([i - width / 2 for i in x], [monthly[m]["income"] for m in months], width,
+           label="Income", color="#2ecc71")
+    ax.bar([i + width / 2 for i in x], [monthly[m]["expense"] for m in months], width,
+           label="Expenses", color="#e74c3c")
+
+    ax.set_xlabel("Month", fontweight="bold")
+    ax.set_ylabel("Amount ($)", fontweight="bold")
+    ax.set_title("Income vs Expenses by Month", fontsize=16, fontweight="bold")
+    ax.set_xticks(list(x), months, rotation=45)
+    ax.legend()
+    ax.grid(axis="y", alpha=0.3)
+
+
+def draw_spending_trend(fig, trend):
+    """Draw the cumulative balance from (dates, balances) onto fig."""
     import matplotlib.dates as mdates
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    
-from datetime import datetime
-from collections import defaultdict
+
+    dates, balances = trend
+    ax = fig.subplots()
+    marker = "o" if len(dates) <= TREND_MARKER_LIMIT else None
+    ax.plot([datetime.strptime(d, "%Y-%m-%d") for d in dates], balances,
+            marker=marker, linewidth=2, markersize=6, color="#3498db")
+    ax.axhline(y=0, color="r", linestyle="--", alpha=0.5)
+
+    ax.set_xlabel("Date", fontweight="bold")
+    ax.set_ylabel("Balance ($)", fontweight="bold")
+    ax.set_title("Cumulative Balance Over Time", fontsize=16, fontweight="bold")
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    ax.tick_params(axis="x", labelrotation=45)
+    ax.grid(True, alpha=0.3)
+
+
+def draw_budget_status(fig, budgets):
+    """Draw budget and spent bars per category onto fig."""
+    ax = fig.subplots()
+    categories = list(budgets)
+    x = range(len(categories))
+    width = 0.35
+    ax.bar([i - width / 2 for i in x], [budgets[c]["budget"] for c in categories], width,
+           label="Budget", color="#3498db")
+    ax.bar([i + width / 2 for i in x], [budgets[c]["spent"] for c in categories], width,
+           label="Spent", color="#e74c3c")
+
+    ax.set_xlabel("Category", fontweight="bold")
+    ax.set_ylabel("Amount ($)", fontweight="bold")
+    ax.set_title("Budget vs Actual Spending", fontsize=16, fontweight="bold")
+    ax.set_xticks(list(x), categories, rotation=45)
+    ax.legend()
+    ax.grid(axis="y", alpha=0.3)
+
+
+# name: (draw function, figure size, file name, message when there is no data)
+CHARTS = {
+    "expenses_by_category": (draw_expense_by_category, (10, 7), "expenses_by_category.png",
+                             "No expense data to visualize"),
+    "income_vs_expenses": (draw_income_vs_expenses, (12, 6), "income_vs_expenses.png",
+                           "No transaction data to visualize"),
+    "spending_trend": (draw_spending_trend, (12, 6), "spending_trend.png",
+                       "No transaction data to visualize"),
+    "budget_status": (draw_budget_status, (12, 6), "budget_status.png",
+                      "No budget data to visualize"),
+}
+
+
+def render_chart(name, data, save_path, dpi=CHART_DPI):
+    """Draw one chart and save it; return the seconds taken.
+
+    Uses a standalone Figure rendered by Agg rather than pyplot's global
+    state, so it is safe to run in worker processes.
+    """
+    from matplotlib.figure import Figure
+
+    start = time.perf_counter()
+    draw, figsize, _, _ = CHARTS[name]
+    fig = Figure(figsize=figsize)
+    draw(fig, data)
+    fig.tight_layout()
+    fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
+    return time.perf_counter() - start
 
 
 class Visualizer:
     """Generate charts and visualizations."""
 
-    def __init__(self, expense_manager):
-        """Initialize visualizer."""
+    def __init__(self, expense_manager, cache_dir="reports/.chart_cache",
+                 trend_points=TREND_MAX_POINTS):
+        """Initialize visualizer.
+
+        Saved charts are kept in a ChartCache under ``cache_dir`` (None
+        disables it) and reused while their data is unchanged. The spending
+        trend is downsampled to at most ``trend_points`` points.
+        """
         self.em = expense_manager
+        self.trend_points = trend_points
+        self.chart_cache = ChartCache(cache_dir) if cache_dir else None
         if not HAS_MATPLOTLIB:
             print("⚠️  matplotlib not installed. Chart generation disabled.")
 
-    def plot_expense_by_category(self, save_path=None):
-        """Create pie chart of expenses by category."""
+    def chart_data(self):
+        """Fetch the data for every chart at once.
+
+        Category, monthly and budget figures come from one snapshot query;
+        the spending trend is a ``(dates, balances)`` pair from balance_trend.
+        """
+        snapshot = self.em.get_snapshot()
+        return {
+            "expenses_by_category": snapshot["categories"],
+            "income_vs_expenses": snapshot["monthly"],
+            "spending_trend": self.balance_trend(),
+            "budget_status": snapshot["budgets"],
+        }
+
+    def balance_trend(self):
+        """End-of-day cumulative balance, oldest first, as (dates, balances).
+
+        Daily net amounts come from SQL; the running total is a cumsum over
+        integer centavos, then the series is cut to ``trend_points`` with
+        downsample_minmax. Returns None when there are no transactions.
+        """
+        rows = self.em.db.get_daily_net()
+        if not rows:
+            return None
+        dates, nets = zip(*rows)
+
+        if HAS_NUMPY:
+            import numpy as np
+
+            balances = np.cumsum(np.array(nets, dtype=np.int64))
+            keep = downsample_minmax(balances, self.trend_points)
+            return [dates[i] for i in keep], (balances[keep] / 100).tolist()
+
+        balances = list(itertools.accumulate(nets))
+        keep = downsample_minmax(balances, self.trend_points)
+        return [dates[i] for i in keep], [from_cents(balances[i]) for i in keep]
+
+    def _plot(self, name, data, save_path):
+        """Save one chart to save_path, or show it in a window."""
         if not HAS_MATPLOTLIB:
             print("❌ matplotlib required for chart generation. Run: pip install matplotlib")
             return
-            
-        summary = self.em.get_expenses_by_category_summary()
-
-        if not summary:
-            print("✗ No expense data to visualize")
+        draw, figsize, _, empty_message = CHARTS[name]
+        if not data:
+            print(f"✗ {empty_message}")
             return
 
-        categories = list(summary.keys())
-        amounts = list(summary.values())
-
-        plt.figure(figsize=(10, 7))
-        colors = plt.cm.Set3(range(len(categories)))
-        plt.pie(amounts, labels=categories, autopct="%1.1f%%", colors=colors, startangle=90)
-        plt.title("Expense Distribution by Category", fontsize=16, fontweight="bold")
-        plt.tight_layout()
-
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
+            key = self.chart_key(name, data)
+            if self.chart_cache is not None and self.chart_cache.fetch(key, save_path):
+                print(f"✓ Chart saved to {save_path} (cached)")
+                return
+            render_chart(name, data, save_path)
+            if self.chart_cache is not None:
+                self.chart_cache.store(key, save_path)
             print(f"✓ Chart saved to {save_path}")
         else:
+            plt = _pyplot()
+            fig = plt.figure(figsize=figsize)
+            draw(fig, data)
+            fig.tight_layout()
             plt.show()
+            plt.close(fig)
 
-        plt.close()
+    @staticmethod
+    def chart_key(name, data, dpi=CHART_DPI):
+        """Cache key for a chart: its data, type, size, dpi and style version."""
+        return ChartCache.key(CHART_STYLE_VERSION, name, CHARTS[name][1], dpi, data)
+
+    def plot_expense_by_category(self, save_path=None):
+        """Create pie chart of expenses by category."""
+        self._plot("expenses_by_category", self.em.get_expenses_by_category_summary(), save_path)
 
     def plot_income_vs_expenses(self, save_path=None):
         """Create bar chart comparing income and expenses."""
-        monthly = self.em.get_monthly_summary()
-
-        if not monthly:
-            print("✗ No transaction data to visualize")
-            return
-
-        months = list(monthly.keys())
-        income = [monthly[m]["income"] for m in months]
-        expenses = [monthly[m]["expense"] for m in months]
-
-        x = range(len(months))
-        width = 0.35
-
-        plt.figure(figsize=(12, 6))
-        plt.bar([i - width / 2 for i in x], income, width, label="Income", color="#2ecc71")
-        plt.bar([i + width / 2 for i in x], expenses, width, label="Expenses", color="#e74c3c")
-
-        plt.xlabel("Month", fontweight="bold")
-        plt.ylabel("Amount ($)", fontweight="bold")
-        plt.title("Income vs Expenses by Month", fontsize=16, fontweight="bold")
-        plt.xticks(x, months, rotation=45)
-        plt.legend()
-        plt.grid(axis="y", alpha=0.3)
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
-            print(f"✓ Chart saved to {save_path}")
-        else:
-            plt.show()
-
-        plt.close()
+        self._plot("income_vs_expenses", self.em.get_monthly_summary(), save_path)
 
     def plot_spending_trend(self, save_path=None):
         """Create line chart of cumulative spending over time."""
-        transactions = sorted(self.em.get_all_transactions(), key=lambda t: t.date)
-
-        if not transactions:
-            print("✗ No transaction data to visualize")
-            return
-
-        dates = []
-        cumulative_balance = []
-        current_balance = 0
-
-        for transaction in transactions:
-            dates.append(datetime.strptime(transaction.date, "%Y-%m-%d"))
-            if transaction.transaction_type == "income":
-                current_balance += transaction.amount
-            else:
-                current_balance -= transaction.amount
-            cumulative_balance.append(current_balance)
-
-        plt.figure(figsize=(12, 6))
-        plt.plot(dates, cumulative_balance, marker="o", linewidth=2, markersize=6, color="#3498db")
-        plt.axhline(y=0, color="r", linestyle="--", alpha=0.5)
-
-        plt.xlabel("Date", fontweight="bold")
-        plt.ylabel("Balance ($)", fontweight="bold")
-        plt.title("Cumulative Balance Over Time", fontsize=16, fontweight="bold")
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-        plt.gca().xaxis.set_major_locator(mdates.MonthLocator())
-        plt.xticks(rotation=45)
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
-            print(f"✓ Chart saved to {save_path}")
-        else:
-            plt.show()
-
-        plt.close()
+        self._plot("spending_trend", self.balance_trend(), save_path)
 
     def plot_budget_status(self, save_path=None):
         """Create bar chart of budget vs actual spending."""
-        budget_status = self.em.check_budget_status()
-
-        if not budget_status:
-            print("✗ No budget data to visualize")
-            return
-
-        categories = list(budget_status.keys())
-        budgets = [budget_status[c]["budget"] for c in categories]
-        spent = [budget_status[c]["spent"] for c in categories]
-
-        x = range(len(categories))
-        width = 0.35
-
-        plt.figure(figsize=(12, 6))
-        plt.bar([i - width / 2 for i in x], budgets, width, label="Budget", color="#3498db")
-        plt.bar([i + width / 2 for i in x], spent, width, label="Spent", color="#e74c3c")
-
-        plt.xlabel("Category", fontweight="bold")
-        plt.ylabel("Amount ($)", fontweight="bold")
-        plt.title("Budget vs Actual Spending", fontsize=16, fontweight="bold")
-        plt.xticks(x, categories, rotation=45)
-        plt.legend()
-        plt.grid(axis="y", alpha=0.3)
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches="tight")
-            print(f"✓ Chart saved to {save_path}")
-        else:
-            plt.show()
-
-        plt.close()
-
-    def generate_all_charts(self, output_dir="reports"):
-        """Generate all charts and save to directory."""
-        from pathlib import Path
+        self._plot("budget_status", self.em.check_budget_status(), save_path)
+
+    def generate_all_charts(self, output_dir="reports", workers=None, executor=None):
+        """Generate all charts and save to directory.
+
+        The data is fetched once, then the charts are rendered in parallel
+        in ``workers`` processes (default: one per chart, up to the CPU
+        count; 1 renders in this process). Pass a ProcessPoolExecutor as
+        ``executor`` to reuse its workers across calls. Charts whose data
+        has not changed are copied from the chart cache instead; when all
+        are cached no workers are started. Returns the seconds each saved
+        chart took to render, 0 for cached ones.
+        """
+        if not HAS_MATPLOTLIB:
+            print("❌ matplotlib required for chart generation. Run: pip install matplotlib")
+            return {}
 
+        start = time.perf_counter()
         Path(output_dir).mkdir(exist_ok=True)
+        data = self.chart_data()
+        jobs = {}
+        keys = {}
+        cached = {}
+        for name, (_, _, filename, empty_message) in CHARTS.items():
+            path = f"{output_dir}/{filename}"
+            if not data[name]:
+                print(f"✗ {empty_message}")
+                continue
+            keys[name] = self.chart_key(name, data[name])
+            if self.chart_cache is not None and self.chart_cache.fetch(keys[name], path):
+                cached[name] = path
+            else:
+                jobs[name] = (name, data[name], path)
+        if workers is None:
+            workers = min(len(jobs), os.cpu_count() or 1)
 
         try:
-            self.plot_expense_by_category(f"{output_dir}/expenses_by_category.png")
-            self.plot_income_vs_expenses(f"{output_dir}/income_vs_expenses.png")
-            self.plot_spending_trend(f"{output_dir}/spending_trend.png")
-            self.plot_budget_status(f"{output_dir}/budget_status.png")
-            print(f"✓ All charts saved to {output_dir}/")
+            if not jobs:
+                timings = {}
+            elif executor is None and workers > 1:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # spawn: forking a process that runs Tk or loader threads is unsafe
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(workers, mp_context=context) as pool:
+                    timings = self._render_all(pool, jobs)
+            else:
+                timings = self._render_all(executor, jobs)
         except Exception as e:
             print(f"✗ Error generating charts: {e}")
+            return {}
+
+        for name, seconds in timings.items():
+            if self.chart_cache is not None:
+                self.chart_cache.store(keys[name], jobs[name][2])
+            print(f"✓ Chart saved to {jobs[name][2]} ({seconds:.2f}s)")
+        for name, path in cached.items():
+            print(f"✓ Chart saved to {path} (cached)")
+            timings[name] = 0.0
+        print(f"✓ All charts saved to {output_dir}/ ({time.perf_counter() - start:.2f}s)")
+        return timings
+
+    @staticmethod
+    def _render_all(executor, jobs):
+        """Render jobs through executor, or in this process when it is None."""
+        if executor is None:
+            return {name: render_chart(*job) for name, job in jobs.items()}
+        futures = {name: executor.submit(render_chart, *job) for name, job in jobs.items()}
+        return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,68 @@
+"""Test advanced features module."""
+
+import pytest
+import os
+from src.expense_manager import ExpenseManager
+from src.advanced_features import TransactionSearch
+
+
+@pytest.fixture
+def manager():
+    """Create test expense manager."""
+    em = ExpenseManager("test_expenses.db")
+    yield em
+    em.close()
+    if os.path.exists("test_expenses.db"):
+        os.remove("test_expenses.db")
+
+
+def test_search_pagination(manager):
+    """Test searches return one page at a time."""
+    for day in range(1, 8):
+        manager.db.add_transaction("expense", day * 10, "Food", f"Meal {day}", f"2024-01-0{day}")
+    search = TransactionSearch(manager, page_size=3)
+
+    first = search.search_by_amount_range(20, 70)
+    second = search.search_by_amount_range(20, 70, page=1)
+    assert [t.amount for t in first] == [70, 60, 50]
+    assert [t.amount for t in second] == [40, 30, 20]
+    assert search.count_last() == 6
+
+
+def test_search_by_category_and_date(manager):
+    """Test combined category and date search."""
+    manager.db.add_transaction("expense", 10, "Food", "Lunch", "2024-01-05")
+    manager.db.add_transaction("expense", 20, "Transport", "Bus", "2024-01-06")
+    manager.db.add_transaction("expense", 30, "Food", "Dinner", "2024-02-01")
+    search = TransactionSearch(manager)
+
+    results = search.search_by_category_and_date("Food", "2024-01-01", "2024-01-31")
+    assert [t.description for t in results] == ["Lunch"]
+
+
+def test_search_as_you_type_refines_in_memory(manager):
+    """Test narrowing a complete live search filters the previous matches."""
+    manager.add_expense(10, "Food", "Grocery run")
+    manager.add_expense(20, "Food", "Green salad")
+    manager.add_expense(30, "Transport", "Gas")
+    search = TransactionSearch(manager, page_size=10)
+
+    assert len(search.search_as_you_type("gr")) == 2
+    queries = manager.cache.stats()["misses"]
+    assert [t.description for t in search.search_as_you_type("gro")] == ["Grocery run"]
+    assert search.count_last() == 1
+    assert manager.cache.stats()["misses"] == queries
+
+    manager.add_expense(40, "Food", "Groceries")
+    assert len(search.search_as_you_type("groc")) == 2
+
+
+def test_search_as_you_type_requeries_capped_results(manager):
+    """Test a capped live search is not refined in memory."""
+    for day in range(1, 6):
+        manager.db.add_transaction("expense", day, "Food", f"Meal {day}", f"2024-01-0{day}")
+    search = TransactionSearch(manager)
+
+    assert len(search.search_as_you_type("meal", limit=2)) == 2
+    assert search.count_last() == 5
+    assert [t.description for t in search.search_as_you_type("meal 3", limit=2)] == ["Meal 3"]
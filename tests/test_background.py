@@ -0,0 +1,102 @@
+"""Test background loader module."""
+
+import os
+import threading
+
+import pytest
+
+from src.background import BackgroundLoader
+from src.expense_manager import ExpenseManager
+
+
+class FakeRoot:
+    """Stand-in for a Tk root whose after() callbacks are run by the test."""
+
+    def __init__(self):
+        self.scheduled = None
+
+    def after(self, ms, func):
+        self.scheduled = func
+        return "poll"
+
+    def after_cancel(self, after_id):
+        self.scheduled = None
+
+
+@pytest.fixture
+def loader():
+    """Create a loader over a test database."""
+    db_path = "test_expenses.db"
+    ExpenseManager(db_path).close()
+    root = FakeRoot()
+    busy = []
+    bg = BackgroundLoader(root, db_path, on_busy_change=busy.append)
+    bg.busy_changes = busy
+    yield bg
+    bg.shutdown()
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+
+def wait_for(bg, done):
+    """Drive the poll until done() holds."""
+    for _ in range(500):
+        bg.root.scheduled()
+        if done():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("background request did not finish")
+
+
+def test_results_delivered_on_poll(loader):
+    """Test results reach the callback and busy state is reported."""
+    results = []
+    loader.submit("balance", lambda em: em.calculate_balance(), results.append)
+    wait_for(loader, lambda: results)
+
+    assert results == [0]
+    assert loader.busy_changes == [True, False]
+
+
+def test_stale_results_dropped(loader):
+    """Test only the latest request for a key is delivered."""
+    gate = threading.Event()
+    results = []
+    loader.submit("list", lambda em: gate.wait(2) and "old", results.append)
+    loader.submit("list", lambda em: "new", results.append)
+    gate.set()
+    wait_for(loader, lambda: loader.pending == 0)
+
+    assert results == ["new"]
+
+
+def test_errors_go_to_error_callback(loader):
+    """Test worker exceptions are passed to the error callback."""
+    errors = []
+    loader.submit("bad", lambda em: 1 / 0, None, errors.append)
+    wait_for(loader, lambda: errors)
+
+    assert isinstance(errors[0], ZeroDivisionError)
+
+
+def test_interrupt_running_query(loader):
+    """Test cancelling with interrupt aborts a running query."""
+    started = threading.Event()
+    results = []
+
+    def slow(em):
+        started.set()
+        em.db.cursor.execute(
+            "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 100000000) "
+            "SELECT COUNT(*) FROM c"
+        )
+        return em.db.cursor.fetchone()
+
+    loader.submit("slow", slow, results.append)
+    assert started.wait(2)
+    threading.Event().wait(0.1)
+    loader.cancel("slow", interrupt=True)
+    wait_for(loader, lambda: loader.pending == 0)
+
+    assert results == []
+    assert loader._em.cache.version == 1
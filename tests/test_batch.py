@@ -0,0 +1,77 @@
+"""Test batch mode."""
+
+import io
+import json
+import os
+
+import pytest
+
+from src.batch import BatchRunner, run_batch
+from src.expense_manager import ExpenseManager
+
+
+@pytest.fixture
+def manager():
+    """Create test expense manager."""
+    em = ExpenseManager("test_expenses.db")
+    yield em
+    em.close()
+    if os.path.exists("test_expenses.db"):
+        os.remove("test_expenses.db")
+
+
+def run_lines(manager, lines):
+    """Run lines and return the parsed JSON output."""
+    output = io.StringIO()
+    BatchRunner(manager, output).run(lines)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_batch_commands_emit_json(manager, capsys):
+    """Test each command yields one JSON line and chatter is suppressed."""
+    results = run_lines(manager, [
+        "# nightly import",
+        'add-expense 12.50 Food "Lunch with team"',
+        "add-income 3000 Mom's gift",
+        "add-expense 5 Nope Snack",
+        "summary",
+    ])
+
+    assert [r.get("line") for r in results[:-1]] == [2, 3, 4, 5]
+    assert results[0] == {"line": 2, "command": "add-expense", "ok": True, "id": 1}
+    assert results[2]["ok"] is False
+    assert results[2]["error"].startswith("Invalid category")
+    assert results[3]["balance"] == 2987.5
+    assert results[-1]["done"] is True
+    assert (results[-1]["succeeded"], results[-1]["failed"]) == (3, 1)
+    assert manager.get_income()[0].description == "Mom's gift"
+    assert capsys.readouterr().out == ""
+
+
+def test_failing_command_does_not_abort_batch(manager):
+    """Test a command that raises reports an error line and the batch continues."""
+    output = io.StringIO()
+    runner = BatchRunner(manager, output)
+
+    def explode(args):
+        raise OverflowError("too big")
+
+    runner.commands["summary"] = explode
+    runner.run(["add-expense 5 Food Snack", "summary", "add-expense inf Food x", "add-income 10 Tip"])
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert results[1] == {"line": 2, "command": "summary", "ok": False, "error": "too big"}
+    assert results[2]["ok"] is False
+    assert (results[-1]["succeeded"], results[-1]["failed"]) == (2, 2)
+    assert len(manager.get_all_transactions()) == 2
+
+
+def test_run_batch_file(manager, tmp_path):
+    """Test run_batch reads a file and reports failures in the exit status."""
+    script = tmp_path / "commands.txt"
+    script.write_text("add-expense 10 Food Bread\nexit\nadd-expense 10 Food Milk\n")
+    assert run_batch(str(script), "test_expenses.db") == 0
+    assert [t.description for t in manager.get_expenses()] == ["Bread"]
+
+    script.write_text("delete\n")
+    assert run_batch(str(script), "test_expenses.db") == 1
@@ -0,0 +1,54 @@
+"""Test chart cache module."""
+
+import os
+import time
+
+from src.chart_cache import ChartCache
+
+
+def write(path, size):
+    """Write a file of size bytes."""
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_fetch_after_store(tmp_path):
+    """Test a stored chart is copied back on a matching key only."""
+    cache = ChartCache(tmp_path / "cache")
+    key = cache.key("pie", (10, 7), 300, {"Food": 12.5})
+    destination = tmp_path / "chart.png"
+
+    assert not cache.fetch(key, destination)
+    write(destination, 10)
+    cache.store(key, destination)
+    destination.unlink()
+
+    assert cache.fetch(key, destination)
+    assert destination.read_bytes() == b"x" * 10
+    assert not cache.fetch(cache.key("pie", (10, 7), 300, {"Food": 12.6}), destination)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_key_covers_render_parameters():
+    """Test size and dpi are part of the key."""
+    data = {"Food": 1}
+    assert ChartCache.key("pie", (10, 7), 300, data) != ChartCache.key("pie", (10, 7), 150, data)
+    assert ChartCache.key("pie", (10, 7), 300, data) != ChartCache.key("pie", (12, 6), 300, data)
+
+
+def test_evicts_by_size_and_age(tmp_path):
+    """Test old files and least recently used files beyond the size limit go first."""
+    cache = ChartCache(tmp_path / "cache", max_bytes=300, max_age_days=1)
+    for name in ("a", "b", "c"):
+        cache.store(name, write(tmp_path / f"{name}.png", 100))
+    old = time.time() - 3600
+    os.utime(cache.path_for("a"), (old, old))
+    os.utime(cache.path_for("c"), (old - 2 * 86400, old - 2 * 86400))
+
+    cache.evict()
+    assert not cache.path_for("c").exists()
+    assert cache.path_for("a").exists() and cache.path_for("b").exists()
+
+    cache.max_bytes = 200
+    cache.store("d", write(tmp_path / "d.png", 100))
+    assert sorted(p.stem for p in (tmp_path / "cache").iterdir()) == ["b", "d"]
@@ -0,0 +1,139 @@
+"""Test CSV import."""
+
+import pytest
+import os
+from src.expense_manager import ExpenseManager
+from src.report_generator import ReportGenerator
+
+
+@pytest.fixture
+def manager():
+    """Create test expense manager."""
+    em = ExpenseManager("test_expenses.db")
+    yield em
+    em.close()
+    for path in ("test_expenses.db", "test_import.csv", "test_export.csv"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def write(text, path="test_import.csv"):
+    """Write a CSV fixture file."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return path
+
+
+def test_import_own_export(manager):
+    """Test a CSV export imports back into an empty database."""
+    manager.db.add_transaction("income", 1000, "Salary/Income", "Salary", "2024-01-01")
+    manager.db.add_transaction("expense", 12.5, "Food", "Lunch, with team", "2024-01-02")
+    ReportGenerator(manager).export_to_csv("test_export.csv")
+    manager.db.cursor.execute("DELETE FROM transactions")
+    manager.db.connection.commit()
+
+    summary = manager.import_csv("test_export.csv")
+    assert summary["imported"] == 2
+    rows = sorted((t.date, t.transaction_type, t.amount, t.category, t.description)
+                  for t in manager.get_all_transactions())
+    assert rows == [
+        ("2024-01-01", "income", 1000, "Salary/Income", "Salary"),
+        ("2024-01-02", "expense", 12.5, "Food", "Lunch, with team"),
+    ]
+
+
+def test_import_bank_statement(manager):
+    """Test signed amounts, day-first dates and category mapping."""
+    path = write(
+        "Transaction Date,Details,Category,Amount\n"
+        "25/01/2024,Paycheck,,\"1,500.00\"\n"
+        "26/01/2024,Jeepney,transport,-13.00\n"
+        "27/01/2024,Cinema,Movies,(250.00)\n"
+    )
+    summary = manager.import_csv(path, category_map={"movies": "Entertainment"})
+
+    assert summary["imported"] == 3
+    rows = sorted((t.date, t.transaction_type, t.amount, t.category)
+                  for t in manager.get_all_transactions())
+    assert rows == [
+        ("2024-01-25", "income", 1500, "Salary/Income"),
+        ("2024-01-26", "expense", 13, "Transport"),
+        ("2024-01-27", "expense", 250, "Entertainment"),
+    ]
+
+
+def test_import_debit_credit_tsv(manager):
+    """Test separate debit/credit columns in a tab-separated file."""
+    path = write("Date\tMemo\tDebit\tCredit\n2024-03-01\tRent\t900\t\n2024-03-02\tRefund\t\t20\n",
+                 "test_import.tsv")
+    try:
+        summary = manager.import_csv(path)
+    finally:
+        os.remove(path)
+
+    assert summary["imported"] == 2
+    assert [t.description for t in manager.get_expenses()] == ["Rent"]
+    assert [t.description for t in manager.get_income()] == ["Refund"]
+
+
+def test_reimport_skips_duplicates(manager):
+    """Test importing the same file twice adds nothing the second time."""
+    path = write("date,type,amount,description\n2024-01-01,expense,5,Coffee\n2024-01-01,expense,5,Coffee\n")
+
+    first = manager.import_csv(path)
+    second = manager.import_csv(path)
+    assert first["imported"] == 2
+    assert second["imported"] == 0
+    assert second["duplicates"] == 2
+    assert len(manager.get_all_transactions()) == 2
+
+
+def test_invalid_rows_reported(manager):
+    """Test bad rows are skipped with their line numbers."""
+    path = write(
+        "date,type,amount,description\n"
+        "2024-01-01,expense,5,Coffee\n"
+        "not a date,expense,5,Tea\n"
+        "2024-01-03,expense,abc,Juice\n"
+        "2024-01-04,transfer,5,Savings\n"
+    )
+    summary = manager.import_csv(path)
+
+    assert summary["imported"] == 1
+    assert summary["invalid"] == 3
+    assert [line for line, _ in summary["errors"]] == [3, 4, 5]
+
+
+def test_non_finite_amounts_reported(manager):
+    """Test nan, inf and out-of-range amounts are invalid rows, not import errors."""
+    path = write(
+        "Date,Description,Amount\n"
+        "2024-01-01,Coffee,-5.00\n"
+        "2024-01-02,Glitch,nan\n"
+        "2024-01-03,Overflow,-inf\n"
+        "2024-01-04,Typo,1e400\n"
+        "2024-01-05,Huge,-1e300\n"
+    )
+    summary = manager.import_csv(path)
+
+    assert summary["imported"] == 1
+    assert summary["invalid"] == 4
+    assert [line for line, _ in summary["errors"]] == [3, 4, 5, 6]
+
+
+def test_import_progress_and_chunks(manager):
+    """Test progress is reported once per chunk and reaches the file size."""
+    lines = "".join(f"2024-01-{day:02d},expense,{day},Item {day}\n" for day in range(1, 26))
+    path = write("date,type,amount,description\n" + lines)
+    calls = []
+
+    summary = manager.import_csv(path, chunk_size=10, progress=lambda *args: calls.append(args))
+    assert summary["imported"] == 25
+    assert len(calls) == 3
+    assert calls[-1] == (os.path.getsize(path), os.path.getsize(path), 25)
+
+
+def test_import_missing_columns(manager):
+    """Test a file without a date column is rejected."""
+    path = write("when,amount\n2024-01-01,5\n")
+    assert manager.import_csv(path) is None
@@ -0,0 +1,33 @@
+"""Test the embedded dashboard chart."""
+
+import tkinter as tk
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+
+@pytest.fixture
+def chart():
+    """Create a chart in a hidden Tk window."""
+    from src.dashboard_chart import DashboardChart
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    root.withdraw()
+    yield DashboardChart(root, ["Food", "Rent", "Other"])
+    root.destroy()
+
+
+def test_update_changes_only_moved_bars(chart):
+    """Test bars keep their artists and only changed totals are touched."""
+    bars = list(chart.bars)
+    assert chart.update({"Food": 50, "Rent": 500}) == 2
+    assert chart.update({"Food": 80, "Rent": 500}) == 1
+    assert chart.update({"Food": 80, "Rent": 500, "Gifts": 20}) == 1
+
+    assert list(chart.bars) == bars
+    assert [bar.get_width() for bar in chart.bars] == [80, 500, 20]
+    assert chart.ax.get_xlim()[1] >= 500
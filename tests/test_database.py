@@ -3,7 +3,7 @@
 import pytest
 import os
 import sqlite3
-from src.database import Database
+from src.database import Database, SCHEMA_VERSION, TransactionQuery
 
 
 @pytest.fixture
@@ -56,3 +56,233 @@ def test_delete_transaction(test_db):
 
     transactions = test_db.get_all_transactions()
     assert len(transactions) == 0
+
+
+def test_schema_version_current(test_db):
+    """Test new databases are created at the latest schema version."""
+    assert test_db.get_schema_version() == SCHEMA_VERSION
+
+
+def test_migrate_legacy_database():
+    """Test an unversioned database is upgraded in place."""
+    path = "test_legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE transactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            type TEXT NOT NULL,
+            amount REAL NOT NULL,
+            category TEXT,
+            description TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute(
+        "INSERT INTO transactions (date, type, amount, category, description) "
+        "VALUES ('2024-01-01', 'expense', 12.5, 'Food', 'Lunch')"
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    try:
+        assert db.get_schema_version() == SCHEMA_VERSION
+        db.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        indexes = {row[0] for row in db.cursor.fetchall()}
+        assert "idx_transactions_type_date" in indexes
+        transactions = db.get_all_transactions()
+        assert len(transactions) == 1
+        assert transactions[0][3] == 12.5
+        assert db.get_total_by_type("expense") == 12.5
+    finally:
+        db.close()
+        os.remove(path)
+
+
+def test_add_transactions_bulk(test_db):
+    """Test bulk insert skips failing rows without aborting the batch."""
+    rows = [
+        ("expense", 10.0, "Food", "Lunch", "2024-01-01"),
+        ("expense", None, "Food", "Missing amount", "2024-01-02"),
+        ("income", 100.0, "Salary/Income", "Pay"),
+    ]
+    inserted, failures = test_db.add_transactions_bulk(rows, chunk_size=10)
+
+    assert inserted == 2
+    assert [index for index, _ in failures] == [1]
+    assert len(test_db.get_all_transactions()) == 2
+
+
+def test_reader_alongside_writer(test_db):
+    """Test a reader does not block a writer's commit under WAL."""
+    test_db.add_transaction("expense", 10.0, "Food", "Lunch")
+    test_db.add_transaction("expense", 20.0, "Food", "Dinner")
+
+    reader = Database("test_expenses.db", profile="readonly")
+    try:
+        cursor = reader.connection.execute("SELECT id FROM transactions")
+        cursor.fetchone()  # keep the read transaction open
+
+        assert test_db.add_transaction("expense", 30.0, "Food", "Snack") is True
+        assert len(reader.get_all_transactions()) == 2
+    finally:
+        reader.close()
+    assert len(test_db.get_all_transactions()) == 3
+
+
+def test_readonly_profile_rejects_writes(test_db):
+    """Test the readonly profile refuses writes."""
+    reader = Database("test_expenses.db", profile="readonly")
+    try:
+        assert reader.add_transaction("expense", 10.0, "Food", "Lunch") is False
+    finally:
+        reader.close()
+
+
+def test_unknown_profile():
+    """Test an unknown connection profile is rejected."""
+    with pytest.raises(ValueError):
+        Database("test_expenses.db", profile="turbo")
+
+
+def test_iter_transactions(test_db):
+    """Test streaming iteration with filters across several batches."""
+    for day in range(1, 8):
+        test_db.add_transaction("expense", day, "Food", "Meal", f"2024-01-0{day}")
+    test_db.add_transaction("income", 100, "Salary/Income", "Pay", "2024-01-03")
+
+    rows = list(test_db.iter_transactions(batch_size=3))
+    assert len(rows) == 8
+    assert [r[1] for r in rows] == sorted((r[1] for r in rows), reverse=True)
+
+    rows = list(test_db.iter_transactions(
+        transaction_type="expense", start_date="2024-01-02", end_date="2024-01-05", batch_size=2
+    ))
+    assert [r[3] for r in rows] == [5, 4, 3, 2]
+
+
+def test_iter_column_batches(test_db):
+    """Test column batches carry integer centavos and respect the query."""
+    test_db.add_transaction("expense", 12.34, "Food", "Lunch", "2024-01-02")
+    test_db.add_transaction("expense", 5, "Transport", "Bus", "2024-01-03")
+    test_db.add_transaction("income", 100, "Salary/Income", "Pay", "2024-01-01")
+
+    batches = list(test_db.iter_column_batches(TransactionQuery().of_type("expense"), batch_size=1))
+    assert len(batches) == 2
+    ids, dates, types, cents, categories, descriptions = batches[1]
+    assert (ids, dates, types, cents, categories, descriptions) == (
+        (1,), ("2024-01-02",), ("expense",), (1234,), ("Food",), ("Lunch",)
+    )
+
+
+def test_search_descriptions(test_db):
+    """Test full-text search matches word prefixes and follows deletes."""
+    test_db.add_transaction("expense", 10.0, "Food", "Weekly groceries")
+    test_db.add_transaction("expense", 20.0, "Transport", "Gas station")
+    test_db.add_transaction("expense", 30.0, "Food", "Grocery run and gas")
+
+    assert test_db.fts_enabled is True
+    assert {r[5] for r in test_db.search_descriptions("groc")} == {
+        "Weekly groceries", "Grocery run and gas"
+    }
+    assert [r[5] for r in test_db.search_descriptions("GROC gas")] == ["Grocery run and gas"]
+
+    test_db.delete_transaction(test_db.search_descriptions("station")[0][0])
+    assert test_db.search_descriptions("station") == []
+
+
+def test_search_descriptions_without_fts(test_db):
+    """Test search falls back to substring matching without FTS5."""
+    for trigger in ("insert", "delete", "update"):
+        test_db.cursor.execute(f"DROP TRIGGER transactions_fts_{trigger}")
+    test_db.cursor.execute("DROP TABLE transactions_fts")
+    test_db.add_transaction("expense", 10.0, "Food", "Weekly groceries")
+    test_db.add_transaction("expense", 5.0, "Food", "100% juice")
+
+    assert test_db.fts_enabled is False
+    assert [r[5] for r in test_db.search_descriptions("ocer")] == ["Weekly groceries"]
+    assert [r[5] for r in test_db.search_descriptions("0%")] == ["100% juice"]
+
+
+def test_bulk_insert_updates_search_index(test_db):
+    """Test bulk-inserted rows are searchable and the insert trigger is restored."""
+    test_db.add_transactions_bulk([("expense", 10.0, "Food", "Bulk groceries")])
+    test_db.add_transaction("expense", 5.0, "Food", "Single groceries")
+
+    assert len(test_db.search_descriptions("groceries")) == 2
+
+
+def test_bulk_insert_restores_triggers_when_rows_raise(test_db):
+    """Test an exception from the rows iterable rolls back and keeps the triggers."""
+    def rows():
+        yield ("expense", 10.0, "Food", "Lost groceries")
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError):
+        test_db.add_transactions_bulk(rows())
+    test_db.add_transaction("expense", 5.0, "Food", "Single groceries")
+
+    assert [r[5] for r in test_db.search_descriptions("groceries")] == ["Single groceries"]
+    assert test_db.get_totals_by_type() == {"expense": 5.0}
+
+
+def test_find_transactions_query(test_db):
+    """Test the query builder combines filters, ordering and paging."""
+    test_db.add_transaction("expense", 5.0, "Food", "Snack", "2024-01-01")
+    test_db.add_transaction("expense", 50.0, "Food", "Groceries", "2024-01-10")
+    test_db.add_transaction("expense", 500.0, "Rent", "Rent", "2024-01-15")
+    test_db.add_transaction("expense", 40.0, "Transport", "Gas", "2024-01-20")
+    test_db.add_transaction("income", 45.0, "Salary/Income", "Refund", "2024-01-12")
+
+    query = (
+        TransactionQuery()
+        .of_type("expense")
+        .in_categories("Food", "Rent", "Transport")
+        .between_dates("2024-01-05", "2024-01-31")
+        .between_amounts(10, 100)
+        .sorted_by("amount", descending=False)
+    )
+    assert [r[5] for r in test_db.find_transactions(query)] == ["Gas", "Groceries"]
+    assert test_db.count_transactions(query.page(1)) == 2
+    assert [r[5] for r in test_db.find_transactions(query.page(1, 1))] == ["Groceries"]
+    assert [r[5] for r in test_db.find_transactions(query.matching("groc"))] == ["Groceries"]
+
+
+def test_keyset_paging_matches_offset(test_db):
+    """Test after() pages through the same rows as LIMIT/OFFSET."""
+    test_db.add_transactions_bulk(
+        ("expense", day % 4 + 1, "Food", f"Item {day}", f"2024-01-{day // 3 + 1:02d}")
+        for day in range(20)
+    )
+
+    for query in (TransactionQuery(), TransactionQuery().sorted_by("amount", descending=False)):
+        expected = test_db.find_transactions(query)
+        seen = []
+        page_query = query.page(6)
+        while True:
+            rows = test_db.find_transactions(page_query)
+            seen.extend(rows)
+            if len(rows) < 6:
+                break
+            last = rows[-1]
+            key = (last[1], last[0]) if query.order == "date" else (round(last[3] * 100), last[0])
+            page_query = query.after(key).page(6)
+        assert seen == expected
+
+    with pytest.raises(ValueError):
+        TransactionQuery().matching("item").sorted_by("rank").after(("2024-01-01", 1)).compile()
+
+
+def test_transaction_block_rolls_back(test_db):
+    """Test writes inside transaction() are committed or rolled back together."""
+    with test_db.transaction():
+        test_db.add_transaction("expense", 10, "Food", "Bread")
+        test_db.add_transactions_bulk([("expense", 20, "Food", "Milk")])
+
+    with pytest.raises(RuntimeError):
+        with test_db.transaction():
+            test_db.add_transaction("expense", 30, "Food", "Eggs")
+            raise RuntimeError("abort")
+
+    assert [row[5] for row in test_db.get_all_transactions()] == ["Milk", "Bread"]
@@ -63,3 +63,179 @@ def test_invalid_category(manager, capsys):
 
     captured = capsys.readouterr()
     assert "Invalid category" in captured.out
+
+
+def test_totals_empty_database(manager):
+    """Test totals on an empty database."""
+    assert manager.calculate_total_income() == 0
+    assert manager.calculate_total_expenses() == 0
+    assert manager.calculate_balance() == 0
+    assert manager.get_expenses_by_category_summary() == {}
+    assert manager.get_monthly_summary() == {}
+
+
+def test_monthly_summary(manager):
+    """Test monthly summary aggregation."""
+    manager.db.add_transaction("income", 3000, "Salary/Income", "Salary", "2024-01-05")
+    manager.db.add_transaction("expense", 200, "Food", "Groceries", "2024-01-20")
+    manager.db.add_transaction("expense", 100, "Transport", "Gas", "2024-02-03")
+
+    summary = manager.get_monthly_summary()
+    assert list(summary) == ["2024-01", "2024-02"]
+    assert summary["2024-01"] == {"income": 3000, "expense": 200}
+    assert summary["2024-02"] == {"income": 0, "expense": 100}
+
+
+def test_rejects_non_finite_and_huge_amounts(manager):
+    """Test inf, NaN and oversized amounts are refused without raising."""
+    for amount in (float("inf"), float("nan"), 1e300):
+        assert manager.add_expense(amount, "Food", "Bad") is False
+        assert manager.add_income(amount, "Bad") is False
+        assert manager.set_budget("Food", amount) is False
+
+    assert manager.db.add_transaction("expense", 1e300, "Food", "Bad") is False
+    assert manager.db.set_budget("Food", float("inf")) is False
+    assert not manager.db.connection.in_transaction
+    assert manager.add_many([("expense", 5, "Food", "Snack")])[0] == 1
+    assert manager.get_budget("Food") is None
+
+
+def test_add_many(manager):
+    """Test bulk adding transactions with per-row failures."""
+    added, failures = manager.add_many([
+        ("income", 3000, "Salary/Income", "Salary", "2024-01-01"),
+        ("expense", 50, "Food", "Groceries"),
+        ("expense", -5, "Food", "Negative"),
+        ("expense", 20, "InvalidCategory", "Bad category"),
+        ("expense", 30, "Transport", "Bad date", "2024-13-45"),
+        ("expense", 10, "Transport", "Bus", "2024-01-02"),
+    ], chunk_size=2)
+
+    assert added == 3
+    assert [index for index, _ in failures] == [2, 3, 4]
+    assert len(manager.get_all_transactions()) == 3
+    assert manager.calculate_balance() == 2940
+
+
+def test_add_many_reports_bad_amounts_and_rollback(manager):
+    """Test non-finite amounts fail per row and a rolled-back load fails every row."""
+    added, failures = manager.add_many([
+        ("expense", float("inf"), "Food", "Inf"),
+        ("expense", 1e300, "Food", "Huge"),
+        ("expense", 5, "Food", "Snack"),
+    ])
+    assert added == 1
+    assert [index for index, _ in failures] == [0, 1]
+    inserted, db_failures = manager.db.add_transactions_bulk([("expense", 1e300, "Food", "Huge")])
+    assert (inserted, [index for index, _ in db_failures]) == (0, [0])
+
+    manager.db.cursor.execute("PRAGMA query_only = ON")
+    added, failures = manager.add_many([("expense", 5, "Food", "A"), ("expense", 6, "Food", "B")])
+    manager.db.cursor.execute("PRAGMA query_only = OFF")
+    assert added == 0
+    assert [index for index, _ in failures] == [0, 1]
+
+
+def test_totals_are_exact(manager):
+    """Test centavo amounts sum without float drift."""
+    for _ in range(3):
+        manager.add_expense(0.1, "Food", "Candy")
+    manager.add_income(0.3, "Refund")
+
+    assert manager.calculate_total_expenses() == 0.3
+    assert manager.calculate_balance() == 0
+    assert manager.get_expenses()[0].amount_cents == 10
+    assert str(manager.get_expenses()[0].amount_decimal) == "0.10"
+
+
+def test_transactions_batch(manager):
+    """Test columnar batch matches the Transaction list."""
+    manager.add_income(3000, "Salary")
+    manager.add_expense(50, "Food", "Groceries")
+
+    batch = manager.get_transactions_batch()
+    assert [t.to_dict() for t in batch] == [t.to_dict() for t in manager.get_all_transactions()]
+    assert len(manager.get_transactions_batch("expense")) == 1
+
+
+def test_rollups_follow_writes(manager):
+    """Test monthly rollups stay in sync with adds, deletes and bulk loads."""
+    manager.db.add_transaction("expense", 200, "Food", "Groceries", "2024-01-20")
+    manager.db.add_transaction("expense", 100, "Food", "Snacks", "2024-01-21")
+    manager.add_many([("expense", 50, "Transport", "Gas", "2024-02-03")])
+    snack_id = manager.search_descriptions("Snacks")[0].transaction_id
+    manager.delete_transaction(snack_id)
+
+    manager.db.cursor.execute(
+        "SELECT month, type, category, total, count FROM monthly_rollups ORDER BY month"
+    )
+    assert manager.db.cursor.fetchall() == [
+        ("2024-01", "expense", "Food", 20000, 1),
+        ("2024-02", "expense", "Transport", 5000, 1),
+    ]
+
+
+def test_rebuild_rollups(manager):
+    """Test rebuild_rollups repairs a damaged rollup table."""
+    manager.add_expense(50, "Food", "Groceries")
+    manager.db.cursor.execute("UPDATE monthly_rollups SET total = 0")
+    manager.db.connection.commit()
+
+    assert manager.rebuild_rollups() is True
+    assert manager.get_expenses_by_category_summary() == {"Food": 50}
+
+
+def test_query_cache_hits_and_invalidation(manager):
+    """Test repeated reads are cached until the next write."""
+    manager.add_expense(50, "Food", "Groceries")
+
+    assert manager.calculate_total_expenses() == 50
+    assert manager.calculate_total_expenses() == 50
+    stats = manager.cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    manager.add_expense(25, "Food", "Snacks")
+    assert manager.calculate_total_expenses() == 75
+    assert manager.cache.stats()["version"] == 2
+
+
+def test_query_cache_sees_other_connections(manager):
+    """Test commits from another connection invalidate the cache."""
+    manager.add_expense(50, "Food", "Groceries")
+    assert manager.calculate_total_expenses() == 50
+
+    other = ExpenseManager("test_expenses.db")
+    other.add_expense(25, "Food", "Snacks")
+    other.close()
+
+    assert manager.calculate_total_expenses() == 75
+
+
+def test_snapshot_matches_individual_queries(manager):
+    """Test the snapshot agrees with the individual summary methods."""
+    manager.add_income(3000, "Salary")
+    manager.add_expense(500, "Rent", "Monthly rent")
+    manager.add_expense(200.55, "Food", "Groceries")
+    manager.set_budget("Food", 300)
+
+    snapshot = manager.get_snapshot()
+    assert snapshot["income"] == manager.calculate_total_income()
+    assert snapshot["expenses"] == manager.calculate_total_expenses()
+    assert snapshot["balance"] == manager.calculate_balance() == 2299.45
+    assert snapshot["categories"] == manager.get_expenses_by_category_summary()
+    assert snapshot["monthly"] == manager.get_monthly_summary()
+    assert snapshot["budgets"] == manager.check_budget_status()
+
+
+def test_to_dataframe(manager):
+    """Test the DataFrame export has typed columns."""
+    pd = pytest.importorskip("pandas")
+    manager.db.add_transaction("expense", 12.34, "Food", "Lunch", "2024-01-02")
+    manager.db.add_transaction("income", 1000, "Salary/Income", "Salary", "2024-01-01")
+
+    frame = manager.to_dataframe(batch_size=1)
+    assert frame["id"].tolist() == [1, 2]
+    assert frame["amount_cents"].tolist() == [1234, 100000]
+    assert frame["amount"].tolist() == [12.34, 1000.0]
+    assert pd.api.types.is_datetime64_any_dtype(frame["date"])
+    assert isinstance(frame["category"].dtype, pd.CategoricalDtype)
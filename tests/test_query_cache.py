@@ -0,0 +1,23 @@
+"""Test query cache module."""
+
+from src.query_cache import QueryCache
+
+
+def test_lru_eviction():
+    """Test least recently used entries are evicted first."""
+    cache = QueryCache(max_entries=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("c", lambda: 3)
+
+    assert cache.get_or_compute("a", lambda: "recomputed") == 1
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+    assert cache.stats()["entries"] == 2
+
+
+def test_unhashable_keys_bypass_cache():
+    """Test unhashable keys are computed without being stored."""
+    cache = QueryCache()
+    assert cache.get_or_compute(("sum", [1, 2]), lambda: 3) == 3
+    assert cache.stats()["misses"] == 0
@@ -52,3 +52,77 @@ def test_export_csv(report_gen):
     # Cleanup
     if os.path.exists(filename):
         os.remove(filename)
+
+
+def test_export_csv_filtered_gzip(report_gen):
+    """Test filtered export to a gzip file."""
+    import csv
+    import gzip
+
+    rg, em = report_gen
+    em.db.add_transaction("income", 3000, "Salary/Income", "Salary", "2024-01-01")
+    em.db.add_transaction("expense", 50, "Food", "Groceries", "2024-01-02")
+    em.db.add_transaction("expense", 20, "Food", "Snacks", "2024-02-01")
+
+    filename = "test_export.csv.gz"
+    try:
+        assert rg.export_to_csv(filename, transaction_type="expense", end_date="2024-01-31")
+        with gzip.open(filename, "rt", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    assert rows == [
+        ["ID", "Date", "Type", "Category", "Amount", "Description"],
+        ["2", "2024-01-02", "expense", "Food", "50.00", "Groceries"],
+    ]
+    assert rg.last_export["rows"] == 1
+
+
+def test_export_columnar_npz(report_gen):
+    """Test npz export holds typed columns."""
+    np = pytest.importorskip("numpy")
+    rg, em = report_gen
+    em.db.add_transaction("expense", 12.34, "Food", "Lunch", "2024-01-02")
+    em.db.add_transaction("income", 1000, "Salary/Income", "Salary", "2024-01-01")
+
+    filename = "test_export.npz"
+    try:
+        assert rg.export_columnar(filename)
+        with np.load(filename) as data:
+            assert data["id"].tolist() == [1, 2]
+            assert data["amount_cents"].dtype == np.int64
+            assert data["amount_cents"].tolist() == [1234, 100000]
+            assert str(data["date"][0]) == "2024-01-02"
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+
+def test_export_columnar_parquet(report_gen):
+    """Test Parquet export round trip."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    rg, em = report_gen
+    em.db.add_transaction("expense", 12.34, "Food", "Lunch", "2024-01-02")
+
+    filename = "test_export.parquet"
+    try:
+        assert rg.export_columnar(filename, batch_size=1)
+        table = pq.read_table(filename)
+        assert table.column("amount_cents").to_pylist() == [1234]
+        assert table.column("category").to_pylist() == ["Food"]
+    finally:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+
+def test_export_columnar_missing_dependency(report_gen, monkeypatch):
+    """Test a format whose library is missing fails cleanly."""
+    import src.report_generator as report_generator
+
+    monkeypatch.setattr(report_generator, "HAS_PYARROW", False)
+    rg, em = report_gen
+    em.db.add_transaction("expense", 5, "Food", "Tea", "2024-01-02")
+    assert rg.export_columnar("test_export.parquet") is False
+    assert not os.path.exists("test_export.parquet")
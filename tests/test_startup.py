@@ -0,0 +1,44 @@
+"""Test startup cost of the entry points."""
+
+import os
+import sqlite3
+
+import pytest
+
+from benchmarks.bench_startup import (
+    ENTRY_POINTS,
+    STARTUP_BUDGET_MS,
+    heavy_imports,
+    import_profile,
+)
+from src.database import Database
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS.values())
+def test_entry_point_import_budget(module):
+    """Test entry points skip optional heavy packages and start within budget."""
+    if module == "run":
+        pytest.importorskip("colorama")
+    profile = import_profile(module)
+
+    assert heavy_imports(profile) == []
+    assert profile[module] / 1000 <= STARTUP_BUDGET_MS
+
+
+def test_reopen_runs_no_ddl(monkeypatch):
+    """Test opening an up-to-date database only runs PRAGMAs."""
+    Database("test_expenses.db").close()
+    statements = []
+    connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        connection = connect(*args, **kwargs)
+        connection.set_trace_callback(statements.append)
+        return connection
+
+    monkeypatch.setattr(sqlite3, "connect", traced_connect)
+    Database("test_expenses.db").close()
+    os.remove("test_expenses.db")
+
+    assert statements
+    assert all(s.startswith("PRAGMA") for s in statements)
@@ -0,0 +1,273 @@
+"""Test storage backends behave the same."""
+
+import os
+
+import pytest
+
+from src.database import Database, StorageBackend, TransactionQuery
+from src.expense_manager import ExpenseManager
+from src.storage import LogStorage, MemoryStorage, open_storage
+from src.transaction import content_hash
+
+ROWS = [
+    ("income", 3000, "Salary/Income", "Monthly salary", "2024-01-05"),
+    ("expense", 120.50, "Food", "Groceries at the market", "2024-01-10"),
+    ("expense", 45, "Transport", "Taxi to work", "2024-01-10"),
+    ("expense", 800, "Rent", "Monthly rent", "2024-02-01"),
+    ("expense", 15.25, "Food", "Coffee and café snacks", "2024-02-03"),
+    ("expense", 60, None, "Misc", "2024-02-03"),
+]
+
+
+@pytest.fixture(params=["sqlite", "memory", "log"])
+def storage(request):
+    """Open each backend over an empty store."""
+    paths = {"sqlite": "test_expenses.db", "log": "test_expenses.log"}
+    path = paths.get(request.param)
+    backend = open_storage(f"{request.param}:///{path or ''}")
+    yield backend
+    backend.close()
+    for suffix in ("", "-wal", "-shm"):
+        if path and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+@pytest.fixture
+def seeded(storage):
+    """Backend holding ROWS."""
+    assert storage.add_transactions_bulk(ROWS) == (len(ROWS), [])
+    return storage
+
+
+def ids(rows):
+    """Transaction ids of rows."""
+    return [row[0] for row in rows]
+
+
+def test_open_storage_schemes():
+    """Test URLs select the backend."""
+    assert isinstance(open_storage("memory://"), MemoryStorage)
+    with pytest.raises(ValueError):
+        open_storage("ftp://example.com/expenses.db")
+    db = open_storage("sqlite:///test_expenses.db?profile=fast")
+    try:
+        assert isinstance(db, Database)
+        assert db.profile == "fast"
+    finally:
+        db.close()
+        os.remove("test_expenses.db")
+
+
+def test_backends_implement_the_interface(storage):
+    """Test every backend is a complete StorageBackend."""
+    assert isinstance(storage, StorageBackend)
+    assert not type(storage).__abstractmethods__
+
+
+def test_incomplete_backend_cannot_be_created():
+    """Test a backend missing a method fails when created, not when called."""
+    class Incomplete(StorageBackend):
+        def get_data_version(self):
+            return 0
+
+    with pytest.raises(TypeError, match="add_transaction"):
+        Incomplete()
+
+
+def test_add_get_delete(storage):
+    """Test single writes and lookups."""
+    assert storage.add_transaction("expense", 12.34, "Food", "Lunch", "2024-03-01") is True
+    transaction_id = storage.last_insert_id
+    assert storage.get_transaction(transaction_id) == (
+        transaction_id, "2024-03-01", "expense", 12.34, "Food", "Lunch"
+    )
+    assert storage.delete_transaction(transaction_id) is True
+    assert storage.get_transaction(transaction_id) is None
+    assert storage.get_all_transactions() == []
+    storage.add_transaction("expense", 1, "Food", "Snack", "2024-03-01")
+    assert storage.last_insert_id == transaction_id + 1  # ids are never reused
+
+
+def test_out_of_range_amounts_fail_cleanly(storage):
+    """Test amounts that do not fit in 64-bit centavos are refused, not raised."""
+    assert storage.add_transaction("expense", 1e300, "Food", "Huge", "2024-03-01") is False
+    assert storage.add_transaction("expense", float("nan"), "Food", "NaN", "2024-03-01") is False
+    assert storage.set_budget("Food", float("inf")) is False
+    assert storage.add_transaction("expense", 5, "Food", "Snack", "2024-03-01") is True
+    assert ids(storage.get_all_transactions()) == [storage.last_insert_id]
+    assert storage.get_budgets() == []
+
+
+def test_bulk_insert_reports_bad_rows(storage):
+    """Test bad rows are skipped and reported by index."""
+    rows = [ROWS[1], ("expense", "abc", "Food", "Bad amount", "2024-01-01"), ROWS[2]]
+    inserted, failures = storage.add_transactions_bulk(rows)
+    assert inserted == 2
+    assert [index for index, _ in failures] == [1]
+    assert storage.count_transactions(TransactionQuery()) == 2
+
+
+def test_queries(seeded):
+    """Test filters, orderings and paging."""
+    everything = seeded.get_all_transactions()
+    assert ids(everything) == [6, 5, 4, 3, 2, 1]
+    assert everything[1] == (5, "2024-02-03", "expense", 15.25, "Food", "Coffee and café snacks")
+
+    query = TransactionQuery().of_type("expense").between_dates("2024-01-10", "2024-02-01")
+    assert ids(seeded.find_transactions(query)) == [4, 3, 2]
+    assert ids(seeded.find_transactions(query.sorted_by("amount", descending=False))) == [3, 2, 4]
+    assert ids(seeded.find_transactions(TransactionQuery().in_categories("Food", "Rent"))) == [5, 4, 2]
+    assert ids(seeded.find_transactions(TransactionQuery().between_amounts(45, 120.50))) == [6, 3, 2]
+    assert ids(seeded.get_transactions_by_category("Food")) == [5, 2]
+    assert ids(seeded.get_transactions_by_type("income")) == [1]
+    assert ids(seeded.get_transactions_by_date_range("2024-01-01", "2024-01-31")) == [3, 2, 1]
+
+    paged = TransactionQuery().page(2, 1)
+    assert ids(seeded.find_transactions(paged)) == [5, 4]
+    assert seeded.count_transactions(paged) == 6
+    first = seeded.find_transactions(TransactionQuery().page(2))
+    after = TransactionQuery().after((first[-1][1], first[-1][0])).page(2)
+    assert ids(seeded.find_transactions(after)) == [4, 3]
+    assert ids(seeded.iter_transactions(category="Food", batch_size=1)) == [5, 2]
+
+
+def test_text_search(seeded):
+    """Test description search matches word prefixes, ignoring case and accents."""
+    assert ids(seeded.search_descriptions("groc")) == [2]
+    assert ids(seeded.search_descriptions("CAFE")) == [5]
+    assert ids(seeded.find_transactions(TransactionQuery().matching("monthly"))) == [4, 1]
+    assert seeded.count_transactions(TransactionQuery().matching("monthly re")) == 1
+    assert seeded.search_descriptions("!!") == []
+
+
+def test_column_batches(seeded):
+    """Test columnar reads return centavos in query order."""
+    batches = list(seeded.iter_column_batches(TransactionQuery().of_type("expense"), batch_size=3))
+    assert [len(batch[0]) for batch in batches] == [3, 2]
+    assert batches[0][0] == (6, 5, 4)
+    assert batches[0][3] == (6000, 1525, 80000)
+
+
+def test_totals(seeded):
+    """Test totals, rollups and the dashboard snapshot."""
+    assert seeded.get_total_by_type("expense") == 1040.75
+    assert seeded.get_totals_by_type() == {"income": 3000.0, "expense": 1040.75}
+    assert seeded.get_category_totals() == [
+        ("Rent", 800.0), ("Food", 135.75), (None, 60.0), ("Transport", 45.0)
+    ]
+    assert seeded.get_monthly_totals() == [("2024-01", 3000.0, 165.5), ("2024-02", 0.0, 875.25)]
+    assert seeded.get_daily_net() == [
+        ("2024-01-05", 300000), ("2024-01-10", -16550), ("2024-02-01", -80000), ("2024-02-03", -7525)
+    ]
+    seeded.delete_transaction(4)
+    assert seeded.rebuild_rollups() is True
+    assert sorted(seeded.get_snapshot_rows(), key=str) == sorted([
+        ("rollup", "2024-01", "income", "Salary/Income", 300000),
+        ("rollup", "2024-01", "expense", "Food", 12050),
+        ("rollup", "2024-01", "expense", "Transport", 4500),
+        ("rollup", "2024-02", "expense", "Food", 1525),
+        ("rollup", "2024-02", "expense", None, 6000),
+    ], key=str)
+
+
+def test_budgets(storage):
+    """Test setting, replacing and reading budgets."""
+    assert storage.get_budget("Food") is None
+    storage.set_budget("Food", 500)
+    storage.set_budget("Rent", 900)
+    storage.set_budget("Food", 650.5)
+    assert storage.get_budget("Food") == 650.5
+    assert sorted(storage.get_budgets()) == [("Food", 650.5), ("Rent", 900.0)]
+
+
+def test_transaction_rolls_back(seeded):
+    """Test a failed transaction() block leaves no trace."""
+    before = seeded.get_all_transactions()
+    with pytest.raises(RuntimeError):
+        with seeded.transaction():
+            seeded.add_transaction("expense", 10, "Food", "Rolled back", "2024-03-01")
+            seeded.delete_transaction(1)
+            seeded.set_budget("Food", 100)
+            raise RuntimeError("abort")
+    assert seeded.get_all_transactions() == before
+    assert seeded.get_budget("Food") is None
+    assert seeded.get_total_by_type("income") == 3000.0
+
+
+def test_content_hashes(seeded):
+    """Test duplicate detection sees only stored rows up to max_id."""
+    groceries = content_hash("2024-01-10", "expense", 12050, "Groceries at the market")
+    rent = content_hash("2024-02-01", "expense", 80000, "Monthly rent")
+    assert seeded.get_max_transaction_id() == 6
+    assert seeded.find_content_hashes([groceries, rent, 1]) == {groceries, rent}
+    assert seeded.find_content_hashes([groceries, rent], max_id=3) == {groceries}
+
+
+def test_expense_manager_over_memory():
+    """Test ExpenseManager runs on the in-memory backend."""
+    manager = ExpenseManager("memory://")
+    manager.add_expense(25, "Food", "Lunch")
+    manager.add_income(100, "Gift")
+    assert manager.calculate_balance() == 75
+    assert manager.get_expenses_by_category_summary() == {"Food": 25.0}
+    assert manager.get_snapshot()["balance"] == 75
+
+
+def test_log_survives_reopen(tmp_path):
+    """Test the log replays committed changes and ignores a torn last line."""
+    path = tmp_path / "expenses.log"
+    log = LogStorage(path)
+    log.add_transactions_bulk(ROWS)
+    log.delete_transaction(2)
+    log.set_budget("Food", 300)
+    with pytest.raises(RuntimeError):
+        with log.transaction():
+            log.add_transaction("expense", 1, "Food", "Never committed", "2024-03-01")
+            raise RuntimeError("abort")
+    expected = log.get_all_transactions()
+    log.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('[["add",99,"2024-0')
+
+    reopened = LogStorage(path)
+    assert reopened.get_all_transactions() == expected
+    assert reopened.get_budget("Food") == 300.0
+    assert reopened.compact() is True
+    reopened.close()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+    assert LogStorage(path, profile="readonly").get_all_transactions() == expected
+
+
+def test_log_commits_after_torn_line_survive(tmp_path):
+    """Test commits made after reopening a torn log are replayed."""
+    path = tmp_path / "expenses.log"
+    log = LogStorage(path)
+    log.add_transaction("expense", 10, "Food", "Lunch", "2024-03-01")
+    log.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('[["add",99,"2024-0')
+
+    log = LogStorage(path)
+    log.add_transaction("expense", 20, "Food", "Dinner", "2024-03-01")
+    log.add_transaction("expense", 30, "Transport", "Taxi", "2024-03-02")
+    log.close()
+
+    reopened = LogStorage(path)
+    assert ids(reopened.get_all_transactions()) == [3, 2, 1]
+    reopened.close()
+
+
+def test_log_refuses_corrupt_middle_line(tmp_path):
+    """Test a malformed complete line raises instead of discarding later commits."""
+    path = tmp_path / "expenses.log"
+    log = LogStorage(path)
+    for amount in (10, 20, 30):
+        log.add_transaction("expense", amount, "Food", "Meal", "2024-03-01")
+    log.close()
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    corrupted = "garbage\n" + "".join(lines[1:])
+    path.write_text(corrupted, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        LogStorage(path)
+    assert path.read_text(encoding="utf-8") == corrupted
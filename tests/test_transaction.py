@@ -0,0 +1,32 @@
+"""Test transaction models."""
+
+from src.transaction import Transaction, TransactionBatch, TransactionRecord
+
+
+ROWS = [
+    (3, "2024-02-01", "expense", 12.5, "Food", "Lunch"),
+    (2, "2024-01-15", "income", 3000.0, "Salary/Income", "Salary"),
+    (1, "2024-01-01", "expense", 7.25, "Food", "Lunch"),
+]
+
+
+def test_record_matches_transaction():
+    """Test TransactionRecord mirrors Transaction fields."""
+    record = TransactionRecord.from_tuple(ROWS[0])
+    transaction = Transaction.from_tuple(ROWS[0])
+
+    assert record.to_dict() == transaction.to_dict()
+    assert record.amount_cents == 1250
+    assert not hasattr(record, "__dict__")
+
+
+def test_batch_round_trip():
+    """Test TransactionBatch stores columns and yields equivalent rows."""
+    batch = TransactionBatch.from_rows(ROWS)
+
+    assert len(batch) == 3
+    assert batch.categories == ["Food", "Salary/Income"]
+    assert list(batch.category_codes) == [0, 1, 0]
+    assert [r.to_dict() for r in batch] == [Transaction.from_tuple(r).to_dict() for r in ROWS]
+    assert batch.total("expense") == 19.75
+    assert batch.descriptions[0] is batch.descriptions[2]
@@ -0,0 +1,68 @@
+"""Test paginated list window."""
+
+import os
+
+import pytest
+
+from src.database import TransactionQuery
+from src.expense_manager import ExpenseManager
+from src.transaction import Transaction
+from src.virtual_list import PageWindow
+
+
+@pytest.fixture
+def manager():
+    """Create a manager with 25 expenses on distinct days."""
+    em = ExpenseManager("test_expenses.db")
+    em.add_many(
+        ("expense", day, "Food", f"Meal {day}", f"2024-01-{day:02d}") for day in range(1, 26)
+    )
+    yield em
+    em.close()
+    if os.path.exists("test_expenses.db"):
+        os.remove("test_expenses.db")
+
+
+def load_all(em, window):
+    """Scroll a window to the end, collecting every row seen."""
+    seen = []
+    while (query := window.next_query()) is not None:
+        rows = em.find_transactions(query)
+        seen.extend(rows)
+        window.extend(rows)
+    return seen
+
+
+def test_window_pages_and_drops(manager):
+    """Test forward and backward paging keep at most max_rows rows."""
+    window = PageWindow(TransactionQuery(), page_size=5, max_rows=10)
+    seen = load_all(manager, window)
+
+    assert [t.date for t in seen] == [f"2024-01-{day:02d}" for day in range(25, 0, -1)]
+    assert [t.date for t in window.rows] == [f"2024-01-{day:02d}" for day in range(10, 0, -1)]
+    assert not window.at_start
+
+    window.prepend(manager.find_transactions(window.previous_query()))
+    assert [t.date for t in window.rows] == [f"2024-01-{day:02d}" for day in range(15, 5, -1)]
+    assert not window.at_end
+
+
+def test_offset_mode_for_rank_order(manager):
+    """Test text relevance order falls back to LIMIT/OFFSET paging."""
+    window = PageWindow(TransactionQuery().matching("meal").sorted_by("rank"), page_size=10)
+    assert not window.keyset
+    assert len(load_all(manager, window)) == 25
+
+
+def test_incremental_insert_and_remove(manager):
+    """Test single rows are placed by sort key and filtered by the query."""
+    window = PageWindow(TransactionQuery().of_type("expense"), page_size=5, max_rows=10)
+    window.extend(manager.find_transactions(window.next_query()))
+
+    new = Transaction("expense", 9, "Food", "Brunch", "2024-01-23", 100)
+    assert window.insert(new) == 2
+    assert window.insert(Transaction("income", 9, "Salary/Income", "Pay", "2024-01-23", 101)) is None
+    assert window.insert(Transaction("expense", 9, "Food", "Old", "2023-12-01", 102)) is None
+
+    assert window.remove(100) == 2
+    assert window.remove(100) is None
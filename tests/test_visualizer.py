@@ -0,0 +1,88 @@
+"""Test visualizer module."""
+
+import pytest
+import os
+from src.expense_manager import ExpenseManager
+from src.visualizer import Visualizer
+
+
+@pytest.fixture
+def visualizer():
+    """Create test visualizer."""
+    em = ExpenseManager("test_expenses.db")
+    yield Visualizer(em), em
+    em.close()
+    if os.path.exists("test_expenses.db"):
+        os.remove("test_expenses.db")
+
+
+def test_chart_data(visualizer):
+    """Test the shared chart data matches the individual queries."""
+    viz, em = visualizer
+    em.db.add_transaction("income", 1000, "Salary/Income", "Pay", "2024-01-01")
+    em.db.add_transaction("expense", 250.5, "Food", "Groceries", "2024-01-03")
+    em.db.add_transaction("expense", 100, "Rent", "Rent", "2024-02-01")
+    em.set_budget("Food", 300)
+
+    data = viz.chart_data()
+    assert data["expenses_by_category"] == em.get_expenses_by_category_summary()
+    assert data["income_vs_expenses"] == em.get_monthly_summary()
+    assert data["budget_status"] == em.check_budget_status()
+    assert data["spending_trend"] == (
+        ["2024-01-01", "2024-01-03", "2024-02-01"], [1000, 749.5, 649.5]
+    )
+
+
+def test_generate_all_charts(visualizer, tmp_path):
+    """Test every chart is rendered and timed."""
+    pytest.importorskip("matplotlib")
+    viz, em = visualizer
+    em.db.add_transaction("income", 1000, "Salary/Income", "Pay", "2024-01-01")
+    em.db.add_transaction("expense", 250, "Food", "Groceries", "2024-01-03")
+    em.set_budget("Food", 300)
+
+    viz.chart_cache.directory = tmp_path / "cache"
+
+    timings = viz.generate_all_charts(str(tmp_path), workers=1)
+    assert set(timings) == {"expenses_by_category", "income_vs_expenses",
+                            "spending_trend", "budget_status"}
+    assert all((tmp_path / name).exists() for name in (
+        "expenses_by_category.png", "income_vs_expenses.png",
+        "spending_trend.png", "budget_status.png"))
+
+    assert all(seconds == 0 for seconds in viz.generate_all_charts(str(tmp_path)).values())
+    em.add_expense(50, "Food", "Snacks")
+    timings = viz.generate_all_charts(str(tmp_path), workers=1)
+    assert timings["budget_status"] > 0
+
+
+def test_balance_trend_is_daily_and_downsampled(visualizer):
+    """Test the trend nets each day and keeps extremes within the point budget."""
+    viz, em = visualizer
+    em.db.add_transaction("income", 100, "Salary/Income", "Pay", "2024-01-01")
+    em.db.add_transaction("expense", 30, "Food", "Lunch", "2024-01-01")
+    em.db.add_transaction("expense", 20, "Food", "Dinner", "2024-01-02")
+    assert viz.balance_trend() == (["2024-01-01", "2024-01-02"], [70, 50])
+
+    rows = [("expense", 1, "Food", "Snack", f"2024-{m:02d}-{d:02d}")
+            for m in range(2, 13) for d in range(1, 29)]
+    rows.append(("expense", 500, "Rent", "Rent", "2024-06-15"))
+    em.add_many(rows)
+    viz.trend_points = 20
+
+    dates, balances = viz.balance_trend()
+    assert len(dates) <= 20
+    assert dates == sorted(dates)
+    assert dates[0] == "2024-01-01" and dates[-1] == "2024-12-28"
+    assert min(balances) == -758
+
+
+def test_downsample_minmax():
+    """Test buckets keep their minimum and maximum, in order."""
+    from src.visualizer import downsample_minmax
+
+    values = [0, 5, -3, 2, 9, 1, 4, -8, 3, 6]
+    assert downsample_minmax(values, 20) == list(range(10))
+    keep = downsample_minmax(values, 6)
+    assert keep == sorted(keep)
+    assert {0, 9, 4, 7} <= set(keep) and len(keep) <= 6